@@ -16,8 +16,11 @@ def override_config(**overrides):
     from tml.config import CONFIG
     before_dict = {key: CONFIG[key] for key in overrides}
     CONFIG.override_config(**overrides)
-    yield
-    CONFIG.override_config(**before_dict)
+    try:
+        yield
+    finally:   # override merges into copy, so original values are intact
+        for key, value in before_dict.items():
+            CONFIG[key] = value
 
 
 class FakeLanguage(object):
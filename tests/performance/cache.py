@@ -0,0 +1,52 @@
+# encoding: UTF-8
+""" Cache round trips: one key at a time vs fetch_many / store_many """
+from __future__ import absolute_import, print_function
+from tml.config import CONFIG
+from .common import measure, report
+from .standin import Server, build_adapter
+
+
+SOURCES = 20
+WARMUP_KEYS = 1000
+
+
+def main():
+    CONFIG.cache['memory'] = False   # measure adapter round trips only
+    server = Server().start()
+    cache = build_adapter(server)
+    keys = ['ru/sources/page_%d' % i for i in range(SOURCES)]
+    for key in keys:
+        cache.store(key, {'results': dict(('key_%d' % i, [{'label': 'Перевод %d' % i}]) for i in range(50))})
+
+    def one_by_one():
+        for key in keys:
+            cache.fetch(key)
+
+    def bulk():
+        cache.fetch_many(keys)
+
+    for title, fn in (('fetch x %d' % SOURCES, one_by_one), ('fetch_many(%d)' % SOURCES, bulk)):
+        server.round_trips = 0
+        fn()
+        print('%-40s %d round trips' % (title, server.round_trips))
+    report('fetch %d sources' % SOURCES, measure(one_by_one, 200), measure(bulk, 200))
+
+    payload = dict(('key_%d' % i, [{'label': 'Перевод %d' % i}]) for i in range(50))
+    mapping = dict(('ru/sources/warmup_%d' % i, payload) for i in range(WARMUP_KEYS))
+
+    def store_one_by_one():
+        for key, data in mapping.items():
+            cache.store(key, data)
+
+    baseline = measure(store_one_by_one, 5)
+    optimized = measure(lambda: cache.store_many(mapping), 5)
+    report('store %d keys' % WARMUP_KEYS, baseline, optimized)
+    stats = cache.store_many(mapping)
+    print('%-40s %.0f keys/s, %.1f MB/s' % (
+        'store_many: %(keys)s keys in %(batches)s batches' % stats,
+        stats['keys'] / optimized, stats['bytes'] / 1048576.0 / optimized))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,36 @@
+# encoding: UTF-8
+""" Cache payload codecs: size and encode/decode time on bundled release fixtures """
+from __future__ import absolute_import, print_function
+import json
+from glob import glob
+from tml.utils import pj
+from tml.cache_adapters.codecs import get_codec, decode, CODECS
+from tests.common import FIXTURES_PATH
+from .common import measure
+
+
+def payloads():
+    release = pj(FIXTURES_PATH, '20160307120415')
+    paths = glob(pj(release, '*.json')) + glob(pj(release, '*', '*.json')) + glob(pj(release, '*', 'sources', '*.json'))
+    ret = []
+    for path in sorted(paths):
+        with open(path, 'rb') as fp:
+            ret.append(json.loads(fp.read().decode('utf-8')))
+    return ret
+
+
+def main():
+    data = payloads()
+    print('%d payloads' % len(data))
+    print('%-15s %12s %12s %12s' % ('codec', 'bytes', 'encode', 'decode'))
+    for name in sorted(CODECS):
+        codec = get_codec(name)
+        encoded = [codec.encode(item) for item in data]
+        encode_time = measure(lambda: [codec.encode(item) for item in data], 50)
+        decode_time = measure(lambda: [decode(payload) for payload in encoded], 50)
+        print('%-15s %12d %10.0fus %10.0fus' % (
+            name, sum(len(payload) for payload in encoded), encode_time * 1e6, decode_time * 1e6))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,40 @@
+# encoding: UTF-8
+""" Helpers for performance checks (run as python -m tests.performance.<name>) """
+from __future__ import absolute_import, print_function
+from time import time
+from six.moves import range
+
+
+class Timer(object):
+    """ Timer """
+    def __init__(self):
+        self.start = time()
+        self.times = 1
+
+    def finish(self):
+        self.stop = time()
+        return self
+
+    @property
+    def time(self):
+        return self.stop - self.start
+
+    def call(self, fn, times):
+        self.times = times
+        for i in range(times):
+            fn()
+        return self.finish()
+
+    def per_action(self):
+        return self.time / self.times
+
+
+def measure(fn, times=1000):
+    """ Seconds per fn call """
+    return Timer().call(fn, times).per_action()
+
+
+def report(title, baseline, optimized):
+    """ Print baseline vs optimized timings """
+    print('%-40s %10.2fus %10.2fus  x%.1f' % (
+        title, baseline * 1e6, optimized * 1e6, baseline / optimized))
@@ -0,0 +1,41 @@
+# encoding: UTF-8
+""" Token name -> context resolution on bundled language definitions """
+from __future__ import absolute_import, print_function
+from glob import glob
+from tml.utils import pj, read_json, APP_DIR
+from tml.rules.contexts import Contexts, ContextNotFound
+from .common import measure, report
+
+
+TOKEN_NAMES = ('count', 'num2', 'user', 'actor1', 'users', 'items', 'date',
+               'name', 'link', 'apples')
+
+
+def scan(contexts, token):
+    """ Contexts.find_by_token_name as it was """
+    for context in contexts.contexts:
+        if context.applies_to_token(token):
+            return context
+    raise ContextNotFound(token, contexts)
+
+
+def resolve(find, contexts):
+    for token in TOKEN_NAMES:
+        try:
+            find(contexts, token)
+        except ContextNotFound:
+            pass
+
+
+def main():
+    print('%-40s %12s %12s' % ('', 'scan', 'memo'))
+    for path in sorted(glob(pj(APP_DIR, 'defaults', 'languages', '*.json'))):
+        language = read_json(path)
+        contexts = Contexts.from_dict(language['contexts'])
+        report('%s: %d contexts' % (language['locale'], len(contexts.contexts)),
+               measure(lambda: resolve(scan, contexts)) / len(TOKEN_NAMES),
+               measure(lambda: resolve(Contexts.find_by_token_name, contexts)) / len(TOKEN_NAMES))
+
+
+if __name__ == '__main__':
+    main()
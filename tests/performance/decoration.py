@@ -0,0 +1,26 @@
+# encoding: UTF-8
+""" Decoration parser: plain text fast path, cached and uncached trees """
+from __future__ import absolute_import, print_function
+from tml.decoration.parser import parse, render, parsed_templates
+from .common import measure
+
+
+PLAIN = 'You have got a new message from your friend, check your inbox please'
+DECORATED = '[link]You have got[/link] a [bold: new message] from your friend, [i]check your inbox[/i] please'
+DATA = {'link': {'href': 'http://site.com/inbox'}}
+
+
+def main():
+    print('%-40s %12s' % ('', 'per call'))
+    rows = (
+        ('plain, parsed (as it was)', lambda: parse(PLAIN).render(DATA)),
+        ('plain, fast path', lambda: render(PLAIN, DATA)),
+        ('decorated, uncached', lambda: parse(DECORATED).render(DATA)),
+        ('decorated, cached', lambda: render(DECORATED, DATA)))
+    for title, fn in rows:
+        print('%-40s %10.2fus' % (title, measure(fn) * 1e6))
+    print('cache: %s' % parsed_templates.stats)
+
+
+if __name__ == '__main__':
+    main()
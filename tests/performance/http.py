@@ -0,0 +1,50 @@
+# encoding: UTF-8
+""" CDN/API calls: new connection per request vs pooled keep-alive session """
+from __future__ import absolute_import, print_function
+import json
+import socket
+import threading
+import requests
+from six.moves import BaseHTTPServer, socketserver
+from tml.api.client import get_session
+from .common import measure, report
+
+BODY = json.dumps({'version': '20160307120415'}).encode('utf-8')
+
+
+class Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'   # keep-alive
+
+    def setup(self):
+        BaseHTTPServer.BaseHTTPRequestHandler.setup(self)
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+    def do_GET(self):
+        self.send_response(200)
+        self.send_header('content-type', 'application/json')
+        self.send_header('content-length', str(len(BODY)))
+        self.end_headers()
+        self.wfile.write(BODY)
+
+    def log_message(self, *args):
+        pass
+
+
+class Server(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+def main():
+    server = Server(('127.0.0.1', 0), Handler)
+    thread = threading.Thread(target=server.serve_forever)
+    thread.daemon = True
+    thread.start()
+    url = 'http://%s:%s/version.json' % server.server_address
+    session = get_session()
+    report('GET version.json', measure(lambda: requests.request('get', url, timeout=30), 300),
+           measure(lambda: session.request('get', url, timeout=(5, 30)), 300))
+    server.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+# encoding: UTF-8
+""" Compiled rules vs rules interpreter on bundled language definitions """
+from __future__ import absolute_import, print_function
+from glob import glob
+from tml.utils import pj, read_json, APP_DIR
+from tml.rules import ContextRules
+from tml.rules.case import Case
+from .common import measure, report
+
+
+CONTEXT_DATA = {
+    'number': [{'n': n} for n in (0, 1, 2, 5, 11, 21, 22, 101, 1000)],
+    'gender': [{'gender': gender} for gender in ('male', 'female', 'other')]}
+CASE_DATA = [{'value': value, 'gender': gender} for value, gender in (
+    ('1', 'other'), ('2', 'other'), ('11', 'other'), ('Mike', 'male'), ('Anna', 'female'))]
+
+
+def interpret(rules, data):
+    """ ContextRules.apply as it was """
+    for conditions, operations in rules.choices:
+        if rules.engine.execute(conditions, data):
+            return rules.engine.execute(operations, data)
+    return rules.engine.execute(rules.default, data)
+
+
+def check(title, rules, samples):
+    def interpreted():
+        for data in samples:
+            interpret(rules, data)
+
+    def compiled():
+        for data in samples:
+            rules.apply(data)
+    for data in samples:
+        assert interpret(rules, data) == rules.apply(data)
+    report(title, measure(interpreted) / len(samples), measure(compiled) / len(samples))
+
+
+def main():
+    print('%-40s %12s %12s' % ('', 'interpreter', 'compiled'))
+    for path in sorted(glob(pj(APP_DIR, 'defaults', 'languages', '*.json'))):
+        language = read_json(path)
+        locale = language['locale']
+        for key, samples in CONTEXT_DATA.items():
+            context = language['contexts'].get(key, None)
+            if not context:
+                continue
+            rules = ContextRules.from_rules(context['rules'], context['default_key'])
+            check('%s: context %s' % (locale, key), rules, samples)
+        for key in sorted(language['cases']):
+            try:
+                case = Case.from_rules(language['cases'][key]['rules'])
+                [interpret(case, data) for data in CASE_DATA]
+            except Exception:   # case is not applicable for samples
+                continue
+            check('%s: case %s' % (locale, key), case, CASE_DATA)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,52 @@
+# encoding: UTF-8
+""" Snapshot lookups on snapshot.tar.gz: cold (reopen) vs warm handle vs cache vs indexed """
+from __future__ import absolute_import, print_function
+import os
+import re
+import shutil
+import tempfile
+from tml.api.snapshot import SnapshotFile, SnapshotDir, IndexedSnapshot, REWRITE_RULES, convert_snapshot
+from tests.common import FIXTURES_PATH
+from .common import measure, report
+
+KEYS = ('application', 'ru/language', 'ru/sources/yyyy', 'id/sources/alpha')
+URLS = ('projects/current/definition', 'languages/ru/definition', 'ru/sources/yyyy')
+
+
+def fetch_all(client):
+    for key in KEYS:
+        client.cached_fetch(key)
+
+
+def rewrite_path(url):
+    """ SnapshotDir.rewrite_path as it was: regex compiled per call """
+    for pattern, replacer in REWRITE_RULES:
+        if pattern == url:
+            return replacer
+        match_obj = re.compile(pattern).match(url)
+        if match_obj:
+            return replacer % dict((str(idx), v) for idx, v in enumerate(match_obj.groups()))
+    return url
+
+
+def main():
+    tar_path = os.path.join(FIXTURES_PATH, 'snapshot.tar.gz')
+    tmp_dir = tempfile.mkdtemp()
+    try:
+        report('rewrite_path', measure(lambda: [rewrite_path(url) for url in URLS], 10000) / len(URLS),
+               measure(lambda: [SnapshotDir.rewrite_path(url) for url in URLS], 10000) / len(URLS))
+        cold = measure(lambda: fetch_all(SnapshotFile(tar_path)), 20) / len(KEYS)
+        warm_client = SnapshotFile(tar_path)
+        report('tar fetch: cold vs warm handle', cold, measure(lambda: fetch_all(warm_client), 20) / len(KEYS))
+        cached_client = SnapshotFile(tar_path, cache_size=100)
+        report('tar fetch: cold vs warm cache', cold, measure(lambda: fetch_all(cached_client), 1000) / len(KEYS))
+        indexed = IndexedSnapshot(convert_snapshot(tar_path, os.path.join(tmp_dir, 'release.snapshot')))
+        report('tar fetch: cold vs indexed', cold, measure(lambda: fetch_all(indexed), 200) / len(KEYS))
+        for client in (warm_client, cached_client, indexed):
+            client.close()
+    finally:
+        shutil.rmtree(tmp_dir)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,111 @@
+# encoding: UTF-8
+""" Local memcached stand-in (text protocol subset) for cache benchmarks """
+from __future__ import absolute_import
+import socket
+import threading
+from six.moves import socketserver
+from tml.cache import CachedClient
+from tml.cache_adapters.memcached import BaseMemcachedAdapter
+
+
+class Handler(socketserver.StreamRequestHandler):
+    """ get <key>*, set <key> <flags> <exptime> <bytes> """
+    def handle(self):
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        server = self.server
+        while True:
+            line = self.rfile.readline()
+            if not line:
+                return
+            parts = line.split()
+            server.round_trips += 1
+            if parts[0] == b'get':
+                out = []
+                for key in parts[1:]:
+                    if key in server.data:
+                        value = server.data[key]
+                        out.append(b'VALUE ' + key + b' 0 ' + str(len(value)).encode() + b'\r\n' + value + b'\r\n')
+                out.append(b'END\r\n')
+                self.wfile.write(b''.join(out))
+            elif parts[0] == b'set':
+                value = self.rfile.read(int(parts[4]) + 2)[:-2]
+                server.data[parts[1]] = value
+                if parts[-1] != b'noreply':
+                    self.wfile.write(b'STORED\r\n')
+
+
+class Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self):
+        socketserver.ThreadingTCPServer.__init__(self, ('127.0.0.1', 0), Handler)
+        self.data = {}
+        self.round_trips = 0
+
+    def start(self):
+        thread = threading.Thread(target=self.serve_forever)
+        thread.daemon = True
+        thread.start()
+        return self
+
+    @property
+    def address(self):
+        return '%s:%s' % self.server_address
+
+
+class Client(object):
+    """ Minimal memcache client: one connection, no pipelining """
+    def __init__(self, servers):
+        host, port = servers[0].split(':')
+        self.socket = socket.create_connection((host, int(port)))
+        self.socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        self.file = self.socket.makefile('rb')
+
+    def get_multi(self, keys):
+        self.socket.sendall(b'get ' + b' '.join(key.encode('utf-8') for key in keys) + b'\r\n')
+        ret = {}
+        while True:
+            line = self.file.readline()
+            if line.startswith(b'END'):
+                return ret
+            _, key, _, size = line.split()
+            ret[key.decode('utf-8')] = self.file.read(int(size) + 2)[:-2]
+
+    def get(self, key):
+        return self.get_multi([key]).get(key, None)
+
+    def set(self, key, value, timeout=0):
+        return self.set_multi({key: value}, timeout)
+
+    def set_multi(self, mapping, timeout=0):
+        """ All commands are sent at once (pipelined) """
+        commands = []
+        for key, value in mapping.items():
+            commands.append(b'set ' + key.encode('utf-8') + b' 0 ' + str(timeout).encode() + b' ' +
+                            str(len(value)).encode() + b'\r\n' + value + b'\r\n')
+        self.socket.sendall(b''.join(commands))
+        for _ in commands:
+            self.file.readline()
+        return True
+
+
+class StandInMemcachedAdapter(object):
+
+    def __init__(self, server, codec=None):
+        BaseMemcachedAdapter.__init__(self, server, {'namespace': 'tml', 'timeout': None, 'codec': codec}, None)
+
+    @property
+    def _cache(self):
+        if self._client is None:
+            self._client = Client(self._servers)
+        return self._client
+
+
+def build_adapter(server, codec=None):
+    """ Adapter built the way CachedClient.load_adapter builds factories """
+    def build_cache(klass, *bases):
+        return type(klass.__name__, bases + (CachedClient,), dict(klass.__dict__))
+    adapter = build_cache(StandInMemcachedAdapter, BaseMemcachedAdapter)(server.address, codec)
+    adapter.version.version = 'bench'
+    return adapter
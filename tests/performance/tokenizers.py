@@ -0,0 +1,40 @@
+# encoding: UTF-8
+""" Single pass substitution vs label.replace() per token """
+from __future__ import absolute_import, print_function
+from tests.mock import Client
+from tml.application import Application
+from tml.tokenizers import DataTokenizer
+from .common import measure, report
+
+
+def replace_substitute(tokenizer, language):
+    """ Substitution as it was: replace each token over whole label """
+    label = tokenizer.text
+    for token in tokenizer.tokens:
+        label = token.substitute(label, tokenizer.context, language, {})
+    return label
+
+
+def build_label(tokens_count, words_count=5):
+    text = ' '.join(['lorem'] * words_count)
+    words = ['%s {t%d}' % (text, i) for i in range(tokens_count)]
+    return ', '.join(words), dict(('t%d' % i, 'value %d' % i) for i in range(tokens_count))
+
+
+def main():
+    client = Client.read_all()
+    app = Application.load_default(client)
+    en = app.language('en')
+    print('%-40s %12s %12s' % ('', 'replace', 'single pass'))
+    for words_count in (5, 100):
+        for tokens_count in (5, 10, 20):
+            label, data = build_label(tokens_count, words_count)
+            tokenizer = DataTokenizer(label, data)
+            assert replace_substitute(tokenizer, en) == tokenizer.substitute(en)
+            report('%d tokens, %d chars' % (tokens_count, len(label)),
+                   measure(lambda: replace_substitute(tokenizer, en)),
+                   measure(lambda: tokenizer.substitute(en)))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,71 @@
+# encoding: UTF-8
+""" Option selection for gender x number translations """
+from __future__ import absolute_import, print_function
+from tests.mock import Client, DummyUser
+from tml.application import Application
+from tml.translation import Key, Translation, OptionIsNotSupported,\
+    OptionIsNotFound
+from tml.exceptions import RequiredArgumentIsNotPassed
+from .common import measure, report
+
+
+GENDERS = ('male', 'female', 'other')
+NUMBERS = ('one', 'few', 'many', 'other')
+
+
+def fetch_option(translation, data, options):
+    """ Translation.fetch_option as it was: check options one by one """
+    for option in translation.options:
+        try:
+            return option.check(data, options)
+        except OptionIsNotSupported:
+            pass
+        except RequiredArgumentIsNotPassed:
+            pass
+    raise OptionIsNotFound(translation.key)
+
+
+def build_translation(language, genders, numbers):
+    label = '{user} has {count} messages'
+    options = [{'label': '%s %s' % (gender, number),
+                'context': {'user': {'gender': gender}, 'count': {'number': number}}}
+               for gender in genders for number in numbers]
+    return Translation.from_data(Key(language, label), options)
+
+
+def main():
+    language = Application.load_default(Client.read_all()).language('ru')
+    samples = [{'user': DummyUser('Anna', gender), 'count': count}
+               for gender in GENDERS for count in (1, 3, 5, 21)]
+    print('%-40s %12s %12s' % ('', 'check', 'indexed'))
+    for genders, numbers in ((GENDERS[:2], NUMBERS[:2]), (GENDERS, NUMBERS)):
+        translation = build_translation(language, genders, numbers)
+
+        def baseline():
+            for data in samples:
+                try:
+                    fetch_option(translation, data, {})
+                except OptionIsNotFound:
+                    pass
+
+        def indexed():
+            for data in samples:
+                try:
+                    translation.fetch_option(data, {})
+                except OptionIsNotFound:
+                    pass
+        for data in samples:
+            try:
+                expected = fetch_option(translation, data, {})
+            except OptionIsNotFound:
+                expected = None
+            try:
+                assert expected is translation.fetch_option(data, {})
+            except OptionIsNotFound:
+                assert expected is None
+        report('%d options' % len(translation), measure(baseline) / len(samples),
+               measure(indexed) / len(samples))
+
+
+if __name__ == '__main__':
+    main()
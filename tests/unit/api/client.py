@@ -97,6 +97,17 @@ class TranslatorMock(object):
 class ClientTest(unittest.TestCase):
     """ Test client """
 
+    def setUp(self):
+        self.get_session = client.get_session
+
+    def tearDown(self):
+        client.get_session = self.get_session
+
+    def mock_http(self, http):
+        """ Replace pooled session with mock """
+        self.http = http
+        client.get_session = lambda: http
+
     def diff_(self, params):
         generic_params = set(('app_id', 'access_token', 'key'))
         incoming_params = set(params.keys())
@@ -110,20 +121,20 @@ class ClientTest(unittest.TestCase):
         """ Test success response """
         # mock http response:
         expected = {'result':'OK'}
-        client.requests = RequestMock(RequestMockResponse(expected))
+        self.mock_http(RequestMock(RequestMockResponse(expected)))
         c = client.Client('qwerty', '123124512412')
         # execute request:
         resp = c.get('test', params={'param':'value'}, opts={'response_class': RequestMockResponse, 'uncompressed': True})
         self.assertEquals(expected, resp, 'Return response')
         # check url and query building:
-        self.assertEquals(CONFIG.api_host() + '/v1/test', client.requests.url, 'Call URL')
-        self.assertTrue(self.check_in_(client.requests.params, 'param'), 'Token sent as GET parameter')
+        self.assertEquals(CONFIG.api_host() + '/v1/test', self.http.url, 'Call URL')
+        self.assertTrue(self.check_in_(self.http.params, 'param'), 'Token sent as GET parameter')
         # check call with no params:
         resp = c.get('test')
-        self.assertTrue(len(self.diff_(client.requests.params)) == 0)
+        self.assertTrue(len(self.diff_(self.http.params)) == 0)
         # check string response:
         expected = 'Hello world'
-        client.requests = RequestMock(RequestMockResponse(expected))
+        self.mock_http(RequestMock(RequestMockResponse(expected)))
         resp = c.get('test', params={'param':'value'}, opts={'response_class': RequestMockResponse, 'uncompressed': True})
         self.assertEquals(expected, resp, 'Return response')
 
@@ -131,7 +142,7 @@ class ClientTest(unittest.TestCase):
     def test_network_error(self):
         """ Check network error case """
         error = Exception('My error')
-        client.requests = RequestFault(error)
+        self.mock_http(RequestFault(error))
         c = client.Client('qwerty', '123')
         with self.assertRaises(Exception) as context:
             c.get('test', params={'param':'value'})
@@ -141,12 +152,35 @@ class ClientTest(unittest.TestCase):
     def test_api_error(self):
         """ Test error from API """
         expected = {'error':'Error message'}
-        client.requests = RequestMock(RequestMockResponse(expected))
+        self.mock_http(RequestMock(RequestMockResponse(expected)))
         c = client.Client('qwerty', '123')
         with self.assertRaises(client.APIError) as context:
             c.get('test', params={'param':'value'}, opts={'response_class': RequestMockResponse, 'uncompressed': True})
         self.assertEquals('Error message', context.exception.error, 'Check API error')
 
 
+class SessionTest(unittest.TestCase):
+    """ Pooled HTTP session """
+    def tearDown(self):
+        client.reset_sessions()
+
+    def test_session(self):
+        client.reset_sessions()
+        with patch.dict(CONFIG.application, {'pool_size': 3, 'keep_alive': False, 'user_agent': 'test'}):
+            session = client.get_session()
+        self.assertTrue(session is client.get_session(), 'reused')
+        self.assertEquals(3, session.get_adapter('https://api.translationexchange.com')._pool_maxsize)
+        self.assertEquals('close', session.headers['connection'])
+        self.assertEquals('test', session.headers['user-agent'])
+        with patch('os.getpid', lambda: -1):
+            self.assertFalse(session is client.get_session(), 'new session in forked process')
+        self.assertEquals((5, 30), client.Client('key')._request_config('get', {})['timeout'])
+
+    def test_user_agent(self):
+        import tml
+        session = client.build_session()
+        self.assertEquals('tml-python v%s' % tml.__VERSION__, session.headers['user-agent'], 'package version')
+
+
 if __name__=='__main__':
     unittest.main()
@@ -1,9 +1,12 @@
 # encoding: UTF-8
 from __future__ import absolute_import
 from tml.api.snapshot import SnapshotFile, SnapshotDir, MethodIsNotSupported,\
-    open_snapshot
+    open_snapshot, IndexedSnapshot, convert_snapshot
 from tests.mock import FIXTURES_PATH
 import unittest
+import shutil
+import tempfile
+from os.path import join
 from tml.application import Application
 from tml.language import Language
 from tml.api.client import APIError
@@ -33,6 +36,36 @@ class SnapshotTest(unittest.TestCase):
         with self.assertRaises(Error):
             open_snapshot('%s/notexists_path' % FIXTURES_PATH)
 
+    def test_open_once(self):
+        client = open_snapshot('%s/snapshot.tar.gz' % FIXTURES_PATH, cache_size=2)
+        self.check_load(client)
+        tar = client.file
+        self.assertTrue('ru/language.json' in client.members, 'member index')
+        language = client.get('languages/ru/definition')
+        self.assertTrue(tar is client.file, 'tar is opened once')
+        self.assertTrue(language is client.get('languages/ru/definition'), 'decoded result is cached')
+        self.assertEqual(2, len(client.cache), 'cache is bounded')
+        client.close()
+
+    def test_indexed(self):
+        tmp_dir = tempfile.mkdtemp()
+        try:
+            path = convert_snapshot('%s/snapshot.tar.gz' % FIXTURES_PATH, join(tmp_dir, 'release.snapshot'))
+            client = open_snapshot(path)
+            self.assertEqual(IndexedSnapshot, client.__class__, 'Open indexed snapshot')
+            self.assertEqual('json', client.index['application'][2])
+            self.check_load(client)
+            client.close()
+            shutil.copytree('%s/snapshot' % FIXTURES_PATH, join(tmp_dir, 'snapshot'))
+            path = convert_snapshot(join(tmp_dir, 'snapshot'), codec='zlib')
+            self.assertEqual(join(tmp_dir, 'snapshot.snapshot'), path, 'default target')
+            client = open_snapshot(path)
+            self.assertEqual(sorted(SnapshotDir('%s/snapshot' % FIXTURES_PATH).fetch('ru/language')),
+                             sorted(client.fetch('ru/language')), 'compressed payload')
+            client.close()
+        finally:
+            shutil.rmtree(tmp_dir)
+
     def check_load(self, client):
         app = Application.load_default(client)
         self.assertEquals(767, app.id, 'Load application')
@@ -6,6 +6,10 @@ from tml.language import Language
 from tml.source import SourceTranslations
 from tml.dictionary.source import SourceDictionary
 from tests.mock import Client
+from tests.common import override_config
+from tests.unit.cache import DictAdapter
+from tml.api.client import Client as APIClient
+from tml.cache import CachedClient
 
 LANGUAGES = [
     {'id': 233, 'locale':'ru', 'native_name': 'Русский', 'right_to_left': False},
@@ -43,6 +47,49 @@ class ApplicationTest(unittest.TestCase):
         with self.assertRaises(LanguageNotSupported):
             h = app.sources['/home/index'].add_locale('de')
 
+    def test_load_sources(self):
+        app = Application.load_by_key(self.client, 1768, locale='ru,en', source='/home/index')
+        loaded = app.sources['/home/index'].hashtable_by_locale('ru')
+        index, home = app.load_sources(['index', '/home/index'], 'ru')
+        self.assertIsInstance(index, SourceDictionary)
+        self.assertTrue(len(index.translations) > 0, 'translations fetched')
+        self.assertTrue(home is loaded, 'loaded source is reused')
+        self.assertTrue(app.source('index', 'ru') is index)
+
+    def test_expected_sources(self):
+        app = Application.load_by_key(self.client, 1768, locale='ru,en', source='/home/index')
+        app.expect_sources(['index', '/home/index'])
+        index = app.source('index', 'ru')
+        self.assertTrue(len(index.translations) > 0, 'translations fetched')
+        self.assertTrue(app.has_source('/home/index', 'ru'))
+
+    def test_sources_round_trip(self):
+        DictAdapter.data = {}
+        DictAdapter.calls = 0
+        names = ['page/%d' % i for i in range(5)]
+        with override_config(cache={'enabled': True, 'adapter': DictAdapter, 'namespace': 'test', 'memory': False}):
+            client = APIClient('key')
+            cache = client.cache
+            cache.version.set('1')
+            for name in names:
+                cache.store('ru/sources/%s' % name, {'results': {'key_%s' % name: []}})
+            app = Application(client, 100, LANGUAGES, 'en')
+            app.add_language(Language.from_dict(app, LANGUAGES[0]))
+            app.expect_sources(names[1:])
+            DictAdapter.calls = 0
+            source = app.source(names[0], 'ru')
+            self.assertEquals(1, DictAdapter.calls, '5 sources in one read_many')
+            self.assertEquals({'key_page/0': []}, source.translations)
+            self.assertTrue(all(app.has_source(name, 'ru') for name in names))
+            languages = Application(client, 100, LANGUAGES, 'en')
+            for locale in ('ru', 'en'):
+                cache.store(Language.cache_key(locale), dict(LANGUAGES[0 if locale == 'ru' else 1]))
+            DictAdapter.calls = 0
+            languages.load_languages(['ru-RU', 'en'])
+            self.assertEquals(1, DictAdapter.calls, 'selected and fallback language in one read_many')
+            self.assertEquals('ru', languages.language('ru-RU').locale)
+        cache._drop_it()
+
     def test_asset_url(self):
         app = Application.load_by_key(self.client, 1768, locale='ru,en', source='/home/index')
         prefix = app.tools['assets']
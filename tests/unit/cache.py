@@ -0,0 +1,434 @@
+from __future__ import absolute_import
+# encoding: UTF-8
+import unittest
+import os
+import time
+import threading
+from tml.cache import CachedClient, MemoryTier, CacheVersion, VersionPoller, SingleFlight, StaleWhileRevalidate, REVALIDATOR, MISSING
+from tests.common import override_config
+
+
+class DictAdapter(object):
+    """ Remote cache stand-in: counts round trips """
+    data = {}
+    calls = 0
+
+    def fetch(self, key, opts=None):
+        DictAdapter.calls += 1
+        data = self.data.get(self.versioned_key(key, opts), None)
+        if data is None and opts and opts.get('miss_callback', None):
+            data = opts['miss_callback'](key)
+        return data
+
+    def read_many(self, keys, opts=None):
+        DictAdapter.calls += 1
+        found = ((key, self.data.get(self.versioned_key(key, opts), None)) for key in keys)
+        return dict((key, data) for key, data in found if data is not None)
+
+    def store(self, key, data, opts=None):
+        self.data[self.versioned_key(key, opts)] = data
+        return data
+
+    def delete(self, key, opts=None):
+        self.data.pop(self.versioned_key(key, opts), None)
+        return key
+
+    def add_lock(self, key, ttl):
+        lock_key = self.versioned_key(key)
+        if lock_key in self.data:
+            return False
+        self.data[lock_key] = '1'
+        return True
+
+
+class MemoryTierTest(unittest.TestCase):
+    """ L1 memory tier in front of cache adapter """
+    def setUp(self):
+        DictAdapter.data = {}
+        DictAdapter.calls = 0
+
+    def tearDown(self):
+        self.cache._drop_it()
+
+    def build(self, memory=True):
+        with override_config(cache={'enabled': True, 'memory': memory, 'namespace': 'test'}):
+            self.cache = CachedClient.instance(adapter=DictAdapter)
+        self.cache.version.version = '1'
+        return self.cache
+
+    def test_hit(self):
+        cache = self.build({'size': 2, 'ttl': 60})
+        self.assertTrue(isinstance(cache, MemoryTier))
+        self.assertTrue(isinstance(cache, CachedClient))
+        cache.store('ru/language', {'locale': 'ru'})
+        self.assertEquals({'locale': 'ru'}, cache.fetch('ru/language'))
+        self.assertEquals(0, DictAdapter.calls, 'served from memory')
+        self.assertEquals({'miss': 'x'}, cache.fetch('x', opts={'miss_callback': lambda key: {'miss': key}}))
+        self.assertEquals({'miss': 'x'}, cache.fetch('x'))
+        self.assertEquals(1, DictAdapter.calls, 'miss result is remembered')
+        cache.store('y', {})
+        self.assertEquals(1, cache.memory_stats['evictions'], 'bounded by size')
+        cache.delete('y')
+        self.assertFalse(cache.versioned_key('y') in cache.memory)
+
+    def test_version(self):
+        cache = self.build()
+        cache.store('application', {'v': 1})
+        cache.version.version = '2'
+        self.assertEquals(None, cache.fetch('application'), 'new version misses memory')
+        self.assertEquals(1, DictAdapter.calls)
+        cache.version.version = '1'
+        self.assertEquals({'v': 1}, cache.fetch('application'))
+        self.assertEquals(1, DictAdapter.calls)
+
+    def test_ttl(self):
+        cache = self.build()
+        cache.store('a', {'a': 1}, opts={'memory_ttl': 0.01})
+        time.sleep(0.02)
+        self.assertEquals({'a': 1}, cache.fetch('a'))
+        self.assertEquals(1, DictAdapter.calls, 'expired entry refetched')
+        self.assertEquals(1, cache.memory_stats['expirations'])
+
+    def test_fetch_many(self):
+        cache = self.build()
+        cache.store('a', {'a': 1})
+        DictAdapter.data[cache.versioned_key('b')] = {'b': 1}
+        missed = []
+        def on_miss(keys):
+            missed.append(keys)
+            return {'c': {'c': 1}}
+        ret = cache.fetch_many(['a', 'b', 'c', 'd'], opts={'miss_many_callback': on_miss})
+        self.assertEquals({'a': {'a': 1}, 'b': {'b': 1}, 'c': {'c': 1}, 'd': None}, ret)
+        self.assertEquals([['c', 'd']], missed, 'one callback for all missed keys')
+        self.assertEquals({'c': 1}, DictAdapter.data[cache.versioned_key('c')], 'loaded data stored')
+        calls = DictAdapter.calls
+        self.assertEquals({'b': {'b': 1}, 'c': {'c': 1}}, cache.fetch_many(['b', 'c']))
+        self.assertEquals(calls, DictAdapter.calls, 'served from memory')
+
+    def test_store_many(self):
+        cache = self.build()
+        mapping = dict(('ru/sources/%d' % i, {'i': i}) for i in range(5))
+        stats = cache.store_many(mapping, opts={'batch_size': 2})
+        self.assertEquals(5, stats['keys'])
+        self.assertEquals(3, stats['batches'], 'chunked by count')
+        self.assertEquals({'i': 3}, DictAdapter.data[cache.versioned_key('ru/sources/3')])
+        self.assertEquals(mapping, cache.fetch_many(list(mapping)))
+        self.assertEquals(0, DictAdapter.calls, 'stored data is in memory')
+        stats = cache.store_many(mapping, opts={'batch_bytes': 10})
+        self.assertEquals(5, stats['batches'], 'chunked by bytes')
+        self.assertEquals(0, cache.store_many({})['keys'])
+
+    def test_disabled(self):
+        cache = self.build(False)
+        self.assertFalse(isinstance(cache, MemoryTier))
+        cache.store('a', {'a': 1})
+        cache.fetch('a')
+        self.assertEquals(1, DictAdapter.calls)
+
+    def test_default_off(self):
+        with override_config(cache={'enabled': True, 'namespace': 'test'}):
+            self.cache = CachedClient.instance(adapter=DictAdapter)
+        self.assertFalse(isinstance(self.cache, MemoryTier), 'opt in')
+
+
+class SingleFlightTest(unittest.TestCase):
+    """ Coalescing of concurrent cache misses """
+    def setUp(self):
+        DictAdapter.data = {}
+        with override_config(cache={'enabled': True, 'memory': False, 'namespace': 'test'}):
+            self.cache = CachedClient.instance(adapter=DictAdapter)
+        self.cache.version.version = '1'
+        self.stats = dict(SingleFlight.flight_stats)
+
+    def tearDown(self):
+        self.cache._drop_it()
+
+    def delta(self, name):
+        return SingleFlight.flight_stats[name] - self.stats[name]
+
+    def test_coalesce(self):
+        loads = []
+        started = threading.Event()
+        release = threading.Event()
+        def on_miss(key):
+            loads.append(key)
+            started.set()
+            release.wait(5)
+            return {'source': key}
+        results = []
+        def fetch():
+            results.append(self.cache.fetch('ru/sources/index', opts={'miss_callback': on_miss}))
+        threads = [threading.Thread(target=fetch) for _ in range(5)]
+        threads[0].start()
+        started.wait(5)
+        for thread in threads[1:]:
+            thread.start()
+        while self.delta('coalesced') < 4:
+            time.sleep(0.001)
+        release.set()
+        for thread in threads:
+            thread.join()
+        self.assertEquals(['ru/sources/index'], loads, 'loaded once')
+        self.assertEquals([{'source': 'ru/sources/index'}] * 5, results)
+        self.assertEquals(1, self.delta('loads'))
+        self.assertEquals({'source': 'ru/sources/index'}, DictAdapter.data[self.cache.versioned_key('ru/sources/index')])
+
+    def test_miss_lock(self):
+        self.cache.add_lock('ru/sources/index:lock', 10)   # other process loads key
+        def store_later():
+            time.sleep(0.1)
+            self.cache.store('ru/sources/index', {'other': 'process'})
+        thread = threading.Thread(target=store_later)
+        thread.start()
+        with override_config(cache={'enabled': True, 'miss_lock': True}):
+            data = self.cache.fetch('ru/sources/index', opts={'miss_callback': lambda key: {'own': 'load'}})
+        thread.join()
+        self.assertEquals({'other': 'process'}, data, 'waited for other process')
+        self.assertEquals(1, self.delta('lock_waits'))
+        self.assertEquals(1, self.delta('lock_hits'))
+        with override_config(cache={'enabled': True, 'miss_lock': True}):
+            self.assertEquals({'own': 'load'}, self.cache.fetch('ru/sources/other', opts={'miss_callback': lambda key: {'own': 'load'}}))
+        self.assertFalse(self.cache.versioned_key('ru/sources/other:lock') in DictAdapter.data, 'lock released')
+
+
+class StaleWhileRevalidateTest(unittest.TestCase):
+    """ Soft/hard TTL of cache entries """
+    STALE = {'sources': {'soft': 60, 'hard': 3600}}
+
+    def setUp(self):
+        DictAdapter.data = {}
+        with override_config(cache={'enabled': True, 'memory': False, 'namespace': 'test'}):
+            self.cache = CachedClient.instance(adapter=DictAdapter)
+        self.cache.version.version = '1'
+        self.stats = dict(SingleFlight.flight_stats)
+        self.loads = []
+
+    def tearDown(self):
+        self.cache._drop_it()
+
+    def delta(self, name):
+        return SingleFlight.flight_stats[name] - self.stats[name]
+
+    def on_miss(self, key):
+        self.loads.append(key)
+        return {'load': len(self.loads)}
+
+    def fetch(self, key):
+        with override_config(cache={'enabled': True, 'stale': self.STALE}):
+            return self.cache.fetch(key, opts={'miss_callback': self.on_miss})
+
+    def expire(self, key, soft, hard):
+        entry = DictAdapter.data[self.cache.versioned_key(key)]
+        now = time.time()
+        entry[StaleWhileRevalidate.ENVELOPE] = [now + soft, now + hard]
+
+    def test_key_class(self):
+        self.assertEquals('application', StaleWhileRevalidate.key_class('application'))
+        self.assertEquals('language', StaleWhileRevalidate.key_class('ru/language'))
+        self.assertEquals('sources', StaleWhileRevalidate.key_class('ru/sources/a/b'))
+        self.assertEquals(None, StaleWhileRevalidate.key_class('ru/keys/abc'))
+
+    def test_fresh(self):
+        self.assertEquals({'load': 1}, self.fetch('ru/sources/index'))
+        entry = DictAdapter.data[self.cache.versioned_key('ru/sources/index')]
+        self.assertEquals({'load': 1}, entry['data'], 'stored with envelope')
+        self.assertEquals({'load': 1}, self.fetch('ru/sources/index'))
+        self.assertEquals(1, len(self.loads))
+        self.assertEquals({'load': 1}, self.cache.fetch('ru/sources/index'), 'unwrapped without policy')
+
+    def test_stale(self):
+        self.fetch('ru/sources/index')
+        self.expire('ru/sources/index', -1, 100)
+        self.assertEquals({'load': 1}, self.fetch('ru/sources/index'), 'stale value served')
+        REVALIDATOR.join()
+        self.assertEquals(2, len(self.loads), 'refreshed in background')
+        self.assertEquals(1, self.delta('stale_hits'))
+        self.assertEquals(1, self.delta('revalidations'))
+        self.assertEquals({'load': 2}, self.fetch('ru/sources/index'))
+
+    def test_hard_expired(self):
+        self.fetch('ru/sources/index')
+        self.expire('ru/sources/index', -10, -1)
+        self.assertEquals({'load': 2}, self.fetch('ru/sources/index'), 'loaded synchronously')
+        self.assertEquals(0, self.delta('stale_hits'))
+
+    def test_previous_version(self):
+        self.fetch('ru/sources/index')
+        self.cache.version.version = '2'
+        with override_config(cache={'enabled': True, 'stale': self.STALE}):
+            self.assertEquals({'load': 1}, self.fetch('ru/sources/index'), 'previous version served')
+            REVALIDATOR.join()
+        self.assertEquals(1, self.delta('previous_hits'))
+        self.assertEquals({'load': 2}, DictAdapter.data[self.cache.versioned_key('ru/sources/index')]['data'])
+
+    def test_bulk(self):
+        with override_config(cache={'enabled': True, 'stale': self.STALE}):
+            self.cache.store_many({'ru/sources/a': {'a': 1}, 'ru/keys/b': {'b': 1}})
+            self.assertEquals({'b': 1}, DictAdapter.data[self.cache.versioned_key('ru/keys/b')], 'no policy')
+            self.expire('ru/sources/a', -1, 100)
+            ret = self.cache.fetch_many(['ru/sources/a', 'ru/keys/b'], opts={'miss_callback': self.on_miss})
+        self.assertEquals({'ru/sources/a': {'a': 1}, 'ru/keys/b': {'b': 1}}, ret)
+        REVALIDATOR.join()
+        self.assertEquals(['ru/sources/a'], self.loads)
+
+
+class NegativeCacheTest(unittest.TestCase):
+    """ Keys missing on CDN are cached as negative entries """
+    def setUp(self):
+        DictAdapter.data = {}
+        DictAdapter.calls = 0
+        self.stats = dict(SingleFlight.flight_stats)
+        self.loads = []
+
+    def tearDown(self):
+        self.cache._drop_it()
+
+    def build(self, memory=False):
+        with override_config(cache={'enabled': True, 'memory': memory, 'namespace': 'test'}):
+            self.cache = CachedClient.instance(adapter=DictAdapter)
+        self.cache.version.version = '1'
+        return self.cache
+
+    def delta(self, name):
+        return SingleFlight.flight_stats[name] - self.stats[name]
+
+    def on_miss(self, key):
+        self.loads.append(key)
+        return None
+
+    def test_negative(self):
+        cache = self.build()
+        for _ in range(3):
+            self.assertEquals(None, cache.fetch('ru/sources/none', opts={'miss_callback': self.on_miss}))
+        self.assertEquals(['ru/sources/none'], self.loads, 'CDN is called once')
+        self.assertEquals(MISSING, DictAdapter.data[cache.versioned_key('ru/sources/none')])
+        self.assertEquals(1, self.delta('negative_stores'))
+        self.assertEquals(2, self.delta('negative_hits'))
+        self.assertEquals(None, cache.fetch('ru/sources/none'), 'negative entry is not returned')
+
+    def test_disabled(self):
+        cache = self.build()
+        with override_config(cache={'enabled': True, 'negative_ttl': 0}):
+            cache.fetch('ru/sources/none', opts={'miss_callback': self.on_miss})
+            cache.fetch('ru/sources/none', opts={'miss_callback': self.on_miss})
+        self.assertEquals(2, len(self.loads))
+        self.assertEquals({}, DictAdapter.data)
+
+    def test_memory(self):
+        cache = self.build({'size': 10, 'ttl': 300})
+        cache.fetch('ru/sources/none', opts={'miss_callback': self.on_miss})
+        calls = DictAdapter.calls
+        self.assertEquals(None, cache.fetch('ru/sources/none', opts={'miss_callback': self.on_miss}))
+        self.assertEquals(calls, DictAdapter.calls, 'served from memory')
+        self.assertEquals(1, len(self.loads))
+        DictAdapter.data[cache.versioned_key('ru/sources/other')] = MISSING   # stored by other process
+        cache.fetch('ru/sources/other', opts={'miss_callback': self.on_miss})
+        calls = DictAdapter.calls
+        cache.fetch('ru/sources/other', opts={'miss_callback': self.on_miss})
+        self.assertEquals(calls, DictAdapter.calls, 'remote negative entry is remembered')
+        self.assertEquals(1, len(self.loads))
+
+    def test_fetch_many(self):
+        cache = self.build()
+        opts = {'miss_many_callback': lambda keys: dict((key, None if key == 'b' else {key: 1}) for key in keys)}
+        self.assertEquals({'a': {'a': 1}, 'b': None}, cache.fetch_many(['a', 'b'], opts=opts))
+        self.assertEquals(MISSING, DictAdapter.data[cache.versioned_key('b')])
+        self.assertEquals({'a': {'a': 1}, 'b': None}, cache.fetch_many(['a', 'b'], opts=opts))
+        self.assertEquals(1, self.delta('negative_hits'))
+
+
+class VersionPollerTest(unittest.TestCase):
+    """ Background cache version refresh """
+    def setUp(self):
+        self.events = []
+        CacheVersion.subscribe(self.on_change)
+        self.poller = VersionPoller()
+
+    def tearDown(self):
+        self.poller.stop()
+        CacheVersion.unsubscribe(self.on_change)
+
+    def on_change(self, old_version, new_version):
+        self.events.append((old_version, new_version))
+
+    def test_poll(self):
+        version = CacheVersion(None)
+        versions = ['1', '1', '2']
+        def refresh():
+            version.set(versions.pop(0) if versions else '2')
+            return version.version
+        self.assertTrue(self.poller.start(refresh, interval=0.01))
+        self.assertEquals('1', version.version, 'first refresh is synchronous')
+        self.assertFalse(self.poller.start(refresh), 'started once')
+        self.assertTrue(self.poller.running())
+        for _ in range(100):
+            if version.version == '2':
+                break
+            time.sleep(0.01)
+        self.assertEquals([(None, '1'), ('1', '2')], self.events, 'change is published')
+        self.poller.stop()
+        self.assertFalse(self.poller.running())
+
+    def test_client_refresh(self):
+        from tml.api.client import Client
+        DictAdapter.data = {}
+        client = Client('key')
+        client.get_cache_version = lambda: '20160307120415'
+        with override_config(cache={'enabled': True, 'adapter': DictAdapter, 'namespace': 'test'}):
+            cache = client.cache
+            cache.version.reset()
+            self.assertEquals('20160307120415', client.refresh_cache_version(), 'version from CDN')
+            client.get_cache_version = None
+            self.assertEquals('20160307120415', client.refresh_cache_version(), 'version from cache')
+        cache._drop_it()
+
+    def test_refresh_errors(self):
+        def refresh():
+            raise IOError('cache is down')
+        self.poller.start(refresh, interval=0.01)
+        self.assertTrue(self.poller.running(), 'survives refresh errors')
+        self.assertEquals(None, self.poller.last_refresh)
+
+    def test_interval(self):
+        stored = {'version': '1'}   # version in cache shared with other processes
+        version = CacheVersion(None)
+        def refresh():
+            version.set(stored['version'])
+            return version.version
+        with override_config(version_check_interval=1):
+            self.poller.start(refresh)
+        self.assertEquals(0.1, self.poller.interval, 'fraction of version check interval')
+        stored['version'] = '2'   # upgraded by other process
+        for _ in range(50):
+            if version.version == '2':
+                break
+            time.sleep(0.01)
+        self.assertEquals('2', version.version, 'seen within poll interval')
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'fork is not supported')
+    def test_fork(self):
+        self.poller.start(lambda: '1', interval=60)
+        pid = os.fork()
+        if pid == 0:   # child: parent thread is not copied, so version is reset per request
+            code = 1
+            try:
+                if not self.poller.running() and self.poller.start(lambda: '1', interval=60):
+                    code = 0
+            finally:
+                os._exit(code)
+        _, status = os.waitpid(pid, 0)
+        self.assertEquals(0, status, 'child does not see parent poller running, starts its own')
+        self.assertTrue(self.poller.running(), 'parent poller is running')
+
+    def test_pid_changed(self):
+        self.poller.start(lambda: '1', interval=60)
+        parent_stop = self.poller._stop
+        self.poller._pid = os.getpid() + 1   # state copied from parent process
+        self.assertFalse(self.poller.running(), 'thread of other process')
+        self.assertTrue(self.poller.start(lambda: '1', interval=60), 'own poller started')
+        self.assertTrue(self.poller.running())
+        parent_stop.set()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,48 @@
+from __future__ import absolute_import
+# encoding: UTF-8
+import unittest
+import json
+from tml.cache_adapters.codecs import get_codec, decode, allowed_codecs, CODECS, MAGIC
+
+DATA = {'results': {'key': [{'label': u'Привет {user}', 'context': {'user': {'gender': 'male'}}}]}}
+BIG = dict(('key_%d' % i, [{'label': u'Перевод %d' % i}]) for i in range(100))
+
+
+class CodecsTest(unittest.TestCase):
+    """ Cache payload codecs """
+    def test_roundtrip(self):
+        for name in CODECS:
+            codec = get_codec(name)
+            for data in (DATA, BIG):
+                self.assertEquals(data, decode(codec.encode(data)), name)
+
+    def test_headers(self):
+        payload = get_codec('json').encode(DATA)
+        self.assertEquals(DATA, json.loads(payload.decode('utf-8')), 'json is readable by older versions')
+        self.assertEquals(DATA, decode(json.dumps(DATA)), 'legacy text payload')
+        self.assertEquals(MAGIC + b'm', get_codec('marshal').encode(DATA)[:2])
+        zlib_codec = get_codec('zlib')
+        self.assertEquals(payload, zlib_codec.encode(DATA), 'small payload is not compressed')
+        compressed = zlib_codec.encode(BIG)
+        self.assertEquals(MAGIC + b'z', compressed[:2])
+        self.assertTrue(len(compressed) < len(get_codec('json').encode(BIG)))
+        self.assertEquals(MAGIC + b'z', get_codec('zlib', threshold=10).encode(DATA)[:2], 'custom threshold')
+        self.assertEquals(MAGIC + b'p', get_codec('pickle+zlib').encode(DATA)[:2], 'below threshold')
+        with self.assertRaises(ValueError):
+            decode(MAGIC + b'?' + b'{}')
+
+    def test_allowed(self):
+        allowed = allowed_codecs(get_codec('json'))
+        pickled = get_codec('pickle').encode(DATA)
+        self.assertEquals(None, decode(pickled, allowed), 'pickle is missed by json adapter')
+        self.assertEquals(None, decode(get_codec('pickle+zlib').encode(BIG), allowed))
+        self.assertEquals(None, decode(MAGIC + b'?' + b'{}', allowed))
+        self.assertEquals(BIG, decode(get_codec('zlib').encode(BIG), allowed))
+        self.assertEquals(DATA, decode(get_codec('json').encode(DATA), allowed))
+        allowed = allowed_codecs(get_codec('pickle+zlib'))
+        self.assertEquals(DATA, decode(pickled, allowed), 'small payloads of compressed codec')
+        self.assertEquals(None, decode(get_codec('marshal').encode(DATA), allowed))
+
+
+if __name__ == '__main__':
+    unittest.main()
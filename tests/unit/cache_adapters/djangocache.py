@@ -0,0 +1,79 @@
+from __future__ import absolute_import
+# encoding: UTF-8
+import unittest
+from tml.cache import CachedClient, REVALIDATOR
+from tml.cache_adapters.djangocache import DjangoCacheAdapter
+from tests.common import override_config
+
+
+class LocMemCache(object):
+    """ Django cache backend stand-in """
+    def __init__(self):
+        self.data = {}
+
+    def get(self, key):
+        return self.data.get(key, None)
+
+    def set(self, key, value, timeout=None):
+        self.data[key] = value
+
+    def get_many(self, keys):
+        return dict((key, self.data[key]) for key in keys if key in self.data)
+
+    def set_many(self, mapping, timeout=None):
+        self.data.update(mapping)
+
+    def add(self, key, value, timeout=None):
+        return self.data.setdefault(key, value) is value
+
+    def delete(self, key):
+        self.data.pop(key, None)
+
+
+def install(self, params):
+    self._cache = LocMemCache()
+
+
+def LocMemFactory(cache_builder):
+    """ Like DjangoCacheFactory, without django """
+    adapter = type('DjangoCacheAdapter', (object,), dict(DjangoCacheAdapter.__dict__, install=install))
+    return cache_builder(adapter)('locmem', {})
+
+
+class DjangoCacheAdapterTest(unittest.TestCase):
+    """ Keys are versioned by adapter """
+    def setUp(self):
+        with override_config(cache={'enabled': True, 'memory': False, 'namespace': 'test'}):
+            self.cache = CachedClient.load_adapter(__name__ + '.LocMemFactory')
+        self.cache.version.version = '1'
+
+    def tearDown(self):
+        self.cache._drop_it()
+
+    def test_versioned_keys(self):
+        self.cache.store('ru/sources/index', {'v': 1})
+        self.assertEquals([self.cache.versioned_key('ru/sources/index')], list(self.cache._cache.data))
+        self.cache.version.version = '2'
+        self.cache.store_many({'ru/sources/index': {'v': 2}})
+        self.assertEquals({'ru/sources/index': {'v': 2}}, self.cache.read_many(['ru/sources/index']))
+        self.assertEquals({'v': 1}, self.cache.fetch('ru/sources/index', opts={'cache_version': '1'}),
+                          'previous version')
+        self.assertEquals({'ru/sources/index': {'v': 1}},
+                          self.cache.read_many(['ru/sources/index'], opts={'cache_version': '1'}))
+
+    def test_previous_version_served(self):
+        loads = []
+        def on_miss(key):
+            loads.append(key)
+            return {'v': 2}
+        stale = {'sources': {'soft': 60, 'hard': 3600}}
+        with override_config(cache={'enabled': True, 'stale': stale}):
+            self.cache.store('ru/sources/index', {'v': 1})
+            self.cache.version.version = '2'
+            self.assertEquals({'v': 1}, self.cache.fetch('ru/sources/index', opts={'miss_callback': on_miss}))
+            REVALIDATOR.join()
+        self.assertEquals(['ru/sources/index'], loads, 'refreshed in background')
+
+
+if __name__ == '__main__':
+    unittest.main()
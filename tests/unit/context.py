@@ -0,0 +1,85 @@
+# encoding: UTF-8
+from __future__ import absolute_import
+import unittest
+import pytest
+from mock import patch
+import tml
+from tests.mock import Client
+from tml.context import AbstractContext, BlockOptions
+from tml.strings import to_string
+
+
+class BlockOptionsTest(unittest.TestCase):
+    """ Test nested block options """
+    def test_nested(self):
+        context = AbstractContext(None)
+        self.assertEquals({}, context.block_options, 'no blocks')
+        self.assertEquals('x', context.block_option('dry', default='x'), 'default')
+        outer = {'source': 'outer', 'dry': False, 'target_locale': 'ru'}
+        context.push_options(outer)
+        context.push_options({'source': 'inner', 'dry': True, 'target_locale': ''})
+        self.assertEquals('outer', context.block_option('source'), 'outer block wins')
+        self.assertTrue(context.block_option('dry'), 'set in any block')
+        self.assertFalse(context.block_option('dry', lookup=False), 'no lookup: outermost block')
+        self.assertEquals('ru', context.block_option('target_locale'), 'empty value is skipped')
+        self.assertEquals(outer, context.block_options, 'outermost block')
+        self.assertEquals({'source': 'inner', 'dry': True, 'target_locale': ''}, context.pop_options(), 'pop inner')
+        self.assertFalse(context.block_option('dry'), 'inner block is popped')
+        self.assertEquals(outer, context.pop_options(), 'pop outer')
+        self.assertEquals(None, context.block_option('source'), 'no blocks')
+        with self.assertRaises(IndexError):
+            context.pop_options()
+
+    def test_source_path(self):
+        options = BlockOptions().push({'source': 'a'}).push({}).push({'source': 'b'})
+        self.assertEquals('main>b>a', options.source_path('main', '>'), 'innermost first')
+        self.assertEquals('main', BlockOptions().source_path('main', '>'), 'main source only')
+
+
+@pytest.mark.usefixtures("build_context")
+class TrManyTest(unittest.TestCase):
+    """ Test batch translation """
+    def setUp(self):
+        self.context = self.build_context(client=Client.read_all(), skip=True)
+
+    def test_tr_many(self):
+        items = ['Test', ('Hello {name}', {'name': 'Bill'}),
+                 {'label': 'No translation', 'description': 'missed'}, 'Test']
+        results = self.context.tr_many(items, options={'nowrap': True})
+        expected = [self.context.tr('Test', options={'nowrap': True}),
+                    self.context.tr('Hello {name}', {'name': 'Bill'}, options={'nowrap': True}),
+                    self.context.tr('No translation', description='missed', options={'nowrap': True}),
+                    self.context.tr('Test', options={'nowrap': True})]
+        self.assertEquals([value for _, value, _ in expected], [value for _, value, _ in results], 'same as tr')
+        self.assertEquals(to_string('Тест'), results[0][1], 'translated')
+        self.assertEquals([key for key, _, _ in expected], [key for key, _, _ in results], 'keys')
+        self.assertTrue(results[2][2] is not None, 'missed translation error')
+        self.assertEquals([], self.context.tr_many([]), 'nothing to translate')
+        self.assertEquals(['Test'], [value for _, value, _ in self.context.tr_many(['Test'], options={'dry': True})], 'dry')
+
+    def test_item_options(self):
+        sources = []
+        fetch_many = self.context.fetch_many
+        def record(keys):
+            sources.append((self.context.source_name, len(keys)))
+            return fetch_many(keys)
+        self.context.fetch_many = record
+        items = ['Test', {'label': 'Test', 'options': {'source': 'other', 'nowrap': True}},
+                 {'label': 'Dry', 'options': {'dry': True}}]
+        results = self.context.tr_many(items, options={'nowrap': True})
+        self.assertEquals(sorted([(self.context.source, 1), ('other', 1)]), sorted(sources),
+                          'item source is used for lookup, dry item is not fetched')
+        self.assertTrue('other' in self.context._used_sources)
+        self.assertEquals('Dry', results[2][1])
+
+    def test_errors_logged(self):
+        items = ['Test', {'label': 'No translation', 'description': 'missed'}]
+        with patch('tml.get_context', return_value=self.context), patch('tml.get_logger') as get_logger:
+            values = tml.tr_many(items, options={'nowrap': True})
+        self.assertEquals(to_string('Тест'), values[0], 'translated')
+        self.assertEquals(1, get_logger().error.call_count, 'missed translation only')
+        self.assertFalse(get_logger().exception.called, 'no traceback outside except')
+
+
+if __name__ == '__main__':
+    unittest.main()
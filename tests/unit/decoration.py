@@ -3,7 +3,8 @@ from __future__ import absolute_import
 import unittest
 from tml.decoration import Text, Tag, Set, TagFactory, UnsupportedTag,\
     AttributeIsNotSet
-from tml.decoration.parser import parse, ParseError
+from tml.decoration.parser import parse, ParseError, parse_cached, render,\
+    parsed_templates
 
 class DecorationTest(unittest.TestCase):
 
@@ -90,6 +91,20 @@ class DecorationTest(unittest.TestCase):
         self.assertEquals('<h1>Hello<br/>world</h1>', parse('[h1]Hello[br]world[/h1]').render(), 'h1: br')
         self.assertEquals('<h1>Hello<br/>world</h1>', parse('[h1: Hello[br]world]').render(), 'h1: br')
 
+    def test_render(self):
+        text = 'no decoration'
+        self.assertTrue(render(text) is text, 'fast path returns text as is')
+        self.assertEquals('NO DECORATION', render(text, text_filter=lambda t: t.upper()))
+        parsed_templates.clear()
+        tpl = '[link]{name}[/link] and [b: {name}]'
+        tree = parse_cached(tpl)
+        self.assertTrue(tree is parse_cached(tpl), 'tree is cached')
+        self.assertEquals(1, parsed_templates.stats['hits'])
+        self.assertEquals('<a href="http://translationexchange.com/">JOHN</a> AND <strong>JOHN</strong>',
+                          render(tpl, self.attrs, lambda t: t.replace('{name}', 'john').upper()))
+        self.assertEquals('<a href="http://translationexchange.com/">{name}</a> and <strong>{name}</strong>',
+                          render(tpl, self.attrs), 'cached tree is not changed by render')
+
 
 if __name__ == '__main__':
     unittest.main()
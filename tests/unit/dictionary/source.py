@@ -37,6 +37,17 @@ class SourceTest(unittest.TestCase):
         t = dict.get_translation(key)
         self.assertEquals(label, t.execute({}, {}), 'Use default tranlation')
 
+    def test_query(self):
+        class Prefixed(SourceDictionary):
+            @classmethod
+            def source_cache_key(cls, source, locale):
+                return 'app/' + super(Prefixed, cls).source_cache_key(source, locale)
+        dict = Prefixed(language = self.lang, source = 'shop/cart', translations = {})
+        self.assertEquals(dict.api_query, Prefixed.query('shop/cart', self.lang), 'single and bulk loads agree')
+        self.assertEquals('app/ru/sources/shop/cart', dict.cache_key())
+        self.assertEquals({'cache_key': 'app/ru/sources/shop/cart'}, Prefixed.query('shop/cart', self.lang)[2])
+        self.assertEquals('sources/%s/translations' % dict.key, dict.api_query[0])
+
 if __name__ == '__main__':
     unittest.main()
 
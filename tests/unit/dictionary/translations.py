@@ -7,6 +7,7 @@ from tml import Application
 from tml.language import Language
 from tml.translation import Key
 from tml.dictionary.translations import Dictionary
+from tml.dictionary import Hashtable
 from tml.rules.contexts.gender import Gender
 from tests.mock.fallback import Fallback
 from tml.strings import to_string
@@ -44,6 +45,25 @@ class TranslationsTest(unittest.TestCase):
         self.assertEquals(key, f.missed_keys[0], 'Key added to missed')
         self.assertEquals(label, t.execute({}, {}), 'Use default tranlation')
 
+    def test_hashtable_compiled(self):
+        """ Translation options are compiled once """
+        key = Key(label = 'Hello', language = self.lang)
+        dict = Hashtable(translations = {key.key: [{'label': 'Привет'}]})
+        hits = Hashtable.compiled.stats['hits']
+        first = dict.fetch(key)
+        second = dict.fetch(key)
+        self.assertEquals(key, second.key, 'translation of requested key')
+        self.assertEquals(hits + 1, Hashtable.compiled.stats['hits'], 'cache hit')
+        self.assertTrue(Hashtable.compiled.stats['bytes'] > 0, 'memory accounted')
+        self.assertEquals(None, second.options[0].language, 'cached options are not bound to language')
+        self.assertTrue(second.fetch_option({}, {}).language is self.lang, 'selected option is bound')
+        dict.translations[key.key][0]['label'] = 'Хелло'
+        self.assertEquals(to_string('Хелло'), dict.fetch(key).execute({}, {}), 'edited in place')
+        other = Hashtable(translations = {key.key: [{'label': 'Здравствуй'}]})
+        self.assertEquals(to_string('Здравствуй'), other.fetch(key).execute({}, {}), 'not shared with other dictionary')
+        dict.translations = {key.key: [{'label': 'Хай'}]}
+        self.assertEquals(to_string('Хай'), dict.fetch(key).execute({}, {}), 'translations swapped')
+
 
 if __name__ == '__main__':
     unittest.main()
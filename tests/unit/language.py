@@ -2,7 +2,8 @@ from __future__ import absolute_import
 # encoding: UTF-8
 import unittest
 from tml.application import Application, LanguageNotSupported
-from tml.language import Language
+from tml.language import Language, REGISTRY
+from tml.cache import CacheVersion
 from os.path import dirname
 import json
 from tml.rules.contexts import Contexts
@@ -31,6 +32,24 @@ class LanguageTest(unittest.TestCase):
         with self.assertRaises(LanguageNotSupported):
             Language.load_by_locale(self.app, 'de')
 
+    def test_registry(self):
+        """ Compiled definitions are shared by version """
+        data = self.client.get('languages/ru/definition')
+        key = (100, 'ru', 'v1')
+        REGISTRY.clear()
+        first = Language.from_dict(self.app, data, registry_key=key)
+        app = Application(self.client, 100, [], 'en')
+        second = Language.from_dict(app, data, registry_key=key)
+        self.assertTrue(first.contexts is second.contexts, 'contexts are shared')
+        self.assertTrue(first.cases is second.cases, 'cases are shared')
+        self.assertEquals(app, second.application, 'own application')
+        self.assertFalse(first.contexts is Language.from_dict(self.app, data).contexts, 'no key - no registry')
+        version = CacheVersion(None, 'v1')
+        version.reset()
+        self.assertTrue(key in REGISTRY.definitions, 'reset keeps definitions')
+        version.set('v2')
+        self.assertFalse(key in REGISTRY.definitions, 'new version drops definitions')
+
 
 if __name__ == '__main__':
     unittest.main()
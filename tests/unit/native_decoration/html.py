@@ -94,5 +94,12 @@ class HtmlTest(unittest.TestCase):
     def test_decorate_token(self):
         pass
 
+    def test_skip_decoration(self):
+        decorator = get_decorator()
+        self.assertTrue(decorator is get_decorator(), 'decorator without application is shared')
+        self.assertTrue(decorator.skip_decoration(), 'inline mode is off')
+        with patch.object(decorator, 'is_inline_mode', return_value=True):
+            self.assertFalse(decorator.skip_decoration(), 'inline mode')
+
     # def tearDown(self):
     #     self.context.deactivate()
@@ -0,0 +1,103 @@
+from __future__ import absolute_import
+# encoding: UTF-8
+import unittest
+from tml.cache import CacheVersion, PRELOADED
+from tml.release import preload, build_reader, DirReader, TarReader, ReleaseNotFound
+from tml.application import Application
+from tml.api.snapshot import open_snapshot
+from tests.common import FIXTURES_PATH, override_config
+from os.path import join
+import os
+import shutil
+import tempfile
+
+
+class PreloadTest(unittest.TestCase):
+    """ Boot time release preload """
+    def tearDown(self):
+        PRELOADED.clear()
+
+    def test_preload_dir(self):
+        path = join(FIXTURES_PATH, '20160307120415')
+        report = preload(path=path, workers=2)
+        self.assertEquals('20160307120415', report['version'])
+        self.assertEquals(['en', 'ru'], sorted(report['locales']))
+        self.assertEquals(11, report['files'], 'application + 2 x (language + 4 sources)')
+        self.assertTrue(report['bytes'] > 0)
+        self.assertTrue('ru/language' in PRELOADED)
+        self.assertTrue('ru/sources/sample_source' in PRELOADED)
+        app = PRELOADED.application
+        self.assertEquals('ru', app.language('ru').locale)
+        self.assertTrue('sample_source' in app.sources, 'sources built')
+
+    def test_client_reads_preloaded(self):
+        path = join(FIXTURES_PATH, '20160307120415')
+        preload(path=path, locales=['ru'], sources=['sample_source'], workers=1)
+        client = open_snapshot(path)
+        data = client.get('languages/ru/definition', opts={'cache_key': 'ru/language'})
+        self.assertTrue(data is PRELOADED.get('ru/language'), 'served from memory')
+
+    def test_application_reused(self):
+        path = join(FIXTURES_PATH, '20160307120415')
+        preload(path=path, locales=['ru'], sources=['sample_source'], workers=1)
+        preloaded = PRELOADED.application
+        client = open_snapshot(path)
+        app = Application.load_by_key(client, preloaded.key, locale='ru')
+        self.assertFalse(app is preloaded, 'request copy')
+        self.assertTrue(app.client is client)
+        language = app.language('ru')
+        self.assertTrue(language.application is app)
+        self.assertTrue(language.contexts is preloaded.language('ru').contexts, 'compiled once')
+        source = app.sources['sample_source'].hashtable_by_locale('ru')
+        self.assertTrue(source.language is language)
+        self.assertTrue(source.translations is preloaded.sources['sample_source'].hashtable_by_locale('ru').translations)
+        self.assertFalse(Application.load_by_key(client, 'other') is preloaded)
+
+    def test_missing_source(self):
+        path = join(FIXTURES_PATH, '20160307120415')
+        report = preload(path=path, locales=['ru'], sources=['sample_source', 'nothing'], workers=1)
+        self.assertEquals(['ru/sources/nothing'], report['missing'], 'skipped')
+        self.assertEquals(3, report['files'], 'application, language and source')
+        self.assertTrue('ru/sources/sample_source' in PRELOADED)
+        self.assertFalse('ru/sources/nothing' in PRELOADED)
+        self.assertEquals(None, DirReader(path).read('ru/sources/nothing'))
+        reader = TarReader(join(FIXTURES_PATH, 'snapshot.tar.gz'))
+        try:
+            self.assertEquals(None, reader.read('ru/sources/nothing'))
+        finally:
+            reader.close()
+
+    def test_file_cache_version(self):
+        class NoRelease(object):
+            def get_cache_version(self):
+                return '0'   # nothing is published
+        cache_dir = tempfile.mkdtemp()
+        try:
+            os.mkdir(join(cache_dir, '20160307120415'))
+            with override_config(cache={'enabled': True, 'adapter': 'file', 'path': cache_dir}):
+                with self.assertRaises(ReleaseNotFound):
+                    build_reader(client=NoRelease())
+                os.symlink('20160307120415', join(cache_dir, 'current'))
+                reader, version = build_reader(client=NoRelease())
+            self.assertEquals('20160307120415', version, 'current release')
+            self.assertTrue(isinstance(reader, DirReader))
+        finally:
+            shutil.rmtree(cache_dir)
+
+    def test_tar(self):
+        report = preload(path=join(FIXTURES_PATH, 'snapshot.tar.gz'), locales=['ru'], processes=True, workers=2)
+        self.assertEquals(['ru'], report['locales'])
+        self.assertTrue('ru/language' in PRELOADED)
+
+    def test_version_change(self):
+        preload(path=join(FIXTURES_PATH, '20160307120415'), locales=['ru'], sources=[], workers=1)
+        self.assertTrue('ru/language' in PRELOADED)
+        version = CacheVersion(None)
+        version.version = '20160307120415'
+        self.assertTrue('ru/language' in PRELOADED, 'same release')
+        version.version = '20170101000000'
+        self.assertFalse('ru/language' in PRELOADED, 'other release is published')
+
+
+if __name__ == '__main__':
+    unittest.main()
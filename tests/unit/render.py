@@ -9,6 +9,7 @@ from tml.translation import Translation
 from tml.context import LanguageContext
 from tml.language import Language
 from tml.strings import to_string
+from tml.native_decoration.html import Html
 
 
 @pytest.mark.usefixtures("build_context")
@@ -69,5 +70,15 @@ class RenderEngineTest(unittest.TestCase):
         #         self.assertTrue('tml_fallback' in actual)
         #         self.assertTrue(expected in actual)
 
+    def test_skip_decoration_once(self):
+        key, url = build_key('{actor} give you {count} apples', language=self.russian, md5='8ad5a7fe0a12729764e31a1e3ca80059')
+        self.client.read(url, {'locale': 'ru'})
+        t = Translation.from_data(key,
+                                  self.client.get(url, params={'locale':'ru'})['results'])
+        with patch.object(Html, 'skip_decoration', return_value=True) as skip:
+            actual = self.context.render(t, {'actor': female('Маша'), 'count': 2})
+        self.assertEquals(to_string('Маша любезно дала тебе 2 яблока'), actual)
+        self.assertEquals(1, skip.call_count, 'checked once per render, not per token')
+
     def tearDown(self):
         self.context.deactivate()
@@ -5,6 +5,7 @@ import unittest
 from mock import patch
 from tml.rules.contexts import *
 from tml.strings import to_string
+from tml.utils import pj, read_json, APP_DIR
 
 def die(object):
     raise Exception('Bad function')
@@ -105,6 +106,19 @@ class ContextsTest(unittest.TestCase):
         # check order:
         self.assertEqual(contexts.contexts[0].pattern, Gender, 'Check contexts order')
 
+    def test_find_by_token_name(self):
+        language = read_json(pj(APP_DIR, 'defaults', 'languages', 'ru.json'))
+        contexts = Contexts.from_dict(language['contexts'])
+        self.assertEquals(Number, contexts.find_by_token_name('count').pattern, 'count')
+        self.assertEquals(Gender, contexts.find_by_token_name('actor2').pattern, 'actor2')
+        self.assertTrue(contexts.find_by_token_name('count') is contexts.token_index['count'], 'memo')
+        with self.assertRaises(ContextNotFound):
+            contexts.find_by_token_name('apples')
+        self.assertTrue('apples' in contexts.token_index, 'negative result memo')
+        with self.assertRaises(ContextNotFound):
+            contexts.find_by_token_name('apples')
+        self.assertFalse(Contexts([]).index is Contexts([]).index, 'own index')
+
 
 if __name__ == '__main__':
     unittest.main()
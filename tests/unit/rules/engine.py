@@ -100,6 +100,28 @@ class EngineTest(unittest.TestCase):
         self.assertFalse(engine.execute(q, {'value': 3}))
         self.assertFalse(engine.execute(q, {'value': 14}))
 
+    @patch.dict(SUPPORTED_FUNCTIONS, {'die': die_op})
+    def test_compile(self):
+        """ Compiled rule gives the same result and errors as interpreter """
+        cases = (('(mod @n 10)', {'n': 21}),
+                 ('(&& (= 1 (mod @n 10)) (!= 11 (mod @n 100)))', {'n': 21}),
+                 ('(&& (= 1 (mod @n 10)) (!= 11 (mod @n 100)))', {'n': 11}),
+                 ('(+ 2 3)', {}),
+                 ('(quote @value)', {'value': 'a'}))
+        for rule, data in cases:
+            self.assertEquals(self.engine.execute(parse(rule), data),
+                              self.engine.compile(parse(rule))(data), rule)
+        with self.assertRaises(FunctionDoesNotExists):
+            self.engine.compile(['xor', '2', '3'])({})
+        with self.assertRaises(ArgumentDoesNotExists) as context:
+            self.engine.compile(['+', '@e', '3'])({})
+        self.assertEquals(1, context.exception.part_number, 'In first argument')
+        with self.assertRaises(FunctionCallFault):
+            self.engine.compile(['mod', 'a', '10'])({})
+        with self.assertRaises(InnerExpressionCallFault) as context:
+            self.engine.compile(['mod', '10', ['die']])({})
+        self.assertEquals(2, context.exception.part_number, 'Store part number')
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -101,6 +101,28 @@ class FunctionsTest(unittest.TestCase):
         self.assertFalse(SUPPORTED_FUNCTIONS['atom']([]))
         self.assertFalse(SUPPORTED_FUNCTIONS['atom'](tuple()))
 
+    def test_compilers(self):
+        """ Compiled functions with literal args behave as runtime ones """
+        cases = [(in_f, ('a,b,c', 'b')), (in_f, ('aa,bb', 'a')),
+                 (in_f, ('1,2,3', 1)), (in_f, ('1..5', 6)),
+                 (in_f, ('1..3,5..8', 7)), (in_f, ('1..3,x', '2')),
+                 (in_f, ('a,1..3', 'a')), (within_f, (3, '1..5')),
+                 (within_f, (6, '1..5')), (f_match, ('/test/i', 'TEST')),
+                 (f_match, ('/(Лев)$/', 'Маша')),
+                 (f_replace, ('0$', 'o', '1000'))]
+        for func, args in cases:
+            compiled = FUNCTION_COMPILERS[func](*args)
+            self.assertEquals(func(*args), compiled(*args), '%s%s' % (func.__name__, args))
+        with self.assertRaises(ArgumentError):
+            in_f('a,1..3', 'b')
+        with self.assertRaises(ArgumentError):
+            FUNCTION_COMPILERS[in_f]('a,1..3', 'b')('a,1..3', 'b')
+        from tml.rules.engine import VARIABLE
+        self.assertIsNone(FUNCTION_COMPILERS[in_f](VARIABLE, 'a'), 'Not literal set')
+        engine = RulesEngine(SUPPORTED_FUNCTIONS, FUNCTION_COMPILERS)
+        rule = engine.compile(parse('(in "1..3,5" @n)'))
+        self.assertTrue(rule({'n': 5}))
+        self.assertFalse(rule({'n': 4}))
 
 
 if __name__ == '__main__':
@@ -63,3 +63,13 @@ class TransformTokenTest(unittest.TestCase):
             # print label
             for case in cases:
                 self.assertEquals(token.substitute(label, case[0], self.en), case[1])
+
+    @patch('tml.token.data.get_current_context')
+    def test_caller_options(self, get_current_context):
+        get_current_context().block_option.return_value = False
+        label = 'This is {user||he,she,it}'
+        token = TransformToken.parse(label)[0]
+        data = {'user': FakeUser(gender='male', first_name='<b>Tom</b>')}
+        self.assertEquals(token.substitute(label, data, self.en),
+                          token.substitute(label, data, self.en, {'escape': True}),
+                          'caller options are not applied to value')
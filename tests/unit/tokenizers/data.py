@@ -52,3 +52,25 @@ class DataTokenizerTest(unittest.TestCase):
         for case in cases:
             dt = DataTokenizer(label, context=case[0])
             self.assertEquals(dt.substitute(self.en), case[1])
+
+    def test_compiled_labels(self):
+        DataTokenizer.compiled_labels.clear()
+        label = 'Dear {user}, you have {count||message}'
+        dt = DataTokenizer(label, context={'user': 'John', 'count': 2})
+        self.assertEquals(len(dt.tokens), 2)
+        self.assertEquals(DataTokenizer.compiled_labels.stats['misses'], 1)
+        self.assertEquals(dt.substitute(self.en), 'Dear John, you have 2 messages')
+        dt = DataTokenizer(label, context={'user': 'Anna', 'count': 1})
+        self.assertEquals(DataTokenizer.compiled_labels.stats['hits'], 1)
+        self.assertEquals(dt.substitute(self.en), 'Dear Anna, you have 1 message')
+
+    def test_single_pass_substitution(self):
+        # token value which contains other token text is not substituted again:
+        dt = DataTokenizer('{a} and {b}', context={'a': '{b}', 'b': 'B'})
+        self.assertEquals(dt.substitute(self.en), '{b} and B')
+        dt = DataTokenizer('{a}, {a} and {user.first_name}', context={'a': 'A', 'user': FakeUser()})
+        self.assertEquals(dt.substitute(self.en), 'A, A and Tom')
+        self.assertEquals(len(dt.tokens), 2)
+        # missed value keeps token as is:
+        dt = DataTokenizer('{user:gender|He,She} has {count}', context={'count': 5})
+        self.assertEquals(dt.substitute(self.en), '{user:gender|He,She} has 5')
@@ -6,7 +6,7 @@ from json import loads
 from tests.mock import Client
 from mock import patch
 from tml.translation import Key, TranslationOption, OptionIsNotSupported,\
-    Translation, OptionIsNotFound, generate_key
+    Translation, OptionIsNotFound, generate_key, generated_keys
 from tml.translation.context import Context
 from tml.application import Application
 from tml.language import Language
@@ -43,6 +43,17 @@ class TranslationTest(unittest.TestCase):
         self.assertEquals('2c868dcba5cd6e9f06dc77397b5a77b1', Key(label='{name} give you {count} apples', description='apple', language=self.ru).key, 'Key with description')
         self.assertEquals('f9048053ea53b494f948b88b334f7ad0', Key(label='Submit', description='Submit recipe', language=self.ru).key)
 
+    def test_key_memo(self):
+        """ Key hash is computed once """
+        generated_keys.clear()
+        generate_key('Test')
+        self.assertEquals('5174f88691edb354a9f46af6e7455bb8', generate_key('Test'), 'memo hit')
+        self.assertEquals(1, generated_keys.stats['hits'], 'hash memoized')
+        k = Key.from_hash('5174f88691edb354a9f46af6e7455bb8', self.ru, 'Test')
+        self.assertEquals('Test', k.label, 'label')
+        self.assertEquals(1, generated_keys.stats['hits'], 'hash is known')
+        self.assertEquals(Key(label='Test', language=self.ru), k, 'same key')
+
     @patch('tml.token.data.is_language_cases_enabled', return_value=True)
     def test_options(self, _):
         t = TranslationOption('{name||дал, дала, дало} {to::dat} {count} яблоко', self.ru, {'count':{'number':'one'}})
@@ -70,6 +81,16 @@ class TranslationTest(unittest.TestCase):
         c = Context({})
         self.assertTrue(c.check({'count':100}, {}, self.ru), 'Empty context - right anyway')
 
+    def test_context_matches(self):
+        results = {}
+        few = Context({"count":{"number":"few"}})
+        one = Context({"count":{"number":"one"}})
+        self.assertFalse(few.matches({'count':1}, {}, self.ru, results), '1 is not few')
+        self.assertEquals({('count', 'number', 'ru'): 'one'}, results, 'pair evaluated')
+        self.assertTrue(one.matches({'count':1000}, {}, self.ru, results), 'evaluated pair is reused')
+        self.assertFalse(few.matches({}, {}, self.ru, {}), 'no exception for missed token')
+        self.assertTrue(Context({}).matches({}, {}, self.ru, {}), 'Empty context - right anyway')
+
     @patch('tml.token.data.is_language_cases_enabled', return_value=True)
     def test_tranlation(self, _):
         url = 'translation_keys/8ad5a7fe0a12729764e31a1e3ca80059/translations'
@@ -37,6 +37,7 @@ from .context import (AbstractContext,
                       SourceContext,
                       SnapshotContext)
 from .api.snapshot import open_snapshot
+from .release import preload
 from .render import RenderEngine
 from .utils import enable_warnings, contextmanager
 from .session_vars import get_current_context
@@ -140,6 +141,28 @@ def tr(label, data = {}, description = '', options = {}):
     return value
 
 
+def tr_many(items, data=None, description='', options=None):
+    """ Translate many labels in one call
+        Args:
+            items (list): labels, (label, data, description, options) tuples
+                or dicts with these keys
+            data (dict): default user data
+            description (string): default description
+            options (dict): options for all items
+        Returns:
+            list: translated values in items order
+    """
+    context = get_context()
+    ret = []
+    for _, value, error in context.tr_many(items, data, description, options):
+        if error is not None:
+            get_logger().error(error)
+        ret.append(value)
+    return ret
+
+tr_batch = tr_many
+
+
 @contextmanager
 def with_block_options(**options):
     """Override default context/session attributes to simplify testing and sometimes used as value added for tml."""
@@ -24,6 +24,7 @@ __author__ = 'a@toukmanov.ru'
 
 from ..exceptions import Error
 from ..logger import LoggerMixin
+from ..cache import PRELOADED
 from six import iteritems
 
 class AbstractClient(object):
@@ -39,8 +40,52 @@ class AbstractClient(object):
             Returns:
                 dict: response
         """
+        data = self.preloaded(kwargs.get('opts', None))
+        if data is not None:
+            return data
         return self.call(url, 'get', **kwargs)
 
+    def get_many(self, requests):
+        """ Several GET requests, cached ones are fetched in bulk
+            by clients with cache
+            Args:
+                requests (list): (url, params, opts) tuples
+            Returns:
+                list: responses (None for failed request)
+        """
+        return [self.get_or_none(url, params=params, opts=opts)
+                for url, params, opts in requests]
+
+    def get_or_none(self, url, **kwargs):
+        try:
+            return self.get(url, **kwargs)
+        except APIError:
+            return None
+
+    def preloaded(self, opts):
+        """ Data of preloaded release for cache key (see tml.release.preload)
+            Args:
+                opts (dict): request options
+            Returns:
+                dict or None
+        """
+        cache_key = opts.get('cache_key', None) if opts else None
+        if cache_key is None:
+            return None
+        return PRELOADED.get(cache_key)
+
+    def preloaded_application(self, key):
+        """ Application built by tml.release.preload
+            Args:
+                key (string): application key
+            Returns:
+                application.Application or None
+        """
+        application = PRELOADED.application
+        if application is None or application.key != key:
+            return None
+        return application
+
     def post(self, url, **kwargs):
         """ POST request to API
             Args:
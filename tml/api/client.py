@@ -23,23 +23,94 @@
 from __future__ import absolute_import
 __author__ = 'a@toukmanov.ru, xepa4ep'
 
+import os
 import sys
 import time
+import threading
 import requests
 import contextlib
 import json
 from requests import Response
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
 import six
 from ..utils import read_gzip, pj, interval_timestamp, ts
 from ..config import CONFIG
 from ..logger import get_logger
-from ..cache import CachedClient
+from ..cache import CachedClient, VERSION_POLLER
 from ..logger import LoggerMixin
 from ..session_vars import get_current_translator
 from . import AbstractClient, APIError, ClientError
 
 
+HTTP_DEFAULTS = {
+    'pool_connections': 4,   # hosts to keep pools for
+    'pool_size': 10,         # connections per host
+    'keep_alive': True,
+    'connect_timeout': 5,
+    'read_timeout': 30,
+    'max_retries': 0,
+    'user_agent': None}      # tml-python v<__VERSION__> by default
+
+_sessions = {}   # pid -> requests.Session
+_sessions_lock = threading.Lock()
+
+
+def http_config():
+    """ HTTP settings from CONFIG.application (HTTP_DEFAULTS are used for missing ones) """
+    return dict((name, CONFIG.application.get(name, default))
+                for name, default in six.iteritems(HTTP_DEFAULTS))
+
+
+def user_agent():
+    """ Default User-Agent: package version """
+    from .. import __VERSION__   # package imports client module
+    return 'tml-python v%s' % __VERSION__
+
+
+def build_session(config=None):
+    """ requests session with pooled keep-alive connections
+        Args:
+            config (dict): HTTP settings (see http_config)
+        Returns:
+            requests.Session
+    """
+    config = config or http_config()
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=config['pool_connections'],
+                          pool_maxsize=config['pool_size'],
+                          max_retries=config['max_retries'])
+    session.mount('http://', adapter)
+    session.mount('https://', adapter)
+    session.headers.update({'user-agent': config['user_agent'] or user_agent(),
+                            'accept': 'application/json',
+                            'accept-encoding': 'gzip, deflate'})
+    if not config['keep_alive']:
+        session.headers['connection'] = 'close'
+    return session
+
+
+def get_session():
+    """ Session of current process: connections are never shared with forked children """
+    pid = os.getpid()
+    session = _sessions.get(pid, None)
+    if session is None:
+        with _sessions_lock:
+            if pid not in _sessions:
+                _sessions.clear()   # inherited from parent process
+                _sessions[pid] = build_session()
+            session = _sessions[pid]
+    return session
+
+
+def reset_sessions():
+    """ Close pooled connections (e.g. after HTTP settings change) """
+    with _sessions_lock:
+        for session in _sessions.values():
+            session.close()
+        _sessions.clear()
+
+
 class CacheFallbackMixin(object):
 
     @property
@@ -74,6 +145,9 @@ class CacheFallbackMixin(object):
             return
         if not CONFIG.cache_enabled():
             return False
+        if VERSION_POLLER.enabled():   # version is kept up to date in background
+            VERSION_POLLER.start(self.refresh_cache_version)
+            return
         cur_version = self.cache.version.fetch()
         if cur_version == 'undefined':
             self.cache.store_version(self.get_cache_version())
@@ -82,6 +156,19 @@ class CacheFallbackMixin(object):
         self.debug('Version: %s', self.cache.version)
         return
 
+    def refresh_cache_version(self):
+        """ Re-read version from cache, ask CDN if it is expired (see VERSION_POLLER)
+            Returns:
+                string: current version
+        """
+        version = self.cache.version
+        current = version.peek()
+        if current == 'undefined':
+            version.store(self.get_cache_version())
+        else:
+            version.set(current)
+        return version.version
+
     # cache is enabled if: get and cache enabled and cache_key
     def should_enable_cache(self, method, opts=None):
         opts = {} if not opts else opts
@@ -116,8 +203,44 @@ class Client(LoggerMixin, CacheFallbackMixin, AbstractClient):
             Returns:
                 dict: response
         """
+        if not self.is_live_api_request():
+            data = self.preloaded(kwargs.get('opts', None))
+            if data is not None:
+                return data
         return self.call(url, 'get', **kwargs)
 
+    def preloaded_application(self, key):
+        if self.is_live_api_request():
+            return None
+        return super(Client, self).preloaded_application(key)
+
+    def get_many(self, requests):
+        """ Several GET requests, cached ones are fetched
+            with one cache round trip
+            Args:
+                requests (list): (url, params, opts) tuples
+            Returns:
+                list: responses
+        """
+        if self.is_live_api_request() or not CONFIG.cache_enabled():
+            return super(Client, self).get_many(requests)
+        ret = [self.preloaded(opts) for _, _, opts in requests]
+        pending = [i for i, (_, _, opts) in enumerate(requests)
+                   if ret[i] is None and self.should_enable_cache('get', opts)]
+        if pending:
+            self.verify_cache_version()
+            if self.cache.version.is_valid():
+                found = self.cache.fetch_many(
+                    [requests[i][2]['cache_key'] for i in pending],
+                    opts={'miss_callback': self.on_miss})
+                for i in pending:
+                    key = requests[i][2]['cache_key']
+                    ret[i] = found.get(key, None) or {'results': {}}
+        for i, (url, params, opts) in enumerate(requests):
+            if ret[i] is None:
+                ret[i] = self.get_or_none(url, params=params, opts=opts)
+        return ret
+
     def post(self, url, **kwargs):
         """ POST request to API
             Args:
@@ -152,7 +275,7 @@ class Client(LoggerMixin, CacheFallbackMixin, AbstractClient):
         url = pj(CONFIG.cdn_host(), uri)
         try:
             with self.trace_call(url, method, params):
-                response = requests.request(method, url, **self._request_config(method, params))
+                response = get_session().request(method, url, **self._request_config(method, params))
                 return self.process_response(response, opts)
         except HTTPError as e:
             self.debug("HTTP RESPONSE ERROR for request %s", e.response.url)
@@ -198,13 +321,12 @@ class Client(LoggerMixin, CacheFallbackMixin, AbstractClient):
             params['access_token'] = self.access_token
 
         with self.trace_call(url, method, params):
-            return requests.request(method, url, **self._request_config(method, params))
+            return get_session().request(method, url, **self._request_config(method, params))
 
     def _request_config(self, method, params):
-        headers = {'user-agent': 'tml-python v0.0.1',
-                   'accept': 'application/json',
-                   'accept-encoding': 'gzip, deflate'}
-        config = {'timeout': 30, 'headers': headers}
+        http = http_config()
+        headers = {}   # common ones are set by session
+        config = {'timeout': (http['connect_timeout'], http['read_timeout']), 'headers': headers}
         params = {k: str(v).lower() if type(v) is bool else v
                   for k, v in six.iteritems(params)}
         if method == 'post':
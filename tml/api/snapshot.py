@@ -21,14 +21,21 @@
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 from __future__ import absolute_import
+import io
+import os
 import re
+import mmap
+import struct
+import threading
 from codecs import open
 from ..strings import to_string
 from . import AbstractClient, APIError
 from tarfile import TarFile
-from json import loads
+from json import loads, dumps
 from os.path import isdir, exists
 from ..exceptions import Error
+from ..utils import LRUCache
+from ..cache_adapters.codecs import get_codec, decode, MAGIC as CODEC_MAGIC, CODECS_BY_ID
 
 __author__ = 'xepa4ep, a@toukmanov.ru'
 
@@ -38,16 +45,22 @@ REWRITE_RULES = (
     (r'^languages\/(\w+)\/definition$', '%(0)s/language')
 )
 
+# (pattern, compiled regex, replacer):
+COMPILED_REWRITE_RULES = tuple((pattern, re.compile(pattern), replacer)
+                               for pattern, replacer in REWRITE_RULES)
+
 
 class SnapshotDir(AbstractClient):
     """ Client which works with a snapshot """
-    def __init__(self, path):
+    def __init__(self, path, cache_size=None):
         """ .ctor
             Args:
                 path (string): path to dir with snapshot
+                cache_size (int): keep up to cache_size decoded results
         """
         super(SnapshotDir, self).__init__()
         self.path = path
+        self.cache = LRUCache(cache_size) if cache_size else None
 
     def call(self, url, method, params = None, opts=None):
         """ Make request to API
@@ -65,10 +78,19 @@ class SnapshotDir(AbstractClient):
                                        url,
                                        params)
         try:
-            return self.fetch(SnapshotDir.rewrite_path(url))
+            return self.cached_fetch(SnapshotDir.rewrite_path(url))
         except Exception as invalid_path:
             raise APIError(invalid_path, self, url)
 
+    def cached_fetch(self, path):
+        """ Fetch data, decoded results are kept if cache is enabled """
+        if self.cache is None:
+            return self.fetch(path)
+        data = self.cache.get(path)
+        if data is None:
+            data = self.cache.set(path, self.fetch(path))
+        return data
+
     def fetch(self, path):
         """ Fetch data for path from file """
         path = '%s/%s.json' % (self.path, path)
@@ -83,11 +105,11 @@ class SnapshotDir(AbstractClient):
             Returns:
                 string: path in snapshot matches API URL
         """
-        for pattern, replacer in REWRITE_RULES:
+        for pattern, regex, replacer in COMPILED_REWRITE_RULES:
             if pattern == url:  # if equal
                 return replacer
             else: # if match by regex
-                match_obj = re.compile(pattern).match(url)
+                match_obj = regex.match(url)
                 if not match_obj:
                     continue
                 ctx = dict([(str(idx), v) for idx, v
@@ -105,33 +127,146 @@ class MethodIsNotSupported(APIError):
 
 class SnapshotFile(SnapshotDir):
     """ .tar.gz snapshot file """
+    _file = None
+    _pid = None
+
+    def __init__(self, path, cache_size=None):
+        super(SnapshotFile, self).__init__(path, cache_size)
+        self.members = {}
+        self._lock = threading.Lock()
+
     @property
     def file(self):
-        """ Open tar file on demand """
-        return TarFile.open(self.path, 'r')
+        """ Tar file opened once (per process) with member index """
+        if self._file is None or self._pid != os.getpid():
+            self._file = TarFile.open(self.path, 'r')
+            self._pid = os.getpid()
+            self.members = dict((member.name, member) for member in self._file.getmembers())
+        return self._file
 
     def fetch(self, path):
         fp = None
-        try:
-            fp = self.file.extractfile('%s.json' % path)
-            ret = loads(fp.read().decode('utf-8'))
-            return ret
-        finally:
-            if fp:
-                fp.close()
+        with self._lock:   # members share file position
+            try:
+                tar = self.file
+                fp = tar.extractfile(self.members['%s.json' % path])
+                raw = fp.read()
+            finally:
+                if fp:
+                    fp.close()
+        return loads(raw.decode('utf-8'))
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+# Indexed snapshot: header (magic, index offset, index length), payloads
+# encoded by cache codecs, JSON index {key: [offset, length, codec]}:
+INDEXED_MAGIC = b'TMLSNAP1'
+INDEXED_HEADER = struct.Struct('>8sQQ')
+INDEXED_EXT = '.snapshot'
+
+
+class IndexedSnapshot(SnapshotDir):
+    """ Single file snapshot read through mmap: O(1) lookup, page cache is
+        shared by worker processes """
+    def __init__(self, path, cache_size=None):
+        super(IndexedSnapshot, self).__init__(path, cache_size)
+        with io.open(path, 'rb') as fp:
+            self.mmap = mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, index_offset, index_length = INDEXED_HEADER.unpack(self.mmap[:INDEXED_HEADER.size])
+        if magic != INDEXED_MAGIC:
+            raise Error('%s is not indexed snapshot' % path)
+        self.index = loads(self.mmap[index_offset:index_offset + index_length].decode('utf-8'))
+
+    def fetch(self, path):
+        offset, length, _ = self.index[path]
+        return decode(self.mmap[offset:offset + length])
+
+    def keys(self):
+        return list(self.index)
+
+    def close(self):
+        self.mmap.close()
+
+    @classmethod
+    def is_indexed(cls, path):
+        with io.open(path, 'rb') as fp:
+            return fp.read(len(INDEXED_MAGIC)) == INDEXED_MAGIC
+
+
+def snapshot_members(path):
+    """ Raw JSON files of snapshot dir or .tar.gz
+        Yields:
+            tuple: key, raw json
+    """
+    if isdir(path):
+        for dirpath, _, filenames in os.walk(path):
+            for filename in sorted(filenames):
+                if filename.endswith('.json'):
+                    full_path = os.path.join(dirpath, filename)
+                    key = os.path.relpath(full_path, path)[:-5].replace(os.sep, '/')
+                    with io.open(full_path, 'rb') as fp:
+                        yield key, fp.read()
+        return
+    with TarFile.open(path, 'r') as tar:
+        for member in tar:
+            if member.isfile() and member.name.endswith('.json'):
+                fp = tar.extractfile(member)
+                try:
+                    key = member.name[:-5]
+                    yield key[2:] if key.startswith('./') else key, fp.read()
+                finally:
+                    fp.close()
+
+
+def convert_snapshot(source, target=None, codec=None):
+    """ Convert snapshot dir or .tar.gz release into indexed snapshot
+        Args:
+            source (string): snapshot dir or .tar.gz
+            target (string): indexed snapshot path (source + .snapshot)
+            codec (string): payload codec (see cache_adapters.codecs)
+        Returns:
+            string: target path
+    """
+    if target is None:
+        target = re.sub(r'(\.tar\.gz|\.tgz)?/*$', '', source) + INDEXED_EXT
+    codec = get_codec(codec)
+    index = {}
+    tmp_path = '%s.%s.tmp' % (target, os.getpid())
+    with io.open(tmp_path, 'wb') as fp:
+        fp.write(INDEXED_HEADER.pack(INDEXED_MAGIC, 0, 0))
+        offset = INDEXED_HEADER.size
+        for key, raw in snapshot_members(source):
+            payload = raw if codec.name == 'json' else codec.encode(loads(raw.decode('utf-8')))
+            codec_name = CODECS_BY_ID[payload[1:2]].name if payload[:1] == CODEC_MAGIC else 'json'
+            index[key] = [offset, len(payload), codec_name]
+            fp.write(payload)
+            offset += len(payload)
+        index_data = dumps(index, sort_keys=True).encode('utf-8')
+        fp.write(index_data)
+        fp.seek(0)
+        fp.write(INDEXED_HEADER.pack(INDEXED_MAGIC, offset, len(index_data)))
+    os.rename(tmp_path, target)
+    return target
 
 
-def open_snapshot(path):
+def open_snapshot(path, cache_size=None):
     """ Open snapshot file or directory
         Args:
             path (string): path to file or dir
+            cache_size (int): keep up to cache_size decoded results
         Returns:
-            SnapshotDir|SnapshotFile
+            SnapshotDir|SnapshotFile|IndexedSnapshot
     """
     if not exists(path):
         raise Error('Snapshot %s does not exists' % path)
     if isdir(path):
-        return SnapshotDir(path)
+        return SnapshotDir(path, cache_size)
+    elif IndexedSnapshot.is_indexed(path):
+        return IndexedSnapshot(path, cache_size)
     else:
-        return SnapshotFile(path)
+        return SnapshotFile(path, cache_size)
 
@@ -23,10 +23,13 @@
 
 __author__ = 'a@toukmanov.ru, xepa4ep'
 
+from copy import copy
 from six import iteritems
 from .exceptions import Error
-from .language import Language
+from .language import Language, REGISTRY as LANGUAGES_REGISTRY
 from .source import SourceTranslations
+from .dictionary.source import SourceDictionary
+from .api import APIError
 from .config import CONFIG
 from .session_vars import get_current_translator
 from .logger import get_logger
@@ -60,6 +63,7 @@ class Application(object):
         self.client = client or self.build_default_client()
         self.key = key
         self.sources = {}
+        self.expected_sources = set()
         self.languages_by_locale = {}
         self.languages = [Language.from_dict(self, lang_meta) for lang_meta in languages or []]
         self.default_locale = default_locale
@@ -112,6 +116,9 @@ class Application(object):
             Returns:
                 Application
         """
+        preloaded = client.preloaded_application(key)
+        if preloaded is not None:   # see tml.release.preload
+            return preloaded.fork(client)
         default_dict = {'key': key}
         app_dict = client.get(
             'projects/%s/definition' % key,
@@ -126,6 +133,40 @@ class Application(object):
             application.add_language(Language.load_default(application, locale))
         return application
 
+    def fork(self, client):
+        """ Request copy sharing compiled languages and sources
+            Args:
+                client (api.client.Client): API client of request
+            Returns:
+                Application
+        """
+        app = copy(self)
+        app.client = client
+        app.missed_keys = MissedKeys(client)
+        app.expected_sources = set()
+        languages = {}   # id -> language bound to copy
+
+        def fork_language(language):
+            if id(language) not in languages:
+                languages[id(language)] = copy(language)
+                languages[id(language)].application = app
+            return languages[id(language)]
+
+        app.languages = [fork_language(language) for language in self.languages]
+        app.languages_by_locale = dict((locale, fork_language(language))
+                                       for locale, language in iteritems(self.languages_by_locale))
+        app.sources = {}
+        for source, source_translations in iteritems(self.sources):
+            forked = app.sources[source] = SourceTranslations(source, app)
+            forked.ignored_keys = set(source_translations.ignored_keys)
+            for locale, dictionary in iteritems(source_translations.cache):
+                forked.cache[locale] = copy(dictionary)   # translations are shared
+                forked.cache[locale].language = fork_language(dictionary.language)
+        translator = get_current_translator()
+        if translator is not None:
+            translator.set_application(app)
+        return app
+
     def load_extensions(self, extensions):
         """Load application extensions if any"""
         if not extensions:
@@ -134,7 +175,8 @@ class Application(object):
         for locale, data in iteritems(extensions.get('languages', {})):
             if self.default_locale != locale:
                 source_locale = locale
-            self.languages_by_locale[locale] = Language.from_dict(self, data)
+            self.languages_by_locale[locale] = Language.from_dict(
+                self, data, registry_key=LANGUAGES_REGISTRY.build_key(self, locale))
         for source, data in iteritems(extensions.get('sources', {})):
             self.sources.setdefault(
                 source,
@@ -202,8 +244,100 @@ class Application(object):
                 dictionary.SourceDictionary or None"""
         source_translations = self.sources.get(source, None)
         if not source_translations:
-            source_translations = self.sources[source] = SourceTranslations(source, self)
-        return source_translations.add_locale(locale, **init_kwargs).hashtable_by_locale(locale)
+            source_translations = SourceTranslations(source, self)
+            self.sources[source] = source_translations
+        if (init_kwargs.get('results', None) is None and
+                not self.has_source(source, locale)):
+            results = self.fetch_sources([source], locale)
+            init_kwargs['results'] = results[source]
+        source_translations.add_locale(locale, **init_kwargs)
+        return source_translations.hashtable_by_locale(locale)
+
+    def has_source(self, source, locale):
+        return (source in self.sources and
+                self.sources[source].hashtable_by_locale(locale) is not None)
+
+    def expect_sources(self, sources):
+        """ Sources fetched together with next missed source
+            (e.g. all sources of page)
+            Params:
+                sources (list) - source names"""
+        self.expected_sources.update(sources or [])
+
+    def fetch_sources(self, sources, locale):
+        """ Fetch translations of sources and expected ones
+            with one cache round trip
+            Params:
+                sources (list) - source names
+                locale (string) - locale e.g. ru
+            Returns:
+                dict: source -> translations ({} if failed)"""
+        language = self.language(locale=locale, fallback_to_dummy=False)
+        expected = [source for source in self.expected_sources
+                    if source not in sources and
+                    not self.has_source(source, locale)]
+        names = list(sources) + expected
+        results = self.client.get_many(
+            [SourceDictionary.query(name, language) for name in names])
+        ret = {}
+        for name, result in zip(names, results):
+            ret[name] = ({} if result is None
+                         else result.get('results', result))
+        for name in expected:
+            self.source(name, locale, results=ret[name])
+        return ret
+
+    def load_sources(self, sources, locale):
+        """ Load translations of several sources with one cache round trip
+            Params:
+                sources (list) - source names
+                locale (string) - locale e.g. ru
+            Returns:
+                list: dictionary.SourceDictionary for each source"""
+        pending = [source for source in sources
+                   if not self.has_source(source, locale)]
+        if pending:
+            fetched = self.fetch_sources(pending, locale)
+            for source, results in iteritems(fetched):
+                if not self.has_source(source, locale):
+                    self.source(source, locale, results=results)
+        return [self.source(source, locale) for source in sources]
+
+    def load_languages(self, locales):
+        """ Load definitions of several languages with one cache round trip
+            (e.g. selected and default language used for fallback)
+            Params:
+                locales (list) - locales, base locale is used
+                    for unsupported region"""
+        pending = {}   # locale -> supported locale
+        for locale in locales:
+            locale = self._normalize_locale(locale)
+            if self.languages_by_locale.get(locale, None):
+                continue
+            target = self.supported_locale(locale)
+            if target is not None:
+                pending[locale] = target
+        if not pending:
+            return
+        targets = sorted(set(pending.values()))
+        results = dict(zip(targets, self.client.get_many(
+            [Language.query(self, target) for target in targets])))
+        for locale, target in iteritems(pending):
+            if results[target] is not None:
+                registry_key = LANGUAGES_REGISTRY.build_key(self, target)
+                self.languages_by_locale.setdefault(locale, Language.from_dict(
+                    self, results[target], registry_key=registry_key))
+
+    def supported_locale(self, locale):
+        """ Locale or its base locale supported by app
+            (None if not supported) """
+        for candidate in (locale, locale.split('-')[0]):
+            try:
+                self.get_language_url(candidate)
+                return candidate
+            except LanguageNotSupported:
+                pass
+        return None
 
     def verify_source_path(self, source_key, source_path):
         # 1. cache enabled and TM turned off
@@ -263,7 +397,14 @@ class Application(object):
         return get_logger()
 
     def register_missing_key(self, key, source_path):
-        self.missed_keys.append(key, source_path)
+        self.register_missing_keys([key], source_path)
+
+    def register_missing_keys(self, keys, source_path):
+        """ Register missed keys, submit once in interactive mode """
+        if not keys:
+            return
+        for key in keys:
+            self.missed_keys.append(key, source_path)
         if CONFIG.is_interactive_mode():
             self.flush()
 
@@ -1,32 +1,75 @@
 from __future__ import absolute_import
 # encoding: UTF-8
 import os
-from six import string_types
+import json
+import threading
+import time
+from six import string_types, iteritems
+from six.moves import queue
 from importlib import import_module
 from types import FunctionType
 from six.moves.urllib.parse import urlencode
 from .base import SingletonMixin
 from .config import CONFIG
-from .utils import interval_timestamp, ts, rel
+from .utils import interval_timestamp, ts, rel, LRUCache, approx_size
 from .logger import LoggerMixin, get_logger
 
 
 __author__ = 'a@toukmanov.ru, xepa4ep'
 
 
+# Negative entry: key is known to be missing on CDN (kept negative_ttl seconds)
+MISSING = {'__tml_missing__': True}
+NEGATIVE_TTL = 60
+
+
+def is_missing(data):
+    return isinstance(data, dict) and data.get('__tml_missing__', False) is True
+
+
 class CacheVersion(LoggerMixin):
 
-    version = None
     cache = None
+    _version = None
+    previous = None   # last valid version before current one
 
     CACHE_VERSION_KEY = 'current_version'
 
+    listeners = []   # callbacks (old_version, new_version) called on change
+
     def __init__(self, cache, version=None, key=None):
         self.cache = cache
         self.version = version
         self._key = self.CACHE_VERSION_KEY if key is None else key
         super(CacheVersion, self).__init__()
 
+    @classmethod
+    def subscribe(cls, callback):
+        """ Notify callback on every version change
+            Args:
+                callback (function): callback(old_version, new_version)
+        """
+        if callback not in cls.listeners:
+            cls.listeners.append(callback)
+
+    @classmethod
+    def unsubscribe(cls, callback):
+        if callback in cls.listeners:
+            cls.listeners.remove(callback)
+
+    @property
+    def version(self):
+        return self._version
+
+    @version.setter
+    def version(self, new_version):
+        old_version, self._version = self._version, new_version
+        if old_version != new_version:
+            if str(old_version) not in ('undefined', '0', 'None'):
+                self.previous = old_version
+            for callback in list(self.listeners):
+                callback(old_version, new_version)
+
     def set(self, new_version):
         self.version = new_version
 
@@ -56,6 +99,11 @@ class CacheVersion(LoggerMixin):
             return version['version']
 
     def fetch(self):
+        self.version = self.peek()
+        return self.version
+
+    def peek(self):
+        """ Version stored in cache ('undefined' if expired), current one is kept """
 
         def on_miss(_):
             return {'version': CONFIG.cache.get('version', 'undefined'),
@@ -63,8 +111,8 @@ class CacheVersion(LoggerMixin):
 
         version_obj = self.cache.fetch(self._key,
                                        opts={'miss_callback': on_miss})
-        version_obj['version'] = self.version = self.validate_version(version_obj)
-        return self.version
+        version_obj['version'] = self.validate_version(version_obj)
+        return version_obj['version']
 
     def store(self, new_version):
         self.version = new_version
@@ -86,14 +134,567 @@ class CacheVersion(LoggerMixin):
     def is_valid(self):
         return not self.is_invalid()
 
-    def versioned_key(self, key, namespace=''):
-        version = '' if key == self._key else '_v#%s' % self.version
+    def versioned_key(self, key, namespace='', version=None):
+        if version is None:
+            version = self.version
+        version = '' if key == self._key else '_v#%s' % version
         return "tml_%s:%s_%s" % (namespace, version, key)
 
     def __str__(self):
         return self.version
 
 
+class VersionPoller(LoggerMixin):
+    """ Refreshes cache version in background (daemon) thread, so requests
+        read it from memory. Changes are published to CacheVersion listeners.
+        Disabled by CONFIG.cache['poll_version'] = False.
+    """
+    # Stored version is re-read several times per version_check_interval:
+    # its expiry or invalidation (release, upgrade by other process) is
+    # seen soon after, not up to a whole interval later.
+    POLLS_PER_INTERVAL = 10
+
+    def __init__(self):
+        super(VersionPoller, self).__init__()
+        self.refresh = None
+        self.interval = None
+        self.last_refresh = None
+        self._thread = None
+        self._pid = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def enabled(cls):
+        return CONFIG.cache_enabled() and CONFIG.cache.get('poll_version', True)
+
+    def running(self):
+        """ Poller thread is alive in current process """
+        self._forget_parent()
+        return self._thread is not None and self._thread.is_alive()
+
+    def _forget_parent(self):
+        """ Drop state copied from parent by fork (its thread and lock) """
+        if self._pid is not None and self._pid != os.getpid():
+            self._thread = None
+            self._pid = None
+            self._stop = threading.Event()
+            self._lock = threading.Lock()
+
+    def start(self, refresh, interval=None):
+        """ Refresh version now and then every interval in background
+            Args:
+                refresh (function): loads version, e.g. Client.refresh_cache_version
+                interval (float): seconds (by default
+                    CONFIG.version_check_interval / POLLS_PER_INTERVAL)
+            Returns:
+                boolean: False if already running
+        """
+        self._forget_parent()   # lock may be held by parent at fork time
+        with self._lock:
+            if self.running():
+                return False
+            self.refresh = refresh
+            self.interval = interval or (
+                float(CONFIG['version_check_interval']) /
+                self.POLLS_PER_INTERVAL)
+            self._stop = threading.Event()
+            self.poll()
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self.run, name='tml-version-poller')
+            self._thread.daemon = True
+            self._thread.start()
+            return True
+
+    def run(self):
+        stop = self._stop
+        while not stop.wait(self.interval):
+            self.poll()
+
+    def poll(self):
+        try:
+            version = self.refresh()
+        except Exception as e:
+            self.debug('Cache version refresh failed: %s', e)
+            return None
+        self.last_refresh = time.time()
+        return version
+
+    def stop(self):
+        self._stop.set()
+        if self.running():
+            self._thread.join()
+        self._thread = None
+        self._pid = None
+
+
+VERSION_POLLER = VersionPoller()
+
+
+class Flight(object):
+    """ Load in progress, shared by waiting threads """
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+
+
+class SingleFlight(object):
+    """ Coalesces concurrent cache misses (see `CachedClient.load_adapter`):
+        one thread per versioned key calls miss_callback, others wait for it.
+        With CONFIG.cache['miss_lock'] processes coordinate by short-TTL lock
+        key (memcached/django add, redis SET NX).
+    """
+    flights = {}   # versioned key -> Flight
+    flights_lock = threading.Lock()
+    flight_stats = {'loads': 0, 'coalesced': 0,
+                    'lock_waits': 0, 'lock_hits': 0, 'lock_timeouts': 0,
+                    'stale_hits': 0, 'previous_hits': 0,
+                    'revalidations': 0, 'revalidation_errors': 0,
+                    'negative_hits': 0, 'negative_stores': 0}
+
+    LOCK_TTL = 10   # seconds
+    LOCK_POLL = 0.05
+
+    def fetch(self, key, opts=None):
+        miss_callback = opts.get('miss_callback', None) if opts else None
+        if not callable(miss_callback):
+            return self.found(key, self.read_cached(key, opts), opts)
+        opts = dict(opts, miss_callback=None)
+        data = self.read_cached(key, opts)
+        if data is None:
+            return self.single_flight(key, lambda: self.load_miss(key, miss_callback, opts), opts)
+        return self.found(key, data, opts)
+
+    def found(self, key, data, opts=None):
+        """ Cached data, None for negative entry (CDN call is avoided) """
+        if is_missing(data):
+            self.count('negative_hits')
+            self.remember_missing(key, opts)
+            return None
+        return data
+
+    def read_cached(self, key, opts=None):
+        """ Cached data without miss callback """
+        return self._call(super(SingleFlight, self).fetch, key, opts=opts)
+
+    def single_flight(self, key, loader, opts=None):
+        """ Run loader once for concurrent callers
+            Args:
+                key (string): cache key
+                loader (function): loads data
+            Returns:
+                loaded data
+        """
+        flight_key = self.versioned_key(key, opts)
+        with self.flights_lock:
+            flight = self.flights.get(flight_key, None)
+            leader = flight is None
+            if leader:
+                flight = self.flights[flight_key] = Flight()
+            self.count('loads' if leader else 'coalesced')
+        if not leader:
+            flight.done.wait(self.lock_ttl())
+            return flight.result
+        try:
+            flight.result = loader()
+            return flight.result
+        finally:
+            with self.flights_lock:
+                self.flights.pop(flight_key, None)
+            flight.done.set()
+
+    def load_miss(self, key, miss_callback, opts=None):
+        """ Call miss callback and store result, wait for other process if it loads key """
+        lock_key = None
+        if CONFIG.cache.get('miss_lock', False) and not self.read_only():
+            lock_key = '%s:lock' % key
+            if not self.add_lock(lock_key, self.lock_ttl()):
+                data = self.wait_for_other(key, opts)
+                if data is not None:
+                    return data
+                lock_key = None
+        try:
+            data = miss_callback(key)
+            if data is None:
+                self.store_missing(key, opts)
+            elif not self.read_only():
+                self.store(key, data)
+            return data
+        finally:
+            if lock_key:
+                self.delete(lock_key)
+
+    def wait_for_other(self, key, opts=None):
+        self.count('lock_waits')
+        deadline = time.time() + self.lock_ttl()
+        while time.time() < deadline:
+            time.sleep(self.LOCK_POLL)
+            data = self.read_cached(key, opts)
+            if data is not None:
+                self.count('lock_hits')
+                return self.found(key, data, opts)
+        self.count('lock_timeouts')
+        return None
+
+    def store_missing(self, key, opts=None):
+        """ Store negative entry for key missing on CDN """
+        ttl = CachedClient.negative_ttl()
+        if not ttl:
+            return
+        self.count('negative_stores')
+        if self.read_only():
+            self.remember_missing(key, opts)
+        else:
+            self.store(key, MISSING, {'timeout': ttl, 'memory_ttl': ttl})
+
+    def remember_missing(self, key, opts=None):
+        """ Keep negative entry in memory tier (if any) """
+        pass
+
+    def lock_ttl(self):
+        return CONFIG.cache.get('miss_lock_ttl', self.LOCK_TTL)
+
+    @classmethod
+    def count(cls, name):
+        cls.flight_stats[name] += 1
+
+
+class Revalidator(LoggerMixin):
+    """ Background (daemon) worker refreshing stale cache entries,
+        each key is queued once until it is refreshed.
+    """
+    def __init__(self):
+        super(Revalidator, self).__init__()
+        self.pending = set()
+        self._queue = None
+        self._pid = None
+        self._lock = threading.Lock()
+
+    def submit(self, key, task):
+        """ Queue refresh
+            Args:
+                key (string): versioned key
+                task (function): refreshes key
+            Returns:
+                boolean: False if key is already queued
+        """
+        with self._lock:
+            if self._pid != os.getpid():   # not inherited from parent process
+                self.start()
+            if key in self.pending:
+                return False
+            self.pending.add(key)
+        self._queue.put((key, task))
+        return True
+
+    def start(self):
+        self.pending = set()
+        self._queue = queue.Queue()
+        self._pid = os.getpid()
+        thread = threading.Thread(target=self.run, args=(self._queue,),
+                                  name='tml-revalidator')
+        thread.daemon = True
+        thread.start()
+
+    def run(self, tasks):
+        while True:
+            key, task = tasks.get()
+            try:
+                task()
+            except Exception as e:
+                SingleFlight.count('revalidation_errors')
+                self.debug('Cache refresh of %s failed: %s', key, e)
+            finally:
+                with self._lock:
+                    self.pending.discard(key)
+                tasks.task_done()
+
+    def join(self):
+        """ Wait for queued refreshes (testing) """
+        if self._pid == os.getpid():
+            self._queue.join()
+
+
+REVALIDATOR = Revalidator()
+
+
+class StaleWhileRevalidate(SingleFlight):
+    """ Soft/hard TTL per key class (application, language, sources) set by
+        CONFIG.cache['stale'], e.g. {'sources': {'soft': 60, 'hard': 3600}}.
+
+        Entry is stored with hard TTL and soft expiry in envelope. Stale entry
+        (soft TTL passed) is served and refreshed by REVALIDATOR; after hard
+        TTL miss is loaded as usual. Right after version change entries of
+        previous version are served while new ones are loaded.
+    """
+    ENVELOPE = '__tml_expires__'   # [soft, hard] expiry timestamps
+
+    @staticmethod
+    def key_class(key):
+        """ application, language, sources or None """
+        if key == 'application':
+            return 'application'
+        parts = key.split('/')
+        if len(parts) == 2 and parts[1] == 'language':
+            return 'language'
+        if len(parts) > 2 and parts[1] == 'sources':
+            return 'sources'
+        return None
+
+    @classmethod
+    def stale_policy(cls, key):
+        """ dict with soft and hard TTL (seconds) or None """
+        policies = CONFIG.cache.get('stale', None)
+        if not policies:
+            return None
+        return policies.get(cls.key_class(key), None)
+
+    def fetch(self, key, opts=None):
+        miss_callback = opts.get('miss_callback', None) if opts else None
+        if not callable(miss_callback) or self.stale_policy(key) is None:
+            return super(StaleWhileRevalidate, self).fetch(key, opts)
+        opts = dict(opts, miss_callback=None)
+        data, stale = self.read_entry(key, opts)
+        if data is None:
+            data = self.read_previous(key, opts)
+            stale = data is not None
+        if data is None:
+            return self.single_flight(
+                key, lambda: self.load_miss(key, miss_callback, opts), opts)
+        if stale:
+            self.count('stale_hits')
+            self.revalidate(key, miss_callback, opts)
+        return self.found(key, data, opts)
+
+    def read_cached(self, key, opts=None):
+        return self.read_entry(key, opts)[0]
+
+    def read_entry(self, key, opts=None):
+        """ Returns:
+                tuple: data (None if missed or hard expired), is stale
+        """
+        entry = super(StaleWhileRevalidate, self).read_cached(key, opts)
+        return self.unwrap(entry)
+
+    def read_previous(self, key, opts=None):
+        """ Entry of previous cache version (None if missed) """
+        previous = self.version.previous
+        if previous is None or str(previous) == str(self.version.version):
+            return None
+        data = self.unwrap(super(StaleWhileRevalidate, self).read_cached(
+            key, dict(opts or {}, cache_version=previous)))[0]
+        if data is None or is_missing(data):
+            return None
+        self.count('previous_hits')
+        return data
+
+    def is_envelope(self, entry):
+        return isinstance(entry, dict) and self.ENVELOPE in entry
+
+    def unwrap(self, entry):
+        if not self.is_envelope(entry):
+            return entry, False   # stored without policy
+        soft, hard = entry[self.ENVELOPE]
+        now = time.time()
+        if hard <= now:
+            return None, False
+        return entry['data'], soft <= now
+
+    def wrap(self, key, data, opts=None):
+        """ Envelope with expiry and store opts (hard TTL as timeout) """
+        policy = self.stale_policy(key)
+        if (policy is None or data is None or is_missing(data) or
+                self.is_envelope(data)):   # wrapped by store_many
+            return data, opts
+        now = time.time()
+        entry = {self.ENVELOPE: [now + policy['soft'], now + policy['hard']],
+                 'data': data}
+        return entry, dict(opts or {}, timeout=policy['hard'])
+
+    def revalidate(self, key, miss_callback, opts=None):
+        """ Refresh key in background """
+        if self.read_only():
+            return False
+        def refresh():
+            self.count('revalidations')
+            return self.single_flight(
+                key, lambda: self.load_miss(key, miss_callback, opts), opts)
+        return REVALIDATOR.submit(self.versioned_key(key, opts), refresh)
+
+    def store(self, key, data, opts=None):
+        entry, entry_opts = self.wrap(key, data, opts)
+        self._call(super(StaleWhileRevalidate, self).store, key, entry,
+                   opts=entry_opts)
+        return entry['data'] if self.is_envelope(entry) else data
+
+    def store_many(self, mapping, opts=None):
+        if not CONFIG.cache.get('stale', None):
+            return super(StaleWhileRevalidate, self).store_many(mapping, opts)
+        by_timeout = {}   # adapters write batch with one timeout
+        for key, data in iteritems(mapping or {}):
+            entry, entry_opts = self.wrap(key, data, opts)
+            timeout = (entry_opts or {}).get('timeout', None)
+            by_timeout.setdefault(timeout, ({}, entry_opts))[0][key] = entry
+        stats = {'keys': 0, 'bytes': 0, 'batches': 0}
+        for entries, entry_opts in by_timeout.values():
+            batch_stats = super(StaleWhileRevalidate, self).store_many(
+                entries, entry_opts)
+            for name, value in iteritems(batch_stats):
+                stats[name] += value
+        return stats
+
+    def read_many(self, keys, opts=None):
+        found = super(StaleWhileRevalidate, self).read_many(keys, opts)
+        miss_callback = (opts or {}).get('miss_callback', None)
+        ret = {}
+        for key, entry in iteritems(found):
+            data, stale = self.unwrap(entry)
+            if data is None:
+                continue
+            if stale:
+                self.count('stale_hits')
+                if callable(miss_callback):
+                    self.revalidate(key, miss_callback)
+            ret[key] = data
+        return ret
+
+
+class MemoryTier(object):
+    """ In-process L1 tier in front of cache adapter (see `CachedClient.load_adapter`)
+
+        Entries are keyed by versioned key, so version upgrade invalidates them.
+        Configured by CONFIG.cache['memory']: True or dict with size (entries),
+        bytes (total size) and ttl (seconds). Disabled by default: cached
+        objects are shared by all callers, so they must not be edited.
+    """
+    DEFAULTS = {'size': 1000, 'bytes': 64 * 1024 * 1024, 'ttl': 300}
+
+    _memory = None
+    memory_settings = DEFAULTS   # settings at adapter build time
+    memory_expirations = 0
+
+    @classmethod
+    def settings(cls):
+        """ Memory tier settings or None if disabled """
+        settings = CONFIG.cache.get('memory', False)
+        if not settings:
+            return None
+        ret = dict(cls.DEFAULTS)
+        if isinstance(settings, dict):
+            if not settings.get('enabled', True):
+                return None
+            ret.update(settings)
+        return ret
+
+    @property
+    def memory(self):
+        if self._memory is None:
+            settings = self.memory_settings
+            self.memory_ttl = settings['ttl']
+            self._memory = LRUCache(settings['size'], maxbytes=settings['bytes'],
+                                    sizeof=lambda entry: approx_size(entry[1]))
+        return self._memory
+
+    def memory_key(self, key, opts=None):
+        if key == self.version._key:   # version is checked by adapter itself
+            return None
+        return self.versioned_key(key, opts)
+
+    def fetch(self, key, opts=None):
+        memory_key = self.memory_key(key, opts)
+        if memory_key is None:
+            return self._call(super(MemoryTier, self).fetch, key, opts=opts)
+        data = self.fetch_memory(memory_key)
+        if data is None:
+            data = self._call(super(MemoryTier, self).fetch, key, opts=opts)
+            self.remember(memory_key, data, opts)
+        elif is_missing(data):
+            self.count('negative_hits')
+            return None
+        return data
+
+    def fetch_memory(self, memory_key):
+        """ Not expired data from memory (None if missed) """
+        if memory_key is None:
+            return None
+        entry = self.memory.get(memory_key)
+        if entry is None:
+            return None
+        if entry[0] is None or entry[0] > time.time():
+            return entry[1]
+        self.memory.pop(memory_key)
+        self.memory_expirations += 1
+        return None
+
+    def fetch_many(self, keys, opts=None):
+        ret = {}
+        rest = []
+        for key in keys:
+            data = self.fetch_memory(self.memory_key(key, opts))
+            if data is None:
+                rest.append(key)
+            elif is_missing(data):
+                self.count('negative_hits')
+                ret[key] = None
+            else:
+                ret[key] = data
+        if rest:
+            found = super(MemoryTier, self).fetch_many(rest, opts)
+            for key, data in found.items():
+                memory_key = self.memory_key(key, opts)
+                if memory_key is not None:
+                    self.remember(memory_key, data, opts)
+                ret[key] = data
+        return ret
+
+    def store(self, key, data, opts=None):
+        ret = self._call(super(MemoryTier, self).store, key, data, opts=opts)
+        memory_key = self.memory_key(key, opts)
+        if memory_key is not None:
+            self.remember(memory_key, data, opts)
+        return ret
+
+    def store_many(self, mapping, opts=None):
+        stats = super(MemoryTier, self).store_many(mapping, opts)
+        for key, data in iteritems(mapping or {}):
+            memory_key = self.memory_key(key, opts)
+            if memory_key is not None:
+                self.remember(memory_key, data, opts)
+        return stats
+
+    def delete(self, key, opts=None):
+        memory_key = self.memory_key(key, opts)
+        if memory_key is not None:
+            self.memory.pop(memory_key)
+        return self._call(super(MemoryTier, self).delete, key, opts=opts)
+
+    def clear(self):
+        self.memory.clear()
+        return super(MemoryTier, self).clear()
+
+    def remember_missing(self, key, opts=None):
+        memory_key = self.memory_key(key, opts)
+        if memory_key is not None:
+            ttl = CachedClient.negative_ttl()
+            self.remember(memory_key, MISSING, {'memory_ttl': min(ttl, self.memory_settings['ttl'] or ttl)})
+
+    def remember(self, memory_key, data, opts=None):
+        """ Put data into memory, ttl may be set per key by opts['memory_ttl'] """
+        if data is None:
+            return
+        memory = self.memory
+        ttl = (opts or {}).get('memory_ttl', None)
+        if ttl is None:
+            ttl = self.memory_ttl
+        memory.set(memory_key, (time.time() + ttl if ttl else None, data))
+
+    @property
+    def memory_stats(self):
+        stats = self.memory.stats
+        stats['expirations'] = self.memory_expirations
+        return stats
+
+
 class CachedClient(SingletonMixin, LoggerMixin):
 
     default_adapter_module = 'tml.cache_adapters'
@@ -118,10 +719,17 @@ class CachedClient(SingletonMixin, LoggerMixin):
     @classmethod
     def load_adapter(cls, klass, **kwargs):
         def build_cache(klass, *bases):
-            return type(
+            adapter_class = type(
                 klass.__name__,
                 bases + (CachedClient,),
                 dict(klass.__dict__))
+            adapter_class = type(
+                klass.__name__, (StaleWhileRevalidate, adapter_class), {})
+            memory_settings = MemoryTier.settings()
+            if memory_settings:
+                adapter_class = type(klass.__name__, (MemoryTier, adapter_class),
+                                     {'memory_settings': memory_settings})
+            return adapter_class
 
         if type(klass) is FunctionType:
             return klass()
@@ -156,18 +764,134 @@ class CachedClient(SingletonMixin, LoggerMixin):
             ns = CONFIG.access_token(default=CONFIG.application_key())[:5]
         return ns
 
+    @classmethod
+    def negative_ttl(cls):
+        """ Seconds to keep negative entries (0 disables negative caching) """
+        return CONFIG.cache.get('negative_ttl', NEGATIVE_TTL)
+
     def versioned_key(self, key, opts=None):
-        return self.version.versioned_key(key, self.namespace)
+        # e.g. previous version:
+        version = opts.get('cache_version', None) if opts else None
+        return self.version.versioned_key(key, self.namespace, version)
 
     def fetch(self, key, opts=None):
         pass
 
+    def fetch_many(self, keys, opts=None):
+        """ Fetch several keys in one round trip (if adapter supports it)
+            Args:
+                keys (list): cache keys
+                opts (dict): miss_many_callback(keys) -> dict is called once
+                    for all missed keys (miss_callback(key) per key otherwise)
+            Returns:
+                dict: key -> data (None if missed)
+        """
+        found = self.read_many(keys, opts)
+        missed = [key for key in keys if found.get(key, None) is None]
+        if missed:
+            loaded = self.load_missed(missed, opts)
+            negative_ttl = self.negative_ttl() if loaded else None
+            if not self.read_only():
+                for key in missed:
+                    if loaded.get(key, None) is not None:
+                        self.store(key, loaded[key])
+                    elif negative_ttl and key in loaded:   # missing on CDN
+                        SingleFlight.count('negative_stores')
+                        self.store(key, MISSING, {'timeout': negative_ttl, 'memory_ttl': negative_ttl})
+            found.update(loaded)
+        ret = {}
+        for key in keys:
+            data = found.get(key, None)
+            if is_missing(data):
+                SingleFlight.count('negative_hits')
+                data = None
+            ret[key] = data
+        return ret
+
+    def read_many(self, keys, opts=None):
+        """ Cached data for keys, adapters override it with native bulk read
+            Returns:
+                dict: key -> data for hits
+        """
+        ret = {}
+        for key in keys:
+            data = self.fetch(key)
+            if data is not None:
+                ret[key] = data
+        return ret
+
+    def load_missed(self, keys, opts=None):
+        """ Call miss callbacks for missed keys
+            Returns:
+                dict: key -> data
+        """
+        opts = opts or {}
+        if callable(opts.get('miss_many_callback', None)):
+            return opts['miss_many_callback'](keys) or {}
+        if callable(opts.get('miss_callback', None)):
+            return dict((key, opts['miss_callback'](key)) for key in keys)
+        return {}
+
     def store(self, key, data, opts=None):
         pass
 
+    def store_many(self, mapping, opts=None):
+        """ Store several keys, adapters pipeline writes in batches
+            Args:
+                mapping (dict): key -> data
+                opts (dict): timeout, batch_size (keys) and batch_bytes
+                    (CONFIG.cache batch_size/batch_bytes by default)
+            Returns:
+                dict: stats (keys, bytes, batches)
+        """
+        stats = {'keys': 0, 'bytes': 0, 'batches': 0}
+        if mapping and not self.read_only():
+            self.write_many(mapping, stats, opts)
+        return stats
+
+    def write_many(self, mapping, stats, opts=None):
+        """ Store mapping, adapters override it with native bulk write """
+        for batch in self.batches(((key, data, len(json.dumps(data))) for key, data in iteritems(mapping)), stats, opts):
+            for key, data in batch:
+                self.store(key, data, opts)
+
+    def batches(self, items, stats, opts=None):
+        """ Split (key, payload, size) items into batches limited by count and bytes
+            Yields:
+                list: (key, payload) pairs
+        """
+        opts = opts or {}
+        batch_size = opts.get('batch_size', None) or CONFIG.cache.get('batch_size', 100)
+        batch_bytes = opts.get('batch_bytes', None) or CONFIG.cache.get('batch_bytes', 1024 * 1024)
+        batch, size = [], 0
+        for key, payload, payload_size in items:
+            if batch and (len(batch) >= batch_size or size + payload_size > batch_bytes):
+                stats['batches'] += 1
+                yield batch
+                batch, size = [], 0
+            batch.append((key, payload))
+            size += payload_size
+            stats['keys'] += 1
+            stats['bytes'] += payload_size
+        if batch:
+            stats['batches'] += 1
+            yield batch
+
     def delete(self, key, opts=None):
         pass
 
+    def _call(self, method, *args, **kwargs):
+        if kwargs.get('opts', None) is None:   # adapter may not support opts
+            return method(*args)
+        return method(*args, **kwargs)
+
+    def add_lock(self, key, ttl):
+        """ Set key if it does not exist (cross-process lock)
+            Returns:
+                boolean: True if lock is acquired
+        """
+        return True
+
     def exists(self, key, opts=None):
         pass
 
@@ -188,3 +912,43 @@ class CachedClient(SingletonMixin, LoggerMixin):
 
     def _get_version(self):
         return getattr(self, CachedClient.version_attr, None)
+
+
+class PreloadedRelease(object):
+    """ Process wide store of preloaded release data by cache key
+
+        Data is read-only after preload, so it is shared with forked
+        workers (copy-on-write).
+    """
+    def __init__(self):
+        self.version = None
+        self.data = {}
+        self.application = None
+        self._lock = threading.Lock()
+
+    def load(self, version, data, application=None):
+        with self._lock:
+            self.version = str(version)
+            self.data = data
+            self.application = application
+
+    def get(self, cache_key, default=None):
+        return self.data.get(cache_key, default)
+
+    def __contains__(self, cache_key):
+        return cache_key in self.data
+
+    def clear(self):
+        self.load(None, {})
+        self.version = None
+
+    def on_version_change(self, old_version, new_version):
+        """ Drop preloaded data when other release is published """
+        if new_version in (None, 'undefined', '0', 'None') or self.version is None:
+            return
+        if str(new_version) != self.version:
+            self.clear()
+
+
+PRELOADED = PreloadedRelease()   # see tml.release.preload
+CacheVersion.subscribe(PRELOADED.on_version_change)
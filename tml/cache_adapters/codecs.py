@@ -1,4 +1,15 @@
 import json
+import zlib
+import marshal
+import pickle
+from six import text_type
+
+# Encoded payload: MAGIC + codec id (1 byte) + body. Plain JSON payloads
+# (no header) are written by json codec and by older versions.
+MAGIC = b'\xfe'
+
+DEFAULT_THRESHOLD = 1024   # compress payloads larger than (bytes)
+
 
 class JSONCodec(object):
 
@@ -10,3 +21,158 @@ class JSONCodec(object):
 
     def load(self):
         return json.load(self.file)
+
+
+class PayloadCodec(object):
+    """ Cache payload serializer """
+    name = None
+    id = None   # header byte
+
+    def dumps(self, data):
+        raise NotImplementedError()
+
+    def loads(self, body):
+        raise NotImplementedError()
+
+    def encode(self, data):
+        return self.wrap(self.dumps(data))
+
+    def wrap(self, body):
+        """ Add codec header """
+        return MAGIC + self.id + body
+
+
+class JSONPayloadCodec(PayloadCodec):
+    name = 'json'
+    id = b'j'
+
+    def dumps(self, data):
+        return json.dumps(data).encode('utf-8')
+
+    def loads(self, body):
+        return json.loads(body.decode('utf-8'))
+
+    def wrap(self, body):
+        return body   # headerless: readable by older versions
+
+
+class MarshalPayloadCodec(PayloadCodec):
+    """ Fast, but format depends on python version """
+    name = 'marshal'
+    id = b'm'
+
+    def dumps(self, data):
+        return marshal.dumps(data)
+
+    def loads(self, body):
+        return marshal.loads(body)
+
+
+class PicklePayloadCodec(PayloadCodec):
+    """ Use with trusted cache servers only """
+    name = 'pickle'
+    id = b'p'
+
+    def dumps(self, data):
+        return pickle.dumps(data, pickle.HIGHEST_PROTOCOL)
+
+    def loads(self, body):
+        return pickle.loads(body)
+
+
+class CompressedPayloadCodec(PayloadCodec):
+    """ zlib over other codec, small payloads are stored by that codec as is """
+    def __init__(self, codec, id, threshold=DEFAULT_THRESHOLD, level=6):
+        self.codec = codec
+        self.id = id
+        self.name = 'zlib' if codec.name == 'json' else '%s+zlib' % codec.name
+        self.threshold = threshold
+        self.level = level
+
+    def dumps(self, data):
+        return zlib.compress(self.codec.dumps(data), self.level)
+
+    def loads(self, body):
+        return self.codec.loads(zlib.decompress(body))
+
+    def encode(self, data):
+        body = self.codec.dumps(data)
+        if len(body) <= self.threshold:
+            return self.codec.wrap(body)
+        return self.wrap(zlib.compress(body, self.level))
+
+
+JSON = JSONPayloadCodec()
+MARSHAL = MarshalPayloadCodec()
+PICKLE = PicklePayloadCodec()
+
+CODECS = {}       # name -> codec
+CODECS_BY_ID = {}   # header byte -> codec
+
+
+def register(codec):
+    """ Add codec to registry
+        Args:
+            codec (PayloadCodec): codec
+    """
+    CODECS[codec.name] = codec
+    CODECS_BY_ID[codec.id] = codec
+    return codec
+
+
+for codec in (JSON, MARSHAL, PICKLE,
+              CompressedPayloadCodec(JSON, b'z'),
+              CompressedPayloadCodec(MARSHAL, b'M'),
+              CompressedPayloadCodec(PICKLE, b'P')):
+    register(codec)
+
+
+def get_codec(name=None, threshold=None):
+    """ Codec by name (CONFIG.cache['codec'])
+        Args:
+            name (string): json, zlib, marshal, pickle, marshal+zlib, pickle+zlib
+            threshold (int): compress payloads larger than (compressed codecs)
+        Returns:
+            PayloadCodec
+    """
+    codec = CODECS[name or 'json']
+    if threshold is not None and isinstance(codec, CompressedPayloadCodec) and threshold != codec.threshold:
+        codec = CompressedPayloadCodec(codec.codec, codec.id, threshold, codec.level)
+    return codec
+
+
+def allowed_codecs(codec):
+    """ Header bytes adapter configured with codec may decode: codec itself,
+        codec it falls back to for small payloads and json/zlib (safe)
+        Args:
+            codec (PayloadCodec): configured codec
+        Returns:
+            frozenset
+    """
+    ret = set([codec.id, CODECS['json'].id, CODECS['zlib'].id])
+    if isinstance(codec, CompressedPayloadCodec):
+        ret.add(codec.codec.id)
+    return frozenset(ret)
+
+
+def decode(payload, allowed=None):
+    """ Decode payload stored by registered codec
+        Args:
+            payload (bytes): cached value
+            allowed (set): header bytes of allowed codecs (see allowed_codecs),
+                payload of other codec is treated as cache miss
+        Raises:
+            ValueError: unknown codec (allowed is not set)
+        Returns:
+            data or None
+    """
+    if isinstance(payload, text_type):   # legacy json
+        return json.loads(payload)
+    if payload[:1] != MAGIC:
+        return JSON.loads(payload)
+    codec_id = payload[1:2]
+    if allowed is not None and codec_id not in allowed:
+        return None   # e.g. pickle written to shared cache by someone else
+    if codec_id not in CODECS_BY_ID:
+        raise ValueError('Unknown cache payload codec: %r' % codec_id)
+    return CODECS_BY_ID[codec_id].loads(payload[2:])
@@ -1,11 +1,15 @@
 import json
+from six import iteritems
 from tml.config import CONFIG
+from .codecs import get_codec, decode, allowed_codecs
 
 
 class DjangoCacheAdapter(object):
 
-    def __init__(self, backend, params):
+    def __init__(self, backend, params, codec=None):
         self.backend = backend
+        self.codec = codec or get_codec()
+        self.allowed_codecs = allowed_codecs(self.codec)
         self.install(params.copy())
 
     def install(self, params):
@@ -13,7 +17,7 @@ class DjangoCacheAdapter(object):
         params.update({
             'KEY_PREFIX': '',
             'VERSION': '',
-            'KEY_FUNCTION': self.make_key})
+            'KEY_FUNCTION': self.backend_key})
         self._cache = _create_cache(self.backend, **params)
 
     @property
@@ -23,24 +27,29 @@ class DjangoCacheAdapter(object):
     def read_only(self):
         return False
 
-    def make_key(self, key, *args, **kwargs):
-        return self.versioned_key(key)
+    def make_key(self, key, opts=None):
+        """ Versioned key, opts['cache_version'] selects other version """
+        return self.versioned_key(key, opts)
+
+    @staticmethod
+    def backend_key(key, key_prefix, version):
+        return key   # versioned by make_key
 
     def _pickle(self, data):
-        return json.dumps(data)
+        return self.codec.encode(data)
 
     def _unpickle(self, payload):
-        return json.loads(payload)
+        return decode(payload, self.allowed_codecs)   # other codecs are missed
 
     def store(self, key, data, opts=None):
         self.debug('Cache store: %s', key)
         opts = {} if opts is None else opts
         timeout = opts.get('timeout', None)
-        self._cache.set(key, self._pickle(data), timeout)
+        self._cache.set(self.make_key(key, opts), self._pickle(data), timeout)
         return data
 
     def fetch(self, key, opts=None):
-        data = self._cache.get(key)
+        data = self._cache.get(self.make_key(key, opts))
         if data:
             self.debug('Cache hit: %s', key)
             data = self._unpickle(data)
@@ -48,17 +57,36 @@ class DjangoCacheAdapter(object):
             if opts and opts.get('miss_callback', None):
                 if callable(opts['miss_callback']):
                     data = opts['miss_callback'](key)
-            self.store(key, data)
+            if data is not None:
+                self.store(key, data)
             self.debug('Cache miss: %s', key)
         return data
 
+    def read_many(self, keys, opts=None):
+        versioned_keys = dict((self.make_key(key, opts), key) for key in keys)
+        payloads = self._cache.get_many(list(versioned_keys))
+        self.debug('Cache get_many: %s keys, %s hits', len(keys), len(payloads))
+        return dict((versioned_keys[versioned_key], self._unpickle(payload))
+                    for versioned_key, payload in payloads.items() if payload)
+
+    def write_many(self, mapping, stats, opts=None):
+        timeout = (opts or {}).get('timeout', None)
+        payloads = ((self.make_key(key, opts), self._pickle(data))
+                    for key, data in iteritems(mapping))
+        for batch in self.batches(((key, payload, len(payload)) for key, payload in payloads), stats, opts):
+            self._cache.set_many(dict(batch), timeout)
+        self.debug('Cache set_many: %(keys)s keys, %(bytes)s bytes in %(batches)s batches', stats)
+
+    def add_lock(self, key, ttl):
+        return bool(self._cache.add(self.make_key(key), '1', int(ttl)))
+
     def delete(self, key, opts=None):
         self.debug('Cache delete: %s', key)
-        self._cache.delete(key)
+        self._cache.delete(self.make_key(key, opts))
         return key
 
-    def exist(key, opts=None):
-        data = self._cache.get(key)
+    def exist(self, key, opts=None):
+        data = self._cache.get(self.make_key(key, opts))
         return not data is None
 
 
@@ -70,4 +98,5 @@ def DjangoCacheFactory(cache_builder):
         'TIMEOUT': CONFIG.cache.get('ttl', None)}
     backend_name = CONFIG.cache.get('backend', 'django.core.cache.backends.memcached.MemcachedCache')
     adapter = cache_builder(DjangoCacheAdapter)
-    return adapter(backend_name, params)
+    codec = get_codec(CONFIG.cache.get('codec', None), CONFIG.cache.get('codec_threshold', None))
+    return adapter(backend_name, params, codec)
@@ -8,11 +8,19 @@ __author__ = 'a@toukmanov.ru, xepa4ep'
 
 class FileAdapter(object):
 
-    cache = {}
+    snapshots = {}   # path -> IndexedSnapshot or None
 
     def get_cache_path(self):
         return os.path.join(CONFIG['cache']['path'], CONFIG['cache']['version'])
 
+    def indexed_snapshot(self):
+        """ Indexed snapshot next to version dir (see api.snapshot.convert_snapshot) """
+        from ..api.snapshot import IndexedSnapshot, INDEXED_EXT
+        path = self.get_cache_path() + INDEXED_EXT
+        if path not in self.snapshots:
+            self.snapshots[path] = IndexedSnapshot(path) if os.path.exists(path) else None
+        return self.snapshots[path]
+
     def file_path(self, key):
         return os.path.join(self.get_cache_path(), '%s.json' % key)
 
@@ -21,21 +29,34 @@ class FileAdapter(object):
         return 'file'
 
     def fetch(self, key, opts=None):
-        if key in self.cache:
-            self.debug("memory hit: %s", key)
-            return self.cache[key]
-        path = self.file_path(key)
-        if os.path.exists(path):
-            self.debug('cache hit: %s', key)
-            with open(path, 'rb') as fp:
-                self.cache[key] = json.loads(fp.read().decode('utf-8'))
-            return self.cache[key]
+        data = self.read(key)
+        if data is not None:
+            return data
         self.debug('cache miss: %s', key)
         if opts and opts.get('miss_callback', None):
             if callable(opts['miss_callback']):
                 return opts['miss_callback'](key)
         return
 
+    def read(self, key):
+        snapshot = self.indexed_snapshot()
+        if snapshot is not None:
+            return snapshot.fetch(key) if key in snapshot.index else None
+        path = self.file_path(key)   # decoded files are kept by memory tier
+        if not os.path.exists(path):
+            return None
+        self.debug('cache hit: %s', key)
+        with open(path, 'rb') as fp:
+            return json.loads(fp.read().decode('utf-8'))
+
+    def read_many(self, keys, opts=None):
+        ret = {}
+        for key in keys:
+            data = self.read(key)
+            if data is not None:
+                ret[key] = data
+        return ret
+
     def read_only(self):
         return True
 
@@ -1,9 +1,9 @@
 import pickle
 import json
-from six import string_types
+from six import string_types, iteritems
 from ..utils import ts
 from ..config import CONFIG
-from .codecs import JSONCodec
+from .codecs import get_codec, decode, allowed_codecs
 
 
 
@@ -27,6 +27,8 @@ class BaseMemcachedAdapter(object):
         self._options = params.get('OPTIONS', None)
         self._lib = library
         self._client = None
+        self.codec = get_codec(params.get('codec', None), params.get('codec_threshold', None))
+        self.allowed_codecs = allowed_codecs(self.codec)
 
     def get_backend_timeout(self, timeout=DEFAULT_TIMEOUT):
         if timeout == DEFAULT_TIMEOUT:
@@ -53,11 +55,10 @@ class BaseMemcachedAdapter(object):
         raise NotImplementedError('not impl')
 
     def _pickle(self, data):
-        # might be overriden in differnet memcache implementations
-        return data
+        return self.codec.encode(data)
 
     def _unpickle(self, payload):
-        return payload
+        return decode(payload, self.allowed_codecs)   # other codecs are missed
 
     @property
     def cache_name(self):
@@ -82,10 +83,34 @@ class BaseMemcachedAdapter(object):
             if opts and opts.get('miss_callback', None):
                 if callable(opts['miss_callback']):
                     data = opts['miss_callback'](key)
-            self.store(key, data)
+            if data is not None:
+                self.store(key, data)
             self.debug('Cache miss: %s', key)
         return data
 
+    def read_many(self, keys, opts=None):
+        versioned_keys = dict((self.versioned_key(key, opts), key)
+                              for key in keys)
+        payloads = self._cache.get_multi(list(versioned_keys))
+        self.debug('Cache get_multi: %s keys, %s hits',
+                   len(keys), len(payloads))
+        return dict((versioned_keys[versioned_key], self._unpickle(payload))
+                    for versioned_key, payload in payloads.items() if payload)
+
+    def write_many(self, mapping, stats, opts=None):
+        timeout = self.get_backend_timeout((opts or {}).get('timeout', None))
+        for batch in self.batches(self.payloads(mapping, opts), stats, opts):
+            self._cache.set_multi(dict(batch), timeout)
+        self.debug('Cache set_multi: %(keys)s keys, %(bytes)s bytes in %(batches)s batches', stats)
+
+    def payloads(self, mapping, opts=None):
+        for key, data in iteritems(mapping):
+            payload = self._pickle(data)
+            yield self.versioned_key(key, opts), payload, len(payload)
+
+    def add_lock(self, key, ttl):
+        return bool(self._cache.add(self.versioned_key(key), '1', int(ttl)))
+
     def delete(self, key, opts=None):
         self.debug('Cache delete: %s', key)
         self._cache.delete(self.versioned_key(key, opts))
@@ -110,12 +135,6 @@ class DefaultMemcachedAdapter(BaseMemcachedAdapter):
             self._client = self._lib.Client(self._servers)
         return self._client
 
-    def _pickle(self, data):
-        return json.dumps(data)
-
-    def _unpickle(self, payload):
-        return json.loads(payload)
-
 class PyLibMCCacheAdapter(BaseMemcachedAdapter):
     def __init__(self, server, params):
         import pylibmc
@@ -131,12 +150,6 @@ class PyLibMCCacheAdapter(BaseMemcachedAdapter):
                 self._client.behaviors = self._options
         return self._client
 
-    def _pickle(self, data):
-        return json.dumps(data)
-
-    def _unpickle(self, payload):
-        return json.loads(payload)
-
 
 def MemcachedAdapterFactory(cache_builder):
     server = CONFIG.cache.get('host', '127.0.0.1:11211')
@@ -144,7 +157,9 @@ def MemcachedAdapterFactory(cache_builder):
         'OPTIONS': CONFIG.cache.get('options', {}),
         'namespace': CONFIG.cache.get('namespace', 'tml'),
         'timeout': CONFIG.cache.get('ttl', None),
-        'compress': None}
+        'compress': None,
+        'codec': CONFIG.cache.get('codec', None),
+        'codec_threshold': CONFIG.cache.get('codec_threshold', None)}
     adapter_name = CONFIG.cache.get('backend', 'memcache_memcached')
     adapter = None
     if adapter_name.endswith('pylibmc'):
@@ -1,9 +1,9 @@
 import pickle
 import json
-from six import string_types
+from six import string_types, iteritems
 from ..utils import ts
 from ..config import CONFIG
-from .codecs import JSONCodec
+from .codecs import get_codec, decode, allowed_codecs
 
 __author__ = 'a@toukmanov.ru, xepa4ep'
 
@@ -22,6 +22,8 @@ class BaseRedisAdapter(object):
         self._options = params.get('OPTIONS', {})
         self._lib = library
         self._client = None
+        self.codec = get_codec(params.get('codec', None), params.get('codec_threshold', None))
+        self.allowed_codecs = allowed_codecs(self.codec)
 
     def get_backend_timeout(self, timeout=DEFAULT_TIMEOUT):
         if timeout == DEFAULT_TIMEOUT:
@@ -40,10 +42,10 @@ class BaseRedisAdapter(object):
         raise NotImplementedError('not impl')
 
     def _pickle(self, data):
-        return data
+        return self.codec.encode(data)
 
     def _unpickle(self, payload):
-        return payload
+        return decode(payload, self.allowed_codecs)   # other codecs are missed
 
     @property
     def cache_name(self):
@@ -68,10 +70,35 @@ class BaseRedisAdapter(object):
             if opts and opts.get('miss_callback', None):
                 if callable(opts['miss_callback']):
                     data = opts['miss_callback'](key)
-            self.store(key, data)
+            if data is not None:
+                self.store(key, data)
             self.debug('Cache miss: %s', key)
         return data
 
+    def read_many(self, keys, opts=None):
+        payloads = self._cache.mget(
+            [self.versioned_key(key, opts) for key in keys])
+        self.debug('Cache mget: %s keys', len(keys))
+        return dict((key, self._unpickle(payload))
+                    for key, payload in zip(keys, payloads) if payload)
+
+    def write_many(self, mapping, stats, opts=None):
+        timeout = self.get_backend_timeout((opts or {}).get('timeout', None))
+        for batch in self.batches(self.payloads(mapping, opts), stats, opts):
+            pipeline = self._cache.pipeline(transaction=False)
+            for key, payload in batch:
+                pipeline.set(key, payload, timeout if timeout > 0 else None)
+            pipeline.execute()
+        self.debug('Cache pipeline: %(keys)s keys, %(bytes)s bytes in %(batches)s batches', stats)
+
+    def payloads(self, mapping, opts=None):
+        for key, data in iteritems(mapping):
+            payload = self._pickle(data)
+            yield self.versioned_key(key, opts), payload, len(payload)
+
+    def add_lock(self, key, ttl):
+        return bool(self._cache.set(self.versioned_key(key), '1', ex=int(ttl), nx=True))
+
     def delete(self, key, opts=None):
         self.debug('Cache delete: %s', key)
         self._cache.delete(self.versioned_key(key, opts))
@@ -99,19 +126,15 @@ class DefaultRedisAdapter(BaseRedisAdapter):
                 self._client = self._lib.Redis(server, port)
         return self._client
 
-    def _pickle(self, data):
-        return json.dumps(data)
-
-    def _unpickle(self, payload):
-        return json.loads(payload.decode())
-
 def RedisAdapterFactory(cache_builder):
     server = CONFIG.cache.get('host', '127.0.0.1:6379')
     params = {
         'OPTIONS': CONFIG.cache.get('options', {}),
         'namespace': CONFIG.cache.get('namespace', 'tml'),
         'timeout': CONFIG.cache.get('ttl', None),
-        'compress': None}
+        'compress': None,
+        'codec': CONFIG.cache.get('codec', None),
+        'codec_threshold': CONFIG.cache.get('codec_threshold', None)}
     #adapter_name = CONFIG.cache.get('backend', 'redis_default')
     adapter = None
     adapter = cache_builder(DefaultRedisAdapter, BaseRedisAdapter)
@@ -2,7 +2,9 @@ from __future__ import absolute_import
 # encoding: UTF-8
 import os
 import time
+from six import iteritems
 from .api.client import Client
+from .api.snapshot import convert_snapshot
 from .cache import CachedClient
 from .config import CONFIG
 from .utils import pj, rel, rm_symlink, untar, chdir, ts
@@ -27,7 +29,7 @@ def download_release(cache_dir=None, force_dir=True):
         raise IOError("Directory `cache_dir` does not exist. Create before or et `force_dir` argument to true")
     if not os.path.exists(cache_dir):   # force dirs to create
         os.makedirs(cache_dir)
-    os.chmod(cache_dir, 0777)
+    os.chmod(cache_dir, 0o777)
     app_key = CONFIG.application_key()
     client = Client(app_key)
     selected_version = extract_version(client, app_key)
@@ -43,6 +45,7 @@ def download_release(cache_dir=None, force_dir=True):
     version_path = pj(cache_dir, selected_version)
     untar(full_path, dest_path=version_path)
     logger.debug("Cache has been stored under `%s`", full_path)
+    logger.debug("Indexed snapshot has been stored under `%s`", convert_snapshot(version_path))
     with chdir(cache_dir):
         current_ln = 'current'
         rm_symlink(current_ln)
@@ -53,30 +56,44 @@ def download_release(cache_dir=None, force_dir=True):
 
 
 def warmup_cache(version=None):
+    """ Fetch release from CDN and store it into cache
+        Languages and sources are written in pipelined batches per locale.
+        Returns:
+            dict: throughput report (keys, bytes, batches, seconds, keys/s, MB/s)
+    """
     t0 = time.time()
     logger = get_logger()
     logger.debug("Starting cache warmup...")
     app_key = CONFIG.application_key()
     client = Client(app_key)
+    cache = CachedClient.instance()
     # 1. get version
     selected_version = version or extract_version(client, app_key)
     logger.debug("Warming up version: %s", selected_version)
     # 2. fetch and store app
     application = client.cdn_call('application', {'t': ts()}, {'cache_version': selected_version})
-    CachedClient.instance().store(Application.cache_key, application)
+    report = cache.store_many({Application.cache_key: application})
+    store_seconds = 0
 
     # 3. fetch sources
     sources = client.cdn_call('sources', {'t': ts()}, {'uncompressed': True, 'cache_version': selected_version}) or []
     for lang in application['languages'] or []:
         locale = lang['locale']
         lang_key = Language.cache_key(locale)
-        language = client.cdn_call(lang_key, {'t': ts()}, {'cache_version': selected_version})
-        CachedClient.instance().store(lang_key, language)
+        mapping = {lang_key: client.cdn_call(lang_key, {'t': ts()}, {'cache_version': selected_version})}
         for src in sources:
             src_key = '%s/sources/%s' % (locale, src)
-            source = client.cdn_call(src_key, {'t': ts()}, {'cache_version':selected_version})
-            CachedClient.instance().store(src_key, source)
+            mapping[src_key] = client.cdn_call(src_key, {'t': ts()}, {'cache_version':selected_version})
+        t = time.time()
+        for name, value in iteritems(cache.store_many(mapping)):
+            report[name] += value
+        store_seconds += time.time() - t
 
     t1 = time.time()
-    logger.debug("Cache warmup took %s", round(t1 - t0, 2))
-
+    report['seconds'] = round(t1 - t0, 2)
+    report['store_seconds'] = round(store_seconds, 2)
+    report['keys_per_second'] = round(report['keys'] / store_seconds, 1) if store_seconds else None
+    report['mb_per_second'] = round(report['bytes'] / 1048576.0 / store_seconds, 2) if store_seconds else None
+    logger.debug("Cache warmup took %(seconds)s: stored %(keys)s keys, %(bytes)s bytes in %(batches)s batches "
+                 "(%(keys_per_second)s keys/s, %(mb_per_second)s MB/s)", report)
+    return report
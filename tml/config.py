@@ -69,6 +69,9 @@ class Config(BaseConfigMixin, Singleton):
         #"cdn_path": "http://trex-snapshots.s3-us-west-1.amazonaws.com"
         "path": "https://api.translationexchange.com",
         "cdn_path": "http://cdn.translationexchange.com"
+        # HTTP session (see tml.api.client.HTTP_DEFAULTS):
+        #'pool_connections': 4, 'pool_size': 10, 'keep_alive': True,
+        #'connect_timeout': 5, 'read_timeout': 30, 'max_retries': 0
     }
 
     logger = {
@@ -108,6 +111,17 @@ class Config(BaseConfigMixin, Singleton):
         'enabled': False,
         #'adapter': 'file',
         #'path': 'a/b/c/snapshot.tar.gz'
+        # L1 tier (off by default, cached objects must not be edited):
+        #'memory': {'size': 1000, 'bytes': 64 * 1024 * 1024, 'ttl': 300}
+        #'batch_size': 100, 'batch_bytes': 1024 * 1024   # store_many batches
+        #'codec': 'json', 'codec_threshold': 1024   # json, zlib, marshal, pickle, marshal+zlib, pickle+zlib
+        # re-read version in background (see VersionPoller):
+        #'poll_version': True
+        #'miss_lock': False, 'miss_lock_ttl': 10   # coordinate cache miss loads between processes
+        #'negative_ttl': 60   # keep keys missing on CDN as negative entries, 0 to disable
+        # serve stale and refresh in background,
+        # per application/language/sources:
+        #'stale': {'sources': {'soft': 60, 'hard': 3600}}
     }
 
     default_source = "index"
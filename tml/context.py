@@ -33,7 +33,7 @@ from .dictionary import NoneDict, return_label_fallback
 from .dictionary.translations import Dictionary
 from .dictionary.source import SourceDictionary
 from .session_vars import set_current_translator, set_current_context
-from .cache import CachedClient
+from .cache import CachedClient, VERSION_POLLER
 from .utils import cached_property
 from . import legacy as tml_legacy
 
@@ -46,6 +46,66 @@ class ContextNotConfigured(Error):
     pass
 
 
+class BlockOptions(object):
+    """ Frozen layer of block options stack (see with_block_options)
+
+        Options of outer blocks take precedence: a key is looked up in the
+        outermost block where it is set. Lookups are precomputed on push.
+    """
+    def __init__(self, options=None, parent=None):
+        """ .ctor
+            Args:
+                options (dict): options of current block
+                parent (BlockOptions): options of enclosing block
+        """
+        self.options = options
+        self.parent = parent
+        options = dict(options or {})
+        if parent is None or parent.parent is None:   # outermost block
+            self.outermost = options
+            self.values = {}
+            self.sources = ()
+        else:
+            self.outermost = parent.outermost
+            self.values = dict(parent.values)
+            self.sources = parent.sources
+        for key, value in options.items():
+            if value and not key in self.values:
+                self.values[key] = value
+        if options.get('source', None):
+            self.sources = (options['source'],) + self.sources
+        self._source_path = None
+
+    def push(self, options):
+        """ Nested block options
+            Args:
+                options (dict): options of nested block
+            Returns:
+                BlockOptions
+        """
+        return BlockOptions(options, self)
+
+    def get(self, key, lookup=True, default=None):
+        """ Option value
+            Args:
+                key (string): option name
+                lookup (boolean): look for any block where option is set
+                default: value if option is not set
+        """
+        if lookup:
+            value = self.values.get(key, None)
+            if value:
+                return value
+        return self.outermost.get(key, default)
+
+    def source_path(self, source, separator):
+        """ Main source and sources of blocks (innermost first) """
+        if self._source_path is None or self._source_path[0] != (source, separator):
+            self._source_path = ((source, separator),
+                                 separator.join((source,) + self.sources))
+        return self._source_path[1]
+
+
 class AbstractContext(RenderEngine):
     """ Wrapper for dictionary """
     language = None
@@ -58,7 +118,7 @@ class AbstractContext(RenderEngine):
                 dictionary (dictionary.AbstractDictionary): dict object for translation
         """
         self.language = language
-        self._block_option_queue = []
+        self._block_options = BlockOptions()
         super(AbstractContext, self).__init__()
         # self.dict = self.build_dict(self.language)
 
@@ -66,29 +126,29 @@ class AbstractContext(RenderEngine):
         pass
 
     def push_options(self, opts):
-        self._block_option_queue.insert(0, opts)
+        self._block_options = self._block_options.push(opts)
 
     def pop_options(self):
-        opts = self._block_option_queue.pop(0)
+        if self._block_options.parent is None:
+            raise IndexError('pop from empty block options')
+        opts = self._block_options.options
+        self._block_options = self._block_options.parent
         return opts
 
     @property
     def block_options(self):
-        return self._block_option_queue and self._block_option_queue[-1] or {}
+        return self._block_options.outermost
 
     def block_option(self, key, lookup=True, default=None):
-        if lookup:
-            for options in reversed(self._block_option_queue):
-                if options.get(key, None):
-                    return options.get(key, default)
-        return self.block_options.get(key, default)
+        return self._block_options.get(key, lookup, default)
 
-    def build_key(self, label, description, language=None):
-        """ Build key """
+    def build_key(self, label, description, language=None, key=None):
+        """ Build key (key - known hash of label and description) """
         language = language or self.language
         return Key(label=label,
                    description=description,
-                   language=language)
+                   language=language,
+                   key=key)
 
     def _fetch_translation(self, label, description):
         key = self.build_key(label, description)
@@ -96,7 +156,7 @@ class AbstractContext(RenderEngine):
             return return_label_fallback(key)
         dict = self.build_dict(self.language)
         if dict:
-            return dict.fetch(self.build_key(label, description))
+            return dict.fetch(key)
         raise ContextNotConfigured(self)
 
     def fetch(self, label, description):
@@ -109,6 +169,28 @@ class AbstractContext(RenderEngine):
         """
         return self._fetch_translation(label, description)
 
+    def fetch_many(self, keys):
+        """ Fetch translations for keys with one dictionary
+            Args:
+                keys (Key[]): keys
+            Returns:
+                list: Translation or TranslationIsNotExists for each key
+        """
+        dict = self.build_dict(self.language)
+        if not dict:
+            raise ContextNotConfigured(self)
+        ret = [None] * len(keys)
+        fetched = []
+        for i, key in enumerate(keys):
+            if self.application.ignored_key(key):  # if ignored, return label
+                ret[i] = return_label_fallback(key)
+            else:
+                fetched.append(i)
+        translations = dict.fetch_many([keys[i] for i in fetched])
+        for i, translation in zip(fetched, translations):
+            ret[i] = translation
+        return ret
+
     @property
     def application(self):
         """ Application getter
@@ -205,6 +287,73 @@ class AbstractContext(RenderEngine):
             # Render result:
         return translation.key, self.render(translation, data, options), error
 
+    def tr_many(self, items, data=None, description="", options=None):
+        """ Translate many labels in one call: dictionary is resolved once,
+            keys are fetched in bulk and missed keys are registered at once
+            Args:
+                items (list): labels, (label, data, description, options)
+                    tuples (may be partial) or dicts with these keys
+                data (dict): default data
+                description (string): default description
+                options (dict): default options of items (source, dry etc.)
+            Returns:
+                list: (key, value, error) for each item in order
+        """
+        items = [self.batch_item(item, data, description, options)
+                 for item in items]
+        translations = [None] * len(items)
+        groups = {}   # items with same options are fetched together
+        for i, item in enumerate(items):
+            groups.setdefault(id(item[3]), []).append(i)
+        for indexes in groups.values():
+            self.fetch_batch(items, indexes, translations)
+        return [(translation.key, self.render(translation, item[1] or {}, item[3] or {}), error)
+                for item, (translation, error) in zip(items, translations)]
+
+    tr_batch = tr_many
+
+    def fetch_batch(self, items, indexes, translations):
+        """ Fetch translations of tr_many items sharing options
+            (options are pushed while keys are built and fetched, like in tr)
+            Args:
+                items (list): normalized items (see batch_item)
+                indexes (list): indexes of items with same options
+                translations (list): (translation, error) is set by index
+        """
+        item_options = items[indexes[0]][3] or {}
+        self.push_options(item_options)
+        try:
+            keys = [self.build_key(items[i][0], items[i][2]) for i in indexes]
+            if item_options.get('dry', False) or self.block_option('dry'):
+                fetched = [return_label_fallback(key) for key in keys]
+            else:
+                fetched = self.fetch_many(keys)
+            for i, translation in zip(indexes, fetched):
+                if isinstance(translation, TranslationIsNotExists):
+                    label, item_data, item_description, options = items[i]
+                    options = dict(options or {},
+                                   pending=translation.is_pending())
+                    items[i] = (label, item_data, item_description, options)
+                    translations[i] = (
+                        self.fallback(label, item_description), translation)
+                else:
+                    translations[i] = (translation, None)
+        finally:
+            self.pop_options()
+
+    @classmethod
+    def batch_item(cls, item, data=None, description="", options=None):
+        """ Normalize tr_many item
+            Returns:
+                tuple: label, data, description, options
+        """
+        if isinstance(item, dict):
+            return (item['label'], item.get('data', data),
+                    item.get('description', description), item.get('options', options))
+        if isinstance(item, (list, tuple)):
+            return (tuple(item) + (data, description, options)[len(item) - 1:])[:4]
+        return (item, data, description, options)
+
     def tr_legacy(self, legacy_label, data=None, description="", options=None):
         data = data or {}
         options = options or {}
@@ -246,7 +395,8 @@ class LanguageContext(AbstractContext):
                 key (int): API application key (use default if None)
 
         """
-        CachedClient.instance().reset_version()
+        if not VERSION_POLLER.running():   # otherwise version is refreshed in background
+            CachedClient.instance().reset_version()
         self.set_translator(translator)
         locale = CONFIG.get_locale(locale)
         if key:
@@ -255,6 +405,9 @@ class LanguageContext(AbstractContext):
         else:
             application = Application.load_default(
                 client, locale=locale, source=source)
+        # selected and default (fallback) language with one round trip:
+        application.load_languages([locale or application.default_locale,
+                                    application.default_locale])
         language = application.language(locale or application.default_locale)
         super(LanguageContext, self).__init__(language=language)
         set_current_context(self)
@@ -327,14 +480,17 @@ class LanguageContext(AbstractContext):
 
 class SourceContext(LanguageContext):
     """ Context with source """
-    def __init__(self, source, **kwargs):
+    def __init__(self, source, sources=None, **kwargs):
         """ .ctor
             Args:
                 source (string): source name
+                sources (list): other sources used by page,
+                    fetched together with main one
         """
         self.source = source or CONFIG.default_source  # ref name to mainsource
         self._used_sources = set([self.source])
         super(SourceContext, self).__init__(source=self.source, **kwargs)
+        self.application.expect_sources(sources)
 
     @property
     def source_name(self):   # current source: virtual or main
@@ -342,13 +498,7 @@ class SourceContext(LanguageContext):
 
     @property
     def source_path(self):
-        source_builder = []
-        for opts in self._block_option_queue:
-            if not 'source' in opts or not opts.get('source', None):
-                continue
-            source_builder.append(opts['source'])
-        source_builder.insert(0, self.source)
-        return CONFIG['source_separator'].join(source_builder)
+        return self._block_options.source_path(self.source, CONFIG['source_separator'])
 
     def fetch(self, label, description):
         """ Fetch Translation
@@ -366,6 +516,11 @@ class SourceContext(LanguageContext):
         self._used_sources.add(self.source_name)
         return self._fetch_translation(label, description)
 
+    def fetch_many(self, keys):
+        if self.source_name != self.source:
+            self._used_sources.add(self.source_name)
+        return super(SourceContext, self).fetch_many(keys)
+
     def build_dict(self, language):
         """ Fetches or builds source dictionary for language """
         source = language.application.source(self.source_name, language.locale, source_path=self.source_path)
@@ -20,8 +20,14 @@ class Text(object):
         self.text = self.text + let
         return self
 
-    def render(self, data = {}):
-        """ Just return text """
+    def render(self, data = {}, text_filter = None):
+        """ Just return text
+            Args:
+                data (dict): render data
+                text_filter (function): text postprocessor (e.g. tokens substitution)
+        """
+        if text_filter is not None:
+            return text_filter(self.text)
         return self.text
 
     def __len__(self):
@@ -47,9 +53,17 @@ class Set(object):
             self.content.append(self.text)
             self.text = Text()
 
-    def render(self, data = None):
+    def compact(self):
+        """ Flush all pending text, so tree could be rendered read-only """
+        self.flush_text()
+        for el in self.content:
+            if isinstance(el, Set):
+                el.compact()
+        return self
+
+    def render(self, data = None, text_filter = None):
         self.flush_text()
-        return ''.join(el.render(data) for el in self.content)
+        return ''.join(el.render(data, text_filter) for el in self.content)
 
 class AttributeIsNotSet(Error):
     def __init__(self, name, key):
@@ -70,7 +84,7 @@ class Tag(Set):
         self.self_closed = self_closed
         super(Tag, self).__init__()
 
-    def render(self, data = None):
+    def render(self, data = None, text_filter = None):
         attributes = {}
         first = True
         for key in self.attributes:
@@ -80,8 +94,8 @@ class Tag(Set):
                 raise AttributeIsNotSet(self.name, key)
             first = False
         if self.self_closed:
-            return '<%s/>%s' % (self.tag, super(Tag, self).render(data))
-        return '<%s%s>%s</%s>' % (self.tag, render_attributes(attributes), super(Tag, self).render(data), self.tag)
+            return '<%s/>%s' % (self.tag, super(Tag, self).render(data, text_filter))
+        return '<%s%s>%s</%s>' % (self.tag, render_attributes(attributes), super(Tag, self).render(data, text_filter), self.tag)
 
     def fetch_attribute(self, key, attributes):
         """ Fetch attibute by key
@@ -2,6 +2,7 @@ from __future__ import absolute_import
 # encoding: UTF-8
 from ..exceptions import Error
 from .__init__ import Set, system_tags, Tag, UnsupportedTag
+from ..utils import LRUCache
 import six
 
 BEGIN_TOKEN = '['
@@ -108,6 +109,48 @@ def parse(text, tags_factory = None):
         raise ParseError(text, pos-1, 'Element '+element.name+' is not closed')
     return element
 
+# Parsed decoration trees: template -> Set
+PARSED_TEMPLATES_SIZE = 5000
+parsed_templates = LRUCache(PARSED_TEMPLATES_SIZE)
+
+
+def is_decorated(text):
+    """ Check is text contains decoration tags """
+    return BEGIN_TOKEN in text
+
+
+def parse_cached(text, tags_factory = None):
+    """ Parse text once per process, tree is shared so it is read-only
+        Args:
+            text (string): decorated template
+            tags_factory (TagFactory): custom factory (is not cached)
+        Returns:
+            Set
+    """
+    if not tags_factory is None and not tags_factory is system_tags:
+        return parse(text, tags_factory)
+    tree = parsed_templates.get(text)
+    if tree is None:
+        tree = parsed_templates.set(text, parse(text).compact())
+    return tree
+
+
+def render(text, data = None, text_filter = None, tags_factory = None):
+    """ Parse and render decorated text
+        Args:
+            text (string): template
+            data (dict): tags attributes
+            text_filter (function): applied to each text node
+            tags_factory (TagFactory): custom factory
+        Returns:
+            string
+    """
+    if not is_decorated(text):
+        # fast path: nothing to parse
+        return text if text_filter is None else text_filter(text)
+    return parse_cached(text, tags_factory).render(data, text_filter)
+
+
 class ParseError(Error):
     def __init__(self, text, pos, error):
         self.text = text
@@ -24,7 +24,10 @@ __author__ = 'a@toukmanov.ru'
 
 from ..translation import Translation, NoneTranslation
 from ..exceptions import Error
-from ..utils import deprecated
+from sys import getsizeof
+from copy import copy
+from itertools import count
+from ..utils import deprecated, LRUCache
 from ..logger import LoggerMixin
 
 
@@ -78,6 +81,21 @@ class AbstractDictionary(LoggerMixin):
         """
         raise NotImplementedError()
 
+    def fetch_many(self, keys):
+        """ Fetch translations for keys in bulk
+            Args:
+                keys (Key[]): keys to translate
+            Returns:
+                list: Translation or TranslationIsNotExists for each key
+        """
+        ret = []
+        for key in keys:
+            try:
+                ret.append(self.fetch(key))
+            except TranslationIsNotExists as translation_not_exists:
+                ret.append(translation_not_exists)
+        return ret
+
     def fallback(self, key):
         """ Key is not found """
         return self._fallback(key)
@@ -91,8 +109,36 @@ class AbstractDictionary(LoggerMixin):
         return self._fallback
 
 
+# Process wide cache of compiled options shared by all dictionaries
+# (bounds total memory): (generation, key) -> (raw options, templates).
+# Templates are not bound to language (Translation binds selected one),
+# so application of request is never kept by the cache.
+OPTION_SIZE = 1024   # option object, context, options and raw dicts
+COMPILED_TRANSLATIONS_SIZE = 10000
+COMPILED_TRANSLATIONS_BYTES = 16 * 1024 * 1024
+
+
+def compiled_size(compiled):
+    """ Approximate memory used by compiled translation
+        Args:
+            compiled (tuple): raw options, TranslationOption[]
+        Returns:
+            int: bytes
+    """
+    return sum(OPTION_SIZE + 2 * getsizeof(option.label)
+               for option in compiled[1])
+
+
 class Hashtable(AbstractDictionary):
     """ Dictionary with translation store in hash """
+
+    _translations = None
+
+    compiled = LRUCache(COMPILED_TRANSLATIONS_SIZE,
+                        maxbytes=COMPILED_TRANSLATIONS_BYTES,
+                        sizeof=compiled_size)
+    generations = count()   # translations version, copies share it
+
     def __init__(self, fallback=None, translations=None):
         """ .ctor
             Args:
@@ -101,6 +147,16 @@ class Hashtable(AbstractDictionary):
         self.translations = translations or {}
         super(Hashtable, self).__init__(fallback)
 
+    @property
+    def translations(self):
+        return self._translations
+
+    @translations.setter
+    def translations(self, translations):
+        """ Replace translations, options compiled from old ones are not used """
+        self._translations = translations
+        self.generation = next(self.generations)
+
     def fetch(self, key):
         """ Tranlate key
             Args:
@@ -109,10 +165,19 @@ class Hashtable(AbstractDictionary):
                 Tranlation
         """
         try:
-            return Translation.from_data(key, self.translations[key.key])
+            data = self.translations[key.key]
         except KeyError:
-            pass
-        raise TranslationIsNotExists(key, self)
+            raise TranslationIsNotExists(key, self)
+        compiled_key = (self.generation, key.key)
+        compiled = self.compiled.get(compiled_key)
+        # raw options are compared shallowly: fields edited in place are
+        # picked up without deep copies
+        if compiled is None or compiled[0] != data:
+            compiled = self.compiled.set(
+                compiled_key,
+                ([copy(option) for option in data],
+                 Translation.compile_templates(data)))
+        return Translation(key, compiled[1])
 
 
 class TranslationIsNotExists(Error):
@@ -64,10 +64,20 @@ class SourceDictionary(Hashtable):
         return self.compute_key()
 
     def cache_key(self):
-        return pj(self.language.locale, 'sources', *self.source.split('/'))
+        return self.source_cache_key(self.source, self.language.locale)
 
     def compute_key(self):
-        return md5(self.source.encode('utf-8')).hexdigest()
+        return self.source_key(self.source)
+
+    @classmethod
+    def source_cache_key(cls, source, locale):
+        """ Cache key of source translations (single and bulk loads) """
+        return pj(locale, 'sources', *source.split('/'))
+
+    @classmethod
+    def source_key(cls, source):
+        """ API key of source """
+        return md5(source.encode('utf-8')).hexdigest()
 
     def load_translations(self, translations=None):
         """Load translations.
@@ -98,11 +108,20 @@ class SourceDictionary(Hashtable):
             Returns:
                 tuple: url, params
         """
-        # import pdb
-        # pdb.set_trace()
-        return ('sources/%s/translations' % self.key,
-                {'locale': self.language.locale, 'all': True, 'ignored': True},
-                {'cache_key': self.cache_key()})
+        return self.query(self.source, self.language)
+
+    @classmethod
+    def query(cls, source, language):
+        """ API call params for source translations
+            Args:
+                source (string): source name
+                language (Language): language
+            Returns:
+                tuple: url, params, opts
+        """
+        return ('sources/%s/translations' % cls.source_key(source),
+                {'locale': language.locale, 'all': True, 'ignored': True},
+                {'cache_key': cls.source_cache_key(source, language.locale)})
 
     def fetch(self, key):
         try:
@@ -117,6 +136,30 @@ class SourceDictionary(Hashtable):
             raise TranslationIsNotExists(key, self)
         return ret
 
+    def fetch_many(self, keys):
+        """ Fetch translations in bulk, missed keys are registered at once
+            Args:
+                keys (Key[]): keys to translate
+            Returns:
+                list: Translation or TranslationIsNotExists for each key
+        """
+        ret = []
+        missed_keys = []
+        for key in keys:
+            try:
+                translation = super(SourceDictionary, self).fetch(key)
+            except TranslationIsNotExists as translation_not_exists:
+                if key.label:
+                    missed_keys.append(key)
+                    translation_not_exists.make_pending()
+                ret.append(translation_not_exists)
+                continue
+            if len(translation) == 0:
+                translation = TranslationIsNotExists(key, self)
+            ret.append(translation)
+        self.application.register_missing_keys(missed_keys, self.source_path)
+        return ret
+
     def verify_path(self):
         """Source is registered under main source, if not registered yet."""
         self.application.verify_source_path(self.source, self.source_path)
@@ -1,5 +1,22 @@
+from __future__ import absolute_import
 import six
-from .str import translate as str_tr
+from .utils import context_configured
+
+
+@context_configured
+def translate_many(self, language_context, description='', options=None):
+    """ Translate strings of list with one tr_many call (not strings are
+        returned as is)
+        Args:
+            self (list): strings
+            language_context (context.AbstractContext): current context
+        Returns:
+            list: translated list (new)
+    """
+    labels = [item for item in self if isinstance(item, six.string_types)]
+    results = iter(language_context.tr_many(labels, data={}, description=description, options=options))
+    return [next(results)[1] if isinstance(item, six.string_types) else item
+            for item in self]
 
 
 # translates an array of options for a select tag
@@ -8,13 +25,20 @@ def tro(self, description='', options=None):
         return []
     options = {} if options is None else options
     options['nowrap'] = True
-    for i, item in enumerate(self):
+    labels = []
+    for item in self:
         if isinstance(item, six.string_types):
-            item = [item, translate_str(item, description=description, data={}, options=options)]
+            labels.append(item)
         elif isinstance(item, (list, tuple)):
-            item = [item[0], translate_str(item[1], description=description, data={}, options=options)]
+            labels.append(item[1])
         else:
-            pass
+            labels.append(None)
+    labels = translate_many(labels, description=description, options=options)
+    for i, item in enumerate(self):
+        if isinstance(item, six.string_types):
+            item = [item, labels[i]]
+        elif isinstance(item, (list, tuple)):
+            item = [item[0], labels[i]]
         self[i] = item
     return self
 
@@ -23,32 +47,31 @@ def translate(self, description='', options=None):
     options = {} if options is None else options
     if not self:
         return []
-    for i, item in enumerate(self):
-        self[i] = translate_str(item, description=description, data={}, options=options)
+    self[:] = translate_many(self, description=description, options=options)
     return self
 
-def translate_str(string, **tr_kwargs):
-    if not isinstance(string, six.string_types):
-        return string
-    if hasattr(string, 'tml_translate'):  # if patched
-        return string.tml_translate(**tr_kwargs)
-    else:   # otherwise use method
-        return str_tr(string, **tr_kwargs)
-
 
 def translate_and_join(self, separator=', ', description='', options=None):
     return separator.join(translate(self, description=description, options=options))
 
-def translate_sentence(self, description='', options=None):
+@context_configured
+def translate_sentence(self, language_context, description='', options=None):
     options = {} if options is None else options
     options.setdefault('separator', ', ')
     options.setdefault('joiner', 'and')
     if not self:
         return ''
-    elements = translate(self, description=description, options=options)
-    if len(elements) == 1:
-        return elements[0]
-    str_builder = [options['separator'].join(elements[:-1])]
-    str_builder.append(translate_str(options['joiner'], description=description or 'List elements joiner', data={}, options=options))
-    str_builder.append(elements[-1])
+    # elements and joiner are translated with one tr_many call:
+    positions = [i for i, item in enumerate(self) if isinstance(item, six.string_types)]
+    items = [(self[i], {}, description) for i in positions]
+    if len(self) > 1:
+        items.append((options['joiner'], {}, description or 'List elements joiner'))
+    values = [value for _, value, _ in language_context.tr_many(items, options=options)]
+    for i, value in zip(positions, values):
+        self[i] = value
+    if len(self) == 1:
+        return self[0]
+    str_builder = [options['separator'].join(self[:-1])]
+    str_builder.append(values[-1])
+    str_builder.append(self[-1])
     return u" ".join(str_builder)
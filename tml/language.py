@@ -22,15 +22,79 @@
 # WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
 """
 
+import threading
 from copy import copy
 from .rules.contexts import Contexts
 from .rules.case import Case, LazyCases
 from .utils import pj, read_json
 from .config import CONFIG
+from .cache import CacheVersion, CachedClient
 
 
 __author__ = 'a@toukmanov.ru, xepa4ep'
 
+
+class LanguageRegistry(object):
+    """ Process wide registry of compiled language definitions
+
+        Contexts and cases are compiled once per (application key, locale,
+        cache version) and shared read-only by all Language instances.
+    """
+
+    INVALID_VERSIONS = (None, 'undefined', '0', 'None')
+
+    def __init__(self):
+        self.definitions = {}
+        self._lock = threading.Lock()
+
+    def build_key(self, application, locale):
+        """ Registry key
+            Args:
+                application (Application): application
+                locale (string): locale
+            Returns:
+                tuple or None: None if published cache version is unknown
+        """
+        if not CONFIG.cache_enabled():
+            return None
+        version = CachedClient.instance().version.version
+        if version in self.INVALID_VERSIONS:
+            return None
+        return (application.key, locale, str(version))
+
+    def fetch(self, key, compile_definition):
+        """ Fetch definition, compile on miss
+            Args:
+                key (tuple): registry key
+                compile_definition (function): builds (contexts, cases)
+            Returns:
+                tuple: (contexts, cases)
+        """
+        definition = self.definitions.get(key, None)
+        if definition is None:
+            definition = compile_definition()
+            with self._lock:
+                definition = self.definitions.setdefault(key, definition)
+        return definition
+
+    def on_version_change(self, old_version, new_version):
+        """ Drop definitions compiled for other versions """
+        if new_version in self.INVALID_VERSIONS:
+            return
+        new_version = str(new_version)
+        with self._lock:
+            for key in list(self.definitions):
+                if key[2] != new_version:
+                    del self.definitions[key]
+
+    def clear(self):
+        with self._lock:
+            self.definitions.clear()
+
+
+REGISTRY = LanguageRegistry()
+CacheVersion.subscribe(REGISTRY.on_version_change)
+
 class Language(object):
     """ Language object """
 
@@ -63,23 +127,42 @@ class Language(object):
         return pj(locale, 'language')
 
     @classmethod
-    def from_dict(cls, application, data, safe=True, lazy=True):
-        """ Build language instance from API response """
+    def from_dict(cls, application, data, safe=True, lazy=True, registry_key=None):
+        """ Build language instance from API response
+            Args:
+                application (Application): app instance
+                data (dict): language definition
+                safe (boolean): ignore invalid cases
+                lazy (boolean): compile cases on demand
+                registry_key (tuple): share compiled definition by REGISTRY key
+            Returns:
+                Language
+        """
         data = copy(data)  # shallow copy
-        if lazy:
-            # Use lazy cases (do not compile all)
-            cases = LazyCases(data.pop('cases', {}))
+        contexts_data = data.pop('contexts', {})
+        cases_data = data.pop('cases', {})
+
+        def compile_definition():
+            if lazy:
+                # Use lazy cases (do not compile all)
+                cases = LazyCases(cases_data)
+            else:
+                # Compile all cases:
+                cases, case_errors = Case.from_data(cases_data, safe = True)
+                if len(case_errors) and not safe:
+                    raise Exception('Language contains invalid cases', case_errors)
+            return Contexts.from_dict(contexts_data), cases
+
+        if registry_key is None:
+            contexts, cases = compile_definition()
         else:
-            # Compile all cases:
-            cases, case_errors = Case.from_data(data.pop('cases'), safe = True)
-            if len(case_errors) and not safe:
-                raise Exception('Language contains invalid cases', case_errors)
+            contexts, cases = REGISTRY.fetch(registry_key, compile_definition)
         return cls(application,
                    data.pop('id', None),
                    data.pop('locale', None),
                    data.pop('native_name', None),
                    data.pop('right_to_left', None),
-                   Contexts.from_dict(data.pop('contexts', {})),
+                   contexts,
                    cases,
                    **data)
 
@@ -95,12 +178,27 @@ class Language(object):
             Returns:
                 Language
         """
-        # check is language supported by APP:
-        url = application.get_language_url(locale)
-        # load data by API:
-        data = application.client.get(pj(url, 'definition'), params={}, opts={'cache_key': cls.cache_key(locale)})
+        # check is language supported by APP and load data by API:
+        url, params, opts = cls.query(application, locale)
+        data = application.client.get(url, params=params, opts=opts)
         # create instance:
-        return cls.from_dict(application, data)
+        return cls.from_dict(application, data,
+                             registry_key=REGISTRY.build_key(application, locale))
+
+    @classmethod
+    def query(cls, application, locale):
+        """ API call params for language definition
+            Args:
+                application (Application): app instance
+                locale (string): locale code
+            Throws:
+                application.LanguageIsNotSupported: language is not
+                    supported by APP
+            Returns:
+                tuple: url, params, opts
+        """
+        url = application.get_language_url(locale)
+        return pj(url, 'definition'), {}, {'cache_key': cls.cache_key(locale)}
 
     @classmethod
     def load_default(cls, application, locale):
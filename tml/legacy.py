@@ -100,10 +100,7 @@ def translate(context, label, data, description, options):
             text, key
     """
     translation = fetch(context, label, description)
-    option = translation.fetch_option(data, options)
-    # support %(name)s -> {name}
-    option.label = suggest_label(option.label)
-    return option.apply(data, options)
+    return execute(translation, data, options)
 
 def execute(translation, data, options):
     """ Execute translation in legacy mode
@@ -115,10 +112,8 @@ def execute(translation, data, options):
             string
     """
     option = translation.fetch_option(data, options)
-    # support %(name)s -> {name}
-    option.label = suggest_label(option.label)
-    # apply translation:
-    return option.apply(data, options)
+    # support %(name)s -> {name} (options are shared, do not modify):
+    return option.substitute(suggest_label(option.label), data, options)
 
 
 def fetch(context, legacy_label, description):
@@ -12,13 +12,49 @@ class DecoratorNotInstalled(Error):
     pass
 
 
+# Decorators without application are stateless, so shared:
+shared_decorators = {}
+
+
 def get_decorator(application=None, options=None):
     options = {} if not options else options
     _decorator = CONFIG.decorator_class
     if options.get('decorator', None):
         _decorator = options['decorator']
     try:
-        decorator_klass = installed_decorators.get(_decorator)
+        decorator_klass = installed_decorators[_decorator]
     except KeyError:
         raise DecoratorNotInstalled("install `%s` decorator.", _decorator)
-    return decorator_klass(application)
+    if application is not None:
+        return decorator_klass(application)
+    decorator = shared_decorators.get(decorator_klass, None)
+    if decorator is None:
+        decorator = shared_decorators[decorator_klass] = decorator_klass(None)
+    return decorator
+
+
+def skip_decoration(options=None):
+    """ Skip flag computed once by render entry point, or checked now
+        Args:
+            options (dict): token render options
+        Returns:
+            bool
+    """
+    if options and 'skip_decoration' in options:
+        return options['skip_decoration']
+    return get_decorator().skip_decoration()
+
+
+def with_skip_decoration(options=None, decorator=None):
+    """ Options with skip flag for tokens rendered below
+        Args:
+            options (dict): render options
+            decorator (BaseDecorator): decorator to check (shared by default)
+        Returns:
+            dict
+    """
+    options = {} if options is None else options
+    if 'skip_decoration' in options:
+        return options
+    decorator = get_decorator() if decorator is None else decorator
+    return dict(options, skip_decoration=decorator.skip_decoration())
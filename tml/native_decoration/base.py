@@ -23,6 +23,12 @@ class BaseDecorator(object):
     def is_inline_mode(self):
         return get_current_translator() and get_current_translator().is_inline() or False
 
+    def skip_decoration(self):
+        """ Decorator returns values as is (inline mode is off), so
+            decorate* calls can be skipped
+        """
+        return not self.is_inline_mode()
+
     def enabled(self, options):
         if options.get('nowrap', False):
             return False
@@ -0,0 +1,287 @@
+# encoding: UTF-8
+"""
+# Boot time preload of a release (application, languages and sources)
+#
+# Copyright (c) 2015, Translation Exchange, Inc.
+# Permission is hereby granted, free of charge, to any person obtaining
+# a copy of this software and associated documentation files (the
+# "Software"), to deal in the Software without restriction, including
+# without limitation the rights to use, copy, modify, merge, publish,
+# distribute, sublicense, and/or sell copies of the Software, and to
+# permit persons to whom the Software is furnished to do so, subject to
+# the following conditions:
+#
+# The above copyright notice and this permission notice shall be
+# included in all copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND,
+# EXPRESS OR IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF
+# MERCHANTABILITY, FITNESS FOR A PARTICULAR PURPOSE AND
+# NONINFRINGEMENT. IN NO EVENT SHALL THE AUTHORS OR COPYRIGHT HOLDERS BE
+# LIABLE FOR ANY CLAIM, DAMAGES OR OTHER LIABILITY, WHETHER IN AN ACTION
+# OF CONTRACT, TORT OR OTHERWISE, ARISING FROM, OUT OF OR IN CONNECTION
+# WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE SOFTWARE.
+"""
+from __future__ import absolute_import
+import os
+import sys
+import json
+import time
+import zlib
+from tarfile import TarFile
+from multiprocessing.pool import Pool, ThreadPool
+from .config import CONFIG
+from .exceptions import Error
+from .cache import CachedClient, PRELOADED
+from .application import Application
+from .language import Language
+from .dictionary.source import SourceDictionary
+from .logger import get_logger
+from .utils import pj
+from .api.client import Client
+from .api.snapshot import open_snapshot
+
+try:
+    import resource
+except ImportError:   # not unix
+    resource = None
+
+__author__ = 'xepa4ep'
+
+
+class ReleaseReader(object):
+    """ Reads raw release files by cache key """
+    def read(self, key):
+        """ Raw (may be gzipped) json for key (None if missing) """
+        raise NotImplementedError()
+
+    def sources(self, locale):
+        """ Source names of release """
+        raise NotImplementedError()
+
+    def close(self):
+        pass
+
+    # reader can be used from several threads:
+    thread_safe = True
+
+
+class DirReader(ReleaseReader):
+    """ Extracted release or snapshot: file cache version dir """
+    def __init__(self, path):
+        self.path = path
+
+    def read(self, key):
+        path = pj(self.path, '%s.json' % key)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as fp:
+            return fp.read()
+
+    def sources(self, locale):
+        path = pj(self.path, 'sources.json')
+        if os.path.exists(path):
+            return decode(self.read('sources'))
+        root = pj(self.path, locale, 'sources')
+        ret = []
+        for dirpath, _, filenames in os.walk(root):
+            for filename in filenames:
+                if filename.endswith('.json'):
+                    ret.append(os.path.relpath(pj(dirpath, filename[:-5]), root).replace(os.sep, '/'))
+        return ret
+
+
+class TarReader(ReleaseReader):
+    """ Snapshot .tar.gz """
+    thread_safe = False
+
+    def __init__(self, path):
+        self.file = TarFile.open(path, 'r')
+        self.names = set(self.file.getnames())
+
+    def read(self, key):
+        name = '%s.json' % key
+        if name not in self.names:
+            return None
+        fp = self.file.extractfile(name)
+        try:
+            return fp.read()
+        finally:
+            fp.close()
+
+    def sources(self, locale):
+        if 'sources.json' in self.names:
+            return decode(self.read('sources'))
+        prefix = '%s/sources/' % locale
+        return [name[len(prefix):-5] for name in self.names
+                if name.startswith(prefix) and name.endswith('.json')]
+
+    def close(self):
+        self.file.close()
+
+
+class CDNReader(ReleaseReader):
+    """ Release files from CDN """
+    def __init__(self, client, version):
+        self.client = client
+        self.version = version
+
+    def read(self, key):
+        return self.client.cdn_call(key, opts={'cache_version': self.version, 'raw': True})
+
+    def sources(self, locale):
+        return self.client.cdn_call(
+            'sources', opts={'cache_version': self.version, 'uncompressed': True}) or []
+
+
+class ReleaseNotFound(Error):
+    """ Release to preload is not found """
+    def __init__(self, message):
+        super(ReleaseNotFound, self).__init__(message)
+        self.message = message
+
+    def __str__(self):
+        return self.message
+
+
+def decode(raw):
+    """ Decode (gzipped) json """
+    if raw is None:
+        return None
+    if raw[:2] == b'\x1f\x8b':   # gzip magic
+        raw = zlib.decompress(raw, 16 + zlib.MAX_WBITS)
+    return json.loads(raw.decode('utf-8'))
+
+
+def max_rss():
+    """ Peak resident memory of process in KB (None if unknown) """
+    if resource is None:
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    if sys.platform == 'darwin':   # bytes on macOS, KB on linux
+        rss //= 1024
+    return rss
+
+
+def current_release(cache_dir):
+    """ Version marked as current by download_release (None if not marked) """
+    path = pj(cache_dir, 'current')
+    if not os.path.isdir(path):
+        return None
+    return os.path.basename(os.path.realpath(path))
+
+
+def build_reader(path=None, version=None, client=None):
+    """ Pick release location: snapshot path, file cache or CDN
+        Returns:
+            tuple: reader, version
+    """
+    if path:
+        reader = DirReader(path) if os.path.isdir(path) else TarReader(path)
+        if version is None:
+            try:
+                version = decode(reader.read('snapshot')).get('version', None)
+            except Exception:
+                version = None
+        return reader, version or 'snapshot'
+    if CONFIG.cache_enabled() and CONFIG.cache.get('adapter', None) == 'file':
+        cache_dir = CachedClient.default_dir()
+        version = version or CONFIG.cache.get('version', None) or current_release(cache_dir)
+        if not version:
+            client = client or Client(CONFIG.application_key())
+            version = client.get_cache_version()
+        if version in (None, '0') or not os.path.isdir(pj(cache_dir, str(version))):
+            raise ReleaseNotFound('Release %s is not found in %s (see tml.commands.download_release)'
+                                  % (version, cache_dir))
+        return DirReader(pj(cache_dir, str(version))), version
+    client = client or Client(CONFIG.application_key())
+    version = version or client.get_cache_version()
+    return CDNReader(client, version), version
+
+
+def preload(version=None, locales=None, sources=None, path=None, client=None,
+            workers=4, processes=False):
+    """ Load whole release into process memory
+        Safe to call before fork (e.g. in gunicorn master): worker pool is
+        closed and files are released before return.
+        Args:
+            version (string): release version (current by default)
+            locales (list): locales to load (all application languages)
+            sources (list): sources to load (all release sources)
+            path (string): snapshot dir or .tar.gz (file cache or CDN if None)
+            client (api.client.Client): CDN client
+            workers (int): JSON decode pool size
+            processes (boolean): decode in processes instead of threads
+        Returns:
+            dict: report (timing, size and memory)
+    """
+    logger = get_logger()
+    t0 = time.time()
+    rss0 = max_rss()
+    reader, version = build_reader(path, version, client)
+    pool = Pool(workers) if processes else ThreadPool(workers)
+    read_pool = ThreadPool(workers) if reader.thread_safe and workers > 1 else None
+    try:
+        application = decode(reader.read('application'))
+        if application is None:
+            raise ReleaseNotFound('Release %s has no application' % version)
+        if 'results' in application:
+            application = application['results']
+        if locales is None:
+            locales = [lang['locale'] for lang in application.get('languages', None) or []]
+        keys = [Language.cache_key(locale) for locale in locales]
+        for locale in locales:
+            for source in (sources if sources is not None else reader.sources(locale)):
+                keys.append(SourceDictionary.source_cache_key(source, locale))
+        t1 = time.time()
+        raw = read_pool.map(reader.read, keys) if read_pool else list(map(reader.read, keys))
+        size = sum(len(data or b'') for data in raw)
+        t2 = time.time()
+        decoded = pool.map(decode, raw)
+        del raw
+    finally:
+        for worker_pool in (pool, read_pool):
+            if worker_pool is not None:
+                worker_pool.close()
+                worker_pool.join()
+        reader.close()
+    t3 = time.time()
+    # source listed in sources.json may have no file for some locale:
+    data = dict((key, value) for key, value in zip(keys, decoded)
+                if value is not None)
+    missing = [key for key in keys if key not in data]
+    if missing:
+        logger.debug('Release %s has no files: %s', version, ', '.join(missing))
+    data[Application.cache_key] = application
+    PRELOADED.load(version, data)
+    # build application from preloaded data (compiles languages and sources):
+    if client is None:
+        client = open_snapshot(path) if path else Client(CONFIG.application_key())
+    app = Application.from_dict(client, application)
+    sources_by_locale = {}
+    for key in data:
+        parts = key.split('/')
+        if parts[1:2] == ['sources']:
+            locale_sources = sources_by_locale.setdefault(parts[0], [])
+            locale_sources.append('/'.join(parts[2:]))
+    for locale, names in sources_by_locale.items():
+        app.load_sources(names, locale)
+    PRELOADED.application = app
+    t4 = time.time()
+    rss1 = max_rss()
+    report = {
+        'version': version,
+        'locales': list(locales),
+        'files': len(data),
+        'missing': missing,
+        'bytes': size,
+        'read_seconds': round(t2 - t1, 3),
+        'decode_seconds': round(t3 - t2, 3),
+        'build_seconds': round(t4 - t3, 3),
+        'seconds': round(t4 - t0, 3),
+        'max_rss_kb': rss1,
+        'max_rss_delta_kb': None if rss0 is None else rss1 - rss0}
+    logger.debug("Release %(version)s preloaded: %(files)s files, %(bytes)s bytes in %(seconds)ss "
+                 "(read %(read_seconds)ss, decode %(decode_seconds)ss, build %(build_seconds)ss), "
+                 "max rss %(max_rss_kb)s KB (+%(max_rss_delta_kb)s KB)", report)
+    return report
@@ -25,11 +25,12 @@ from __future__ import absolute_import
 import six
 from argparse import ArgumentError
 from tml.dictionary import TranslationIsNotExists
-from .decoration.parser import parse as decoration_parser
+from .decoration.parser import render as render_decoration, is_decorated
+from .tokenizers import DataTokenizer
 from .tools import Renderable
 from .translation import OptionIsNotFound
 from .tools import BasePreprocessor
-from tml.native_decoration import get_decorator
+from tml.native_decoration import get_decorator, with_skip_decoration
 
 
 class RenderEngine(object):
@@ -50,7 +51,9 @@ class RenderEngine(object):
                 unicode
         """
         # Wrap data:
-        options = {} if options is None else options
+        decorator = self.decorator
+        # checked once, tokens read it from options:
+        options = with_skip_decoration(options, decorator)
         translation_data = self.prepare_data(data)
         try:
             option = translation.fetch_option(translation_data, options)
@@ -58,12 +61,47 @@ class RenderEngine(object):
             translation = self.fallback(e.label, e.description)
             option = translation.fetch_option(translation_data, options)
 
-        trans_value = decoration_parser(option.execute(translation_data, options)).render(translation_data)
+        trans_value = self.render_option(option, translation_data, options)
+        if options['skip_decoration']:
+            return trans_value
         trans_options = option.get_options()
         trans_options.update(options)
-        decorator = get_decorator(self.application)
         return decorator.decorate(trans_value, self.language, self.original_language, translation.key, trans_options)
 
+    _decorator = None
+
+    @property
+    def decorator(self):
+        """ Decorator for context application (built once) """
+        if self._decorator is None:
+            self._decorator = get_decorator(self.application)
+        return self._decorator
+
+    def render_option(self, option, data, options):
+        """ Execute option and render decoration tags
+            Decoration tree is parsed for label before data substitution,
+            so it is parsed once and rendered with data then.
+            Args:
+                option (TranslationOption): option to render
+                data (Data): user data
+                options (dict): transaltion options
+            Returns:
+                unicode
+        """
+        label = option.label   # option is checked by fetch_option
+        if not is_decorated(label):
+            return option.apply(data, options)
+        if self.tokens_contain_decoration(label):
+            # tags inside tokens (like {count|[b]one[/b], many}):
+            return render_decoration(option.apply(data, options), data)
+        return render_decoration(
+            label, data,
+            text_filter=lambda text: option.substitute(text, data, options))
+
+    def tokens_contain_decoration(self, label):
+        return any(is_decorated(token.full_name)
+                   for token in DataTokenizer.compile(label).tokens)
+
     def fallback(self, label, description):
         raise NotImplemented('Fallback is not implemented for context')
 
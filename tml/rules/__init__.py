@@ -25,11 +25,11 @@
 __author__ = 'a@toukmanov.ru'
 
 from .engine import RulesEngine, Error as EngineError
-from .functions import SUPPORTED_FUNCTIONS
+from .functions import SUPPORTED_FUNCTIONS, FUNCTION_COMPILERS
 from .parser import parse
 
 
-DEFAULT_ENGINE = RulesEngine(SUPPORTED_FUNCTIONS) # default engine
+DEFAULT_ENGINE = RulesEngine(SUPPORTED_FUNCTIONS, FUNCTION_COMPILERS) # default engine
 
 
 class ContextRules(object):
@@ -44,14 +44,37 @@ class ContextRules(object):
         self.default = default
         self.engine = engine if engine else DEFAULT_ENGINE
 
+    @property
+    def default(self):
+        return self._default
+
+    @default.setter
+    def default(self, default):
+        self._default = default
+        self._compiled = None
+
+    @property
+    def compiled(self):
+        """ Rules compiled by engine (once)
+            Returns:
+                tuple: ((conditions_fn, operations_fn, conditions, operations)[], default_fn)
+        """
+        if self._compiled is None:
+            compile = self.engine.compile
+            choices = tuple((compile(conditions), compile(operations), conditions, operations)
+                            for conditions, operations in self.choices)
+            self._compiled = (choices, compile(self.default))
+        return self._compiled
+
     def apply(self, data):
         """ Apply rule for data """
-        for conditions, operations in self.choices:
-            if (self.engine.execute(conditions, data)):
+        choices, default = self.compiled
+        for conditions, operations, _, _ in choices:
+            if conditions(data):
                 # if data is under conditions execute operations:
-                return self.engine.execute(operations, data)
+                return operations(data)
         # Defalt:
-        return self.engine.execute(self.default, data)
+        return default(data)
 
     @classmethod
     def from_rules(cls, rules, default = None):
@@ -73,4 +96,5 @@ class ContextRules(object):
 
     def _append(self, condition, operation):
         self.choices.append((parse(condition), parse(operation)))
+        self._compiled = None
 
@@ -28,13 +28,13 @@ from .contexts import Gender, Value
 from . import ContextRules
 from _ctypes import ArgumentError
 from .parser import parse
-from tml.native_decoration import get_decorator
+from tml.native_decoration import get_decorator, skip_decoration
 
 
 class Case(ContextRules):
     """ Language case """
 
-    def execute(self, value):
+    def execute(self, value, options=None):
         """ Execute case for value """
         data = {'value': Value.match(value)}
         try:
@@ -43,20 +43,28 @@ class Case(ContextRules):
         except ArgumentError:
             # Undefined gender:
             data['gender'] = Gender.OTHER
-        conditions, operations = self.find_matching_rule(data)
-        if conditions is False:
+        rule = self.match_rule(data)
+        if rule is None:
             return data['value']
-        transformed_value = self.engine.execute(operations, data)
-        decorator = get_decorator()
-        return decorator.decorate_language_case(
+        _, execute_operations, conditions, operations = rule
+        transformed_value = execute_operations(data)
+        if skip_decoration(options):
+            return transformed_value
+        return get_decorator().decorate_language_case(
             self, (conditions, operations), value, transformed_value, options={})
 
+    def match_rule(self, data):
+        """ First compiled rule which conditions match data (or None) """
+        for rule in self.compiled[0]:
+            if rule[0](data):
+                return rule
+        return None
 
     def find_matching_rule(self, data):
-        for conditions, operations in self.choices:
-            if (self.engine.execute(conditions, data)):
-                return (conditions, operations)
-        return False, None
+        rule = self.match_rule(data)
+        if rule is None:
+            return False, None
+        return (rule[2], rule[3])
 
 
     @classmethod
@@ -99,7 +107,7 @@ class DummyCase(Case):
             choices=[], default=['quote', '@value'], engine=engine)
 
     def execute(self, value):
-        return self.engine.execute(self.default, {'value': value})
+        return self.compiled[1]({'value': value})
 
 
 class LazyCases(object):
@@ -212,7 +212,7 @@ class Context(object):
 
 class Contexts(object):
     """ List of contexts """
-    def __init__(self, contexts, index = {}):
+    def __init__(self, contexts, index = None):
         """ .ctor
             Args:
                 contexts (Context[])
@@ -223,7 +223,9 @@ class Contexts(object):
             raise ArgumentError('Contexts list contains not context object',
                                 contexts)
         self.contexts = contexts
-        self.index = index
+        self.index = {} if index is None else index
+        # token name -> context (None if not found), built lazily:
+        self.token_index = {}
 
 
     def execute(self, token_options, value, options=None):
@@ -286,12 +288,15 @@ class Contexts(object):
 
     def find_by_token_name(self, token):
         """Find context by token using regex matching rules"""
-        search_iter = (context for context in
-                       self.contexts if context.applies_to_token(token))
         try:
-            return next(search_iter)
-        except StopIteration:
+            context = self.token_index[token]
+        except KeyError:
+            search_iter = (context for context in
+                           self.contexts if context.applies_to_token(token))
+            context = self.token_index[token] = next(search_iter, None)
+        if context is None:
             raise ContextNotFound(token, self)
+        return context
 
     @classmethod
     def from_dict(cls, config):
@@ -26,14 +26,21 @@ __author__ = ''
 
 from ..exceptions import Error as BaseError
 
+# Placeholder for not literal argument passed to function compiler:
+VARIABLE = object()
+
+
 class RulesEngine(object):
     """ Rules execution engine """
-    def __init__(self, functions):
+    def __init__(self, functions, compilers = None):
         """ .ctor
             Args:
                 functions (dict{function}): supported functions
+                compilers (dict): key - function, value - factory which
+                    builds function for literal arguments (or returns None)
         """
         self.functions = functions
+        self.compilers = compilers if compilers else {}
 
 
     def execute(self, rule, data):
@@ -75,6 +82,87 @@ class RulesEngine(object):
         except Exception as func_error:
             raise FunctionCallFault(func_error, rule, data)
 
+    def compile(self, rule):
+        """ Compile rule into closure, functions and constant arguments
+            are resolved once
+            Args:
+                rule (list): rule [fn_name, arg1, arg2, ...]
+            Returns:
+                function: fn(data) with the same result as execute(rule, data)
+        """
+        try:
+            func = self.functions[rule[0]]
+        except KeyError:
+            def function_does_not_exists(data):
+                raise FunctionDoesNotExists(rule, data, 0)
+            return function_does_not_exists
+        getters = []
+        constant = True
+        for part_number, arg in enumerate(rule[1:], 1):
+            if type(arg) is list:
+                getters.append(self._compile_inner(arg, rule, part_number))
+                constant = False
+            elif arg[0] == '@':
+                getters.append(self._compile_argument(arg, rule, part_number))
+                constant = False
+            else:
+                getters.append(arg)
+        func = self._compile_function(func, getters)
+        if constant:
+            args = tuple(getters)
+            def execute_constant(data):
+                try:
+                    return func(*args)
+                except Exception as func_error:
+                    raise FunctionCallFault(func_error, rule, data)
+            return execute_constant
+
+        getters = [getter if callable(getter) else self._compile_constant(getter)
+                   for getter in getters]
+        def execute(data):
+            args = [getter(data) for getter in getters]
+            try:
+                return func(*args)
+            except Exception as func_error:
+                raise FunctionCallFault(func_error, rule, data)
+        return execute
+
+    def _compile_function(self, func, args):
+        """ Specialize function for literal args (regexps, sets etc.) """
+        compiler = self.compilers.get(func, None)
+        if compiler is None:
+            return func
+        try:
+            compiled = compiler(*[VARIABLE if callable(arg) else arg for arg in args])
+        except Exception:
+            # invalid literal: fault on call like interpreter does
+            return func
+        return func if compiled is None else compiled
+
+    def _compile_inner(self, expression, rule, part_number):
+        """ inner rule expressions (mod ^(sum @n 5) 10) """
+        inner = self.compile(expression)
+        def execute_inner(data):
+            try:
+                return inner(data)
+            except Error as error:
+                raise InnerExpressionCallFault(error, rule, data, part_number)
+        return execute_inner
+
+    def _compile_argument(self, arg, rule, part_number):
+        """ data value (mod ^@n 10) """
+        name = arg[1:]
+        def fetch_argument(data):
+            try:
+                return data[name]
+            except KeyError:
+                raise ArgumentDoesNotExists(arg, rule, data, part_number)
+        return fetch_argument
+
+    def _compile_constant(self, arg):
+        """ text arg (mod @n ^10) """
+        return lambda data: arg
+
 
 class Error(BaseError):
     """ Base error """
@@ -29,6 +29,7 @@ import re
 from _ctypes import ArgumentError
 from datetime import date
 from tml.strings import to_string
+from .engine import VARIABLE
 
 
 INT_REGEXP = '(0|[1-9]\d*)'
@@ -211,6 +212,82 @@ def f_replace(search, replace, subject):
     return to_string(ret)
 
 
+def compile_match(pattern, string, flags = None):
+    """ f_match with literal pattern (and flags) """
+    if pattern is VARIABLE or flags is VARIABLE:
+        return None
+    regexp = build_regexp(pattern, flags)
+    def f_match_compiled(pattern, string, flags = None):
+        if regexp.search(to_string(string)):
+            return True
+        return False
+    return f_match_compiled
+
+
+def compile_replace(search, replace, subject):
+    """ f_replace with literal search regexp """
+    if search is VARIABLE:
+        return None
+    regexp = build_regexp(search)
+    def f_replace_compiled(search, replace, subject):
+        return to_string(regexp.sub(replace, subject))
+    return f_replace_compiled
+
+
+def compile_in(set, find):
+    """ in_f with literal set: elements are parsed once
+        ranges are checked after plain values like in_f does
+    """
+    if set is VARIABLE:
+        return None
+    leading = []   # values before first range (compared without to_int)
+    values = []
+    ranges = []
+    for e in set.split(','):
+        e = to_string(e.strip())
+        if IS_RANGE.match(e):
+            ranges.append(to_range(e))
+        else:
+            (values if ranges else leading).append(e)
+    leading = frozenset(leading)
+    values = frozenset(values) | leading
+    ranges = tuple(sorted(ranges))
+    def in_f_compiled(set, find):
+        find = to_string(find).strip()
+        if find in leading:
+            return True
+        if not ranges:
+            return False
+        value = to_int(find)   # raises as in_f for first range
+        if find in values:
+            return True
+        for min_value, max_value in ranges:
+            if min_value <= value <= max_value:
+                return True
+        return False
+    return in_f_compiled
+
+
+def compile_within(value, range):
+    """ within_f with literal range """
+    if range is VARIABLE:
+        return None
+    (min_value, max_value) = to_range(range)
+    def within_f_compiled(value, range):
+        value = to_int(value)
+        return min_value <= value <= max_value
+    return within_f_compiled
+
+
+# Compilers for functions with literal arguments (see RulesEngine.compile):
+FUNCTION_COMPILERS = {
+    f_match: compile_match,
+    f_replace: compile_replace,
+    in_f: compile_in,
+    within_f: compile_within
+}
+
+
 SUPPORTED_FUNCTIONS = {
     # McCarthy's Elementary S-functions and Predicates
     'quote': lambda expr: expr,
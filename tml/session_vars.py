@@ -7,7 +7,9 @@ def set_variable(key, val):
     setattr(_threadlocals, key, val)
 
 def get_variable(key, default=None):
-    return getattr(_threadlocals, key, default)
+    # __dict__ of thread local is dict of current thread, lookup in it
+    # is cheaper than getattr with default (no AttributeError for unset)
+    return _threadlocals.__dict__.get(key, default)
 
 def get_current_context():
     return get_variable('context', None)
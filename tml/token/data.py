@@ -9,7 +9,7 @@ from ..strings import to_string
 from .. import utils
 from ..logger import LoggerMixin
 from ..config import CONFIG
-from tml.native_decoration import get_decorator
+from tml.native_decoration import get_decorator, skip_decoration
 
 __author__ = 'xepa4ep'
 
@@ -85,6 +85,8 @@ class DataToken(LoggerMixin):
     EXPRESSION = re.compile(
         r'(%?\{{1,2}\s*\w+\s*(:\s*\w+)*\s*(::\s*\w+)*\s*\}{1,2})'
     )
+    CASE_KEYS = re.compile(r"(::\w+)")
+    CONTEXT_KEYS = re.compile(r"(:\w+)")
 
     @classmethod
     def parse(cls, label, options=None):
@@ -133,11 +135,11 @@ class DataToken(LoggerMixin):
 
     def parse_cases(self, text):
         return list(case_key.lstrip('::') for case_key
-                    in re.compile(r"(::\w+)").findall(text))
+                    in self.CASE_KEYS.findall(text))
 
     def parse_context_keys(self, text):
         return list(key.lstrip(':') for key
-                    in re.compile(r"(:\w+)").findall(text))
+                    in self.CONTEXT_KEYS.findall(text))
 
 
     ##############################################################################
@@ -238,7 +240,8 @@ class DataToken(LoggerMixin):
                     element = self.sanitize(value, obj, language, utils.merge_opts(options, safe=False))
             else:  # use object by default (may be it just string)
                 element = obj
-            decorator = get_decorator()
+            if skip:
+                return element
             return decorator.decorate_element(element, options)
 
         def build_str(limit, sep, joiner):
@@ -248,6 +251,8 @@ class DataToken(LoggerMixin):
             builder.append(values[limit])
             return to_string(" ").join(builder)
 
+        decorator = get_decorator()
+        skip = skip_decoration(options)
         values = list(map(render_element, objects))   # in py3 map returns iterator
         if len(objects) == 1:
             return values[0]
@@ -300,7 +305,7 @@ class DataToken(LoggerMixin):
     def apply_case(self, case_key, value, obj, language, options=None):
         options = {} if options is None else options
         lcase = language.case_by_keyword(case_key)
-        return lcase and lcase.execute(value) or value
+        return lcase and lcase.execute(value, options) or value
 
     # evaluate all possible methods for the token value and return sanitized result
     def token_value(self, obj, language, options=None):
@@ -320,27 +325,44 @@ class DataToken(LoggerMixin):
 
     def substitute(self, label, context, language, options=None):
         label = to_string(label)
+        return label.replace(self.full_name,
+                             self.substitution(context, language, options))
+
+    def substitution(self, context, language, options=None):
+        """ Value to put in place of token
+            Args:
+                context (dict): token values
+                language (Language): language
+                options (dict): options
+            Returns:
+                string: substituted value, token text itself on error
+        """
         try:
-            return self._substitute(label, context, language, options)
+            return self._substitution(context, language, options)
         except Error as e:
             self.exception(e)
             CONFIG.handle_exception(e)
-            return label
+            return self.full_name
 
     def _substitute(self, label, context, language, options):
+        return label.replace(self.full_name,
+                             self._substitution(context, language, options))
+
+    def _substitution(self, context, language, options):
         options = {} if options is None else options
         obj = context.get(self.key, None)
         if obj is None and not self.key in context:
             self.error('Missing value for `%s` in `%s`', self.full_name, self.label)
         if obj is None:
-            return label.replace(self.full_name, '')
+            return ''
         value = self.token_value(obj, language, options)
-        return label.replace(self.full_name, self.decorate(value, options))
+        return self.decorate(value, options)
 
     def decorate(self, value, options=None):
         options = {} if options is None else options
-        decorator = get_decorator()
-        return decorator.decorate_token(self, value, options)
+        if skip_decoration(options):
+            return value
+        return get_decorator().decorate_token(self, value, options)
 
     @classmethod
     def token_object(cls, token_values, token_name):
@@ -26,6 +26,7 @@ from __future__ import absolute_import
 import re
 import string
 from .data import DataToken, Error
+from ..native_decoration import skip_decoration
 from .. import utils
 from ..strings import to_string
 
@@ -67,21 +68,22 @@ class TransformToken(DataToken):
     def is_implied(self):
         return not self.token_value_displayed()
 
-    def _substitute(self, label, context, language, options=None):
-        options = {} if options is None else {}
+    def _substitution(self, context, language, options=None):
+        # caller options are not applied, only decoration flag is passed:
+        options = {'skip_decoration': skip_decoration(options)}
         obj = self.token_object(context, self.key)
         language_context = None
         if not obj:
-            self.error("Missing value for a token `%s` in `%s`\"", self.key, label)
+            self.error("Missing value for a token `%s` in `%s`\"", self.key, self.label)
         if not self.piped_params:
-            self.error("Piped params may not be empty for token %s in %s", self.key, label)
+            self.error("Piped params may not be empty for token %s in %s", self.key, self.label)
         try:
             language_context = self.context_for_language(language)
         except:   # language context is absent, try to guess
             language_context = None
         value = language.contexts.execute(self.piped_params, obj, utils.merge_opts({}, language_context=language_context)).strip()
         if not value:
-            return label
+            return self.full_name
         cases = self.parse_cases(value)   # message::plural => messages
         if cases:
             value = self._apply_language_cases(cases, value.split('::')[0], obj, language, options)
@@ -98,4 +100,4 @@ class TransformToken(DataToken):
         else:  # not include value: overwrite value with decorated one
             value = value.replace('#{}'.format(self.short_name), decorated_value)
         subst_value.append(value)
-        return label.replace(self.full_name, ''.join(subst_value))
+        return ''.join(subst_value)
@@ -1,10 +1,93 @@
 from __future__ import absolute_import
 # encoding: UTF-8
+from operator import itemgetter
+from six import string_types
 from ..token import SUPPORTED_TOKENS
+from ..utils import LRUCache
 
 __author__ = 'xepa4ep'
 
 
+# Process wide cache: label text -> compiled label (tokens are stateless, so
+# they are shared between tokenizers):
+COMPILED_LABELS_SIZE = 10000
+
+
+class CompiledLabel(object):
+    """ Label split once into literal and token segments """
+
+    def __init__(self, text, tokens, segments):
+        """ .ctor
+            Args:
+                text (string): label
+                tokens (tuple): unique token objects
+                segments (tuple): literal strings and tokens in label order
+        """
+        self.text = text
+        self.tokens = tokens
+        self.segments = segments
+
+    @classmethod
+    def compile(cls, text, token_classes):
+        """ Split text into segments
+            Args:
+                text (string): label
+                token_classes (tuple): supported token classes
+            Returns:
+                CompiledLabel
+        """
+        tokens = {}
+        spans = []
+        for token_class in token_classes:
+            for match in token_class.EXPRESSION.finditer(text):
+                full_name = match.group(0)
+                token = tokens.get(full_name, None)
+                if token is None:
+                    token = tokens[full_name] = token_class(text, full_name)
+                spans.append((match.start(), match.end(), token))
+        spans.sort(key=itemgetter(0))
+        segments = []
+        pos = 0
+        for start, end, token in spans:
+            if start < pos:   # overlaps with previous token
+                continue
+            if start > pos:
+                segments.append(text[pos:start])
+            segments.append(token)
+            pos = end
+        if pos < len(text):
+            segments.append(text[pos:])
+        return cls(text, tuple(tokens.values()), tuple(segments))
+
+    def render(self, context, language, options, token_allowed):
+        """ Substitute all tokens in one pass
+            Args:
+                context (dict): token values
+                language (Language): language
+                options (dict): options
+                token_allowed (function): check is token allowed
+            Returns:
+                string
+        """
+        if not self.tokens:
+            return self.text
+        values = {}
+        ret = []
+        for segment in self.segments:
+            if isinstance(segment, string_types):   # literal
+                ret.append(segment)
+                continue
+            value = values.get(segment.full_name, None)
+            if value is None:
+                if token_allowed(segment):
+                    value = segment.substitution(context, language, options)
+                else:
+                    value = segment.full_name
+                values[segment.full_name] = value
+            ret.append(value)
+        return ''.join(ret)
+
+
 class DataTokenizer(object):
 
     text = None
@@ -14,6 +97,8 @@ class DataTokenizer(object):
 
     SUPPORTED_TOKENS = SUPPORTED_TOKENS
 
+    compiled_labels = LRUCache(COMPILED_LABELS_SIZE)
+
     def __init__(self, text, context=None, options=None):
         self.text = text
         self.context = context if context is not None else {}
@@ -21,11 +106,23 @@ class DataTokenizer(object):
         self.tokens = []
         self.tokenize()
 
+    @classmethod
+    def compile(cls, text):
+        """ Compiled label, text is tokenized once per process
+            Args:
+                text (string): label
+            Returns:
+                CompiledLabel
+        """
+        compiled = cls.compiled_labels.get(text)
+        if compiled is None:
+            compiled = cls.compiled_labels.set(
+                text, CompiledLabel.compile(text, cls.SUPPORTED_TOKENS))
+        return compiled
+
     def tokenize(self):
-        ret = set()
-        for token_class in DataTokenizer.SUPPORTED_TOKENS:
-            ret |= set(token_class.parse(self.text))   # just unique
-        self.tokens = list(ret)
+        self.compiled = self.compile(self.text)
+        self.tokens = list(self.compiled.tokens)
         return self.tokens   # for testing reasons
 
     def token_allowed(self, token):
@@ -35,9 +132,5 @@ class DataTokenizer(object):
 
     def substitute(self, language, options=None):
         options = options if options is not None else {}
-        label = self.text
-        for token in self.tokens:
-            if not self.token_allowed(token):
-                continue
-            label = token.substitute(label, self.context, language, options)
-        return label
+        return self.compiled.render(self.context, language, options,
+                                    self.token_allowed)
@@ -7,13 +7,29 @@ from .context import Context
 from ..exceptions import Error
 from ..strings import to_string
 from ..exceptions import RequiredArgumentIsNotPassed
+from ..utils import LRUCache
+from ..native_decoration import with_skip_decoration
 import six
 
 
+GENERATED_KEYS_SIZE = 50000
+generated_keys = LRUCache(GENERATED_KEYS_SIZE)   # (label, description) -> hash
+
+
+def hash_key(label, description=''):
+    """ md5 of label and description """
+    key = six.u('%s;;;%s') % (to_string(label), to_string(description))
+    return md5(key.encode('utf-8')).hexdigest()
+
+
 def generate_key(label, description=''):
     """Generates unique hash key for the translation key using label and description"""
-    key = six.u('%s;;;%s') % (to_string(label), to_string(description))
-    ret = md5(key.encode('utf-8')).hexdigest()
+    try:
+        ret = generated_keys.get((label, description))
+    except TypeError:   # unhashable label
+        return hash_key(label, description)
+    if ret is None:
+        ret = generated_keys.set((label, description), hash_key(label, description))
     return ret
 
 
@@ -52,6 +68,19 @@ class Key(object):
     def client(self):
         return self.language.client
 
+    @classmethod
+    def from_hash(cls, key, language, label, description='', level=0):
+        """ Build key with known hash (skip hashing)
+            Args:
+                key (string): hash of label and description
+                language (Language): language instance
+                label (string): text to be translated
+                description (string): description
+            Returns:
+                Key
+        """
+        return cls(language, label, description, level=level, key=key)
+
     def build_key(self, key=None):
         if key is None:
             return generate_key(self.label, description=self.description or '')
@@ -75,10 +104,31 @@ class TranslationOption(Context):
         """
         super(TranslationOption, self).__init__(context)
         self.label = label
-        self.language = language
         self.options = options
-        if 'locale' in options and options['locale'] != language.locale:
-            self.language = self.application.language(options['locale'])
+        if language is not None:
+            language = self.option_language(language)
+        self.language = language
+
+    def option_language(self, language):
+        """ Language of option: translation language or `locale` option """
+        locale = self.options.get('locale', None)
+        if locale is not None and locale != language.locale:
+            return language.application.language(locale)
+        return language
+
+    def bind(self, language):
+        """ Copy of option compiled without language (shared template)
+            Args:
+                language (Language): translation language
+            Returns:
+                TranslationOption
+        """
+        option = object.__new__(self.__class__)
+        option.__dict__.update(self.__dict__)
+        if 'locale' in self.options:
+            language = option.option_language(language)
+        option.language = language
+        return option
 
     @property
     def application(self):
@@ -110,11 +160,16 @@ class TranslationOption(Context):
     def apply(self, data, options = {}):
         return execute_all(self.label, data, self.language, options)
 
+    def substitute(self, text, data, options = None):
+        """ Substitute tokens in part of label (e.g. decoration tag text) """
+        return execute_all(text, data, self.language, options)
+
     def get_options(self):
         return copy(self.options)
 
     def set_options(self, opts):
-        self.options.update(copy(opts))
+        # new dict: options may be shared with template
+        self.options = dict(self.options, **copy(opts))
 
 class Translation(object):
     """ Translation instance """
@@ -122,6 +177,7 @@ class Translation(object):
         """ .ctor
             key (Key): translation key
             options (TranslationOption[]): list of translation options
+                (templates without language are bound to key language)
         """
         self.key = key
         self.options = options
@@ -138,28 +194,64 @@ class Translation(object):
             Returns:
                 Translation
         """
+        return cls(key, cls.compile_options(key.language, data))
+
+    @classmethod
+    def compile_options(cls, language, data):
+        """ Build translation options from API response
+            Args:
+                language (Language): translation language
+                data (dict[]): list of options
+            Returns:
+                tuple: TranslationOption[]
+        """
+        return tuple(option.bind(language)
+                     for option in cls.compile_templates(data))
+
+    @classmethod
+    def compile_templates(cls, data):
+        """ Build options without language, bound to language by
+            TranslationOption.bind (so they can be shared between applications)
+            Args:
+                data (dict[]): list of options
+            Returns:
+                tuple: TranslationOption[]
+        """
         options = []
         for option in data:
             cur_option = copy(option)
             context = cur_option.pop('context') if 'context' in cur_option else {}
             label = cur_option.pop('label')
-            language = key.language
-            options.append(TranslationOption(label=label, context=context, language=language, **cur_option))
-        return cls(key, options)
+            options.append(TranslationOption(
+                label=label, context=context, language=None, **cur_option))
+        return tuple(options)
 
     def fetch_option(self, data, options):
+        """ First option supported by data
+            Args:
+                data (dict): user data
+                options (dict): execution options
+            Raises:
+                OptionIsNotFound
+            Returns:
+                TranslationOption
+        """
+        results = {}   # token context options evaluated for data
+        language = self.key.language
         for option in self.options:
-            try:
-                return option.check(data, options)
-            except OptionIsNotSupported:
-                pass
-            except RequiredArgumentIsNotPassed:
-                pass
+            if option.language is None and 'locale' in option.options:
+                option = option.bind(language)
+            option_language = option.language or language
+            if option.matches(data, options, option_language, results):
+                if option.language is None:   # template: bind selected only
+                    option = option.bind(language)
+                return option
         raise OptionIsNotFound(self.key)
 
     def execute(self, data, options):
         """ Execute translation """
-        return self.fetch_option(data, options).execute(data, options)
+        options = with_skip_decoration(options)
+        return self.fetch_option(data, options).apply(data, options)
 
     def __len__(self):
         """ Translation length """
@@ -5,6 +5,10 @@ from ..exceptions import RequiredArgumentIsNotPassed
 from ..token.data import DataToken
 
 
+NOT_EVALUATED = object()
+MISSING = object()   # token value is not passed
+
+
 class Context(object):
     """ Tranlation context: rules to check is translation good for data """
     def __init__(self, rules):
@@ -13,6 +17,9 @@ class Context(object):
                 rules (dict): list of rules key - variable name, value - expected
         """
         self.rules = rules
+        # (variable name, context code, expected option) in check order:
+        self.conditions = tuple((key, type_code, rules[key][type_code])
+                                for key in rules for type_code in rules[key])
 
 
     def check(self, data, options, language):
@@ -37,3 +44,30 @@ class Context(object):
                     return False
         return True
 
+    def matches(self, data, options, language, results):
+        """ Check is data supported by context without raising for missed
+            tokens, each (token, context) pair is evaluated once
+            Args:
+                data (dict): input data
+                options (dict): tranlation options
+                language (Language): language
+                results (dict): evaluated pairs, shared between options
+            Returns:
+                boolean
+        """
+        for key, type_code, expected in self.conditions:
+            pair = (key, type_code, language.locale)
+            actual = results.get(pair, NOT_EVALUATED)
+            if actual is NOT_EVALUATED:
+                actual = results[pair] = self.evaluate(data, key, type_code, language)
+            if actual is MISSING or expected != actual:
+                return False
+        return True
+
+    @classmethod
+    def evaluate(cls, data, key, type_code, language):
+        """ Context option for token value (MISSING if value is not passed) """
+        value = DataToken.token_object(data, key)
+        if not value:
+            return MISSING
+        return language.contexts.find_by_code(type_code).option(value)
@@ -6,6 +6,9 @@ import functools
 import json
 import gzip
 import tarfile
+import threading
+from collections import OrderedDict
+from sys import getsizeof
 from six.moves.urllib import parse
 from copy import copy
 from codecs import open
@@ -170,6 +173,116 @@ class cached_property(object):
         return res
 
 
+MOVE_TO_END = hasattr(OrderedDict, 'move_to_end')   # py3 only
+
+
+class LRUCache(object):
+    """ Thread safe size-bounded mapping with least-recently-used eviction.
+        Keeps hit/miss/eviction counters, see `stats`.
+    """
+    def __init__(self, maxsize=1024, maxbytes=None, sizeof=None):
+        """ .ctor
+            Args:
+                maxsize (int): max number of entries (None - unbounded)
+                maxbytes (int): max total size of values (None - unbounded)
+                sizeof (function): estimates value size in bytes
+        """
+        self.maxsize = maxsize
+        self.maxbytes = maxbytes
+        self.sizeof = sizeof
+        self.bytes = 0
+        self._data = OrderedDict()
+        self._sizes = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            # move to the end: most recently used
+            if MOVE_TO_END:
+                self._data.move_to_end(key)
+            else:
+                del self._data[key]
+                self._data[key] = value
+            self.hits += 1
+            return value
+
+    def set(self, key, value):
+        with self._lock:
+            self._remove(key)
+            self._data[key] = value
+            if self.sizeof is not None:
+                self._sizes[key] = size = self.sizeof(value)
+                self.bytes += size
+            while self._data and self._overflow():
+                self._remove(next(iter(self._data)))
+                self.evictions += 1
+        return value
+
+    def pop(self, key, default=None):
+        with self._lock:
+            return self._remove(key, default)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self.bytes = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def _overflow(self):
+        if self.maxsize is not None and len(self._data) > self.maxsize:
+            return True
+        return self.maxbytes is not None and self.bytes > self.maxbytes
+
+    def _remove(self, key, default=None):
+        self.bytes -= self._sizes.pop(key, 0)
+        return self._data.pop(key, default)
+
+    def __contains__(self, key):
+        return key in self._data
+
+    def __len__(self):
+        return len(self._data)
+
+    @property
+    def stats(self):
+        return {'size': len(self._data),
+                'maxsize': self.maxsize,
+                'bytes': self.bytes,
+                'maxbytes': self.maxbytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions}
+
+
+def approx_size(data):
+    """ Approximate memory used by decoded JSON data
+        Args:
+            data: dict, list or scalar
+        Returns:
+            int: bytes
+    """
+    size = 0
+    stack = [data]
+    while stack:
+        item = stack.pop()
+        size += getsizeof(item)
+        if isinstance(item, dict):
+            stack.extend(item.keys())
+            stack.extend(item.values())
+        elif isinstance(item, (list, tuple)):
+            stack.extend(item)
+    return size
+
+
 class chdir(object):
     """
     Step into a directory temporarily.
@@ -298,6 +298,11 @@ class BaseTranslation(LoggerMixin):
         options = options or {}
         return self.context.tr(label, data, description, options)
 
+    def tr_many(self, items, data=None, description='', options=None):
+        return self.context.tr_many(items, data, description, options)
+
+    tr_batch = tr_many
+
     def tr_legacy(self, legacy_label, data=None, description='', options=None):
         return self.context.tr_legacy(legacy_label, data=data, description=description, options=options)
 